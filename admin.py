@@ -1,22 +1,35 @@
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import Session, select
+
 from auth import hash_password
+from config.settings import settings
 from database.connection import SessionLocal
 from models.users import User
-from sqlmodel import Session, select
 
 
-# 관리자 계정 생성
-def create_admin_user():
+# 관리자 계정 생성 (이미 있으면 아무것도 하지 않음)
+# 존재 여부는 id 한 건만 조회하고, bcrypt 해싱은 실제로 생성할 때만 수행
+def create_admin_user() -> bool:
     session: Session = SessionLocal()
-    search_admin = session.exec(select(User).where(User.role == "Y")).first()
+    try:
+        search_admin = session.exec(select(User.id).where(User.role == "Y").limit(1)).first()
+        if search_admin is not None:
+            return False
 
-    hasher = hash_password.HashPassword()
-    if not search_admin:
+        hasher = hash_password.HashPassword()
         admin_user = User(
             username="admin",
-            email="admin@test.com",
-            password=hasher.hash_password("1234"),
+            email=settings.admin_email,
+            password=hasher.hash_password(settings.admin_password),
             role="Y",
         )
         session.add(admin_user)
-        session.commit()
-        session.refresh(admin_user)
\ No newline at end of file
+        try:
+            session.commit()
+        except IntegrityError:
+            # 다른 인스턴스가 동시에 먼저 생성한 경우
+            session.rollback()
+            return False
+        return True
+    finally:
+        session.close()
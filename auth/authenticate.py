@@ -1,6 +1,10 @@
-from fastapi import Depends, HTTPException, status
+import hmac
+from typing import Optional
+
+from fastapi import Depends, Header, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from auth.jwt_handler import verify_jwt_token
+from config.settings import settings
 
 # 요청이 들어올 때 Authorization 헤더의 토큰 값을 추출
 
@@ -18,4 +22,17 @@ async def authenticate(token: str = Depends(oauth2_scheme)):
        
     
     payload = verify_jwt_token(token)
-    return payload["user_id"]
\ No newline at end of file
+    return payload["user_id"]
+
+# 운영 모니터링용 내부 엔드포인트 인증 (Prometheus 등 수집기는 JWT 대신 고정 토큰 사용)
+# INTERNAL_TOKEN 이 없으면 엔드포인트 자체를 숨김 (404)
+async def verify_internal_token(Authorization: Optional[str] = Header(None)) -> None:
+    if not settings.internal_token:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+    token = (Authorization or "").removeprefix("Bearer ")
+    if not hmac.compare_digest(token.encode(), settings.internal_token.encode()):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="내부 토큰이 올바르지 않습니다.",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
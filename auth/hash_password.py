@@ -1,5 +1,17 @@
 # passlib의 CryptContext는 여러 암호화 알고리즘을 관리하고 사용할 수 있게 해주는 클래스입니다
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Tuple
+
 from passlib.context import CryptContext
+from config.settings import settings
+
+# bcrypt 연산 전용 스레드 풀 (bcrypt는 연산 중 GIL을 해제하므로 코어 수만큼 병렬 처리 가능)
+# 크기를 제한해 로그인 폭주 시에도 다른 요청이 사용할 스레드가 남도록 함
+_hash_executor = ThreadPoolExecutor(
+    max_workers=settings.password_hash_workers,
+    thread_name_prefix="password-hash",
+)
 
 # 비밀번호 해싱과 검증 기능을 제공하는 클래스 정의
 class HashPassword:
@@ -14,4 +26,21 @@ class HashPassword:
 
     # 사용자가 입력한 평문 비밀번호와 저장된 해시된 비밀번호가 일치하는지 검증
     def verify_password(self, plain_password: str, hashed_password: str):
-        return self.pwd_context.verify(plain_password, hashed_password)
\ No newline at end of file
+        return self.pwd_context.verify(plain_password, hashed_password)
+
+    # 검증과 동시에 해시 갱신 필요 여부 확인 (일치하지 않으면 (False, None), 갱신 불필요 시 (True, None))
+    def verify_and_update(self, plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+        return self.pwd_context.verify_and_update(plain_password, hashed_password)
+
+    # --- 비동기 API: 이벤트 루프를 막지 않도록 해싱 전용 스레드 풀에서 실행 ---
+    async def hash_password_async(self, password: str) -> str:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_hash_executor, self.hash_password, password)
+
+    async def verify_password_async(self, plain_password: str, hashed_password: str) -> bool:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_hash_executor, self.verify_password, plain_password, hashed_password)
+
+    async def verify_and_update_async(self, plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_hash_executor, self.verify_and_update, plain_password, hashed_password)
@@ -1,5 +1,13 @@
+import asyncio
+import hashlib
+import hmac
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import List, Optional
+
 from passlib.context import CryptContext
-from cryptography.fernet import Fernet
+from cryptography.fernet import Fernet, MultiFernet
 from config.settings import settings
 
 # class HashRrn:
@@ -12,14 +20,105 @@ from config.settings import settings
 #     def verify_rrn(self, plain_rrn: str, hashed_rrn: str):
 #         return self.rrn_context.verify(plain_rrn, hashed_rrn)
 
-# Fernet 인스턴스 생성
-fernet = Fernet(settings.rrn_secret_key.encode())
+# Fernet 키 링 (최초 사용 시 한 번만 생성)
+# 암호화는 항상 첫 번째(현재) 키로, 복호화는 현재 키 → 이전 키 순서로 시도하므로 키 교체 중에도 조회 가능
+@lru_cache(maxsize=1)
+def get_fernet() -> MultiFernet:
+    keys = [settings.rrn_secret_key] + [key.strip() for key in settings.rrn_previous_keys.split(",") if key.strip()]
+    return MultiFernet([Fernet(key.encode()) for key in keys])
 
 # 주민번호 암호화
 def encrypt_rrn(rrn: str) -> str:
-    return fernet.encrypt(rrn.encode()).decode()
+    return get_fernet().encrypt(rrn.encode()).decode()
 
 # 주민번호 복호화
 def decrypt_rrn(encrypted_rrn: str) -> str:
-    print("[🔓 복호화 시도]", encrypted_rrn)
-    return fernet.decrypt(encrypted_rrn.encode()).decode()
\ No newline at end of file
+    return get_fernet().decrypt(encrypted_rrn.encode()).decode()
+
+# --- 블라인드 인덱스: 복호화 없이 주민번호 일치 검색 ---
+
+# 인덱스 키 (RRN_INDEX_KEY 필수, 암호화 키를 교체해도 바뀌지 않아야 교체 중에도 같은 인덱스로 검색됨)
+@lru_cache(maxsize=1)
+def get_index_key() -> bytes:
+    if not settings.rrn_index_key:
+        raise RuntimeError("RRN_INDEX_KEY 가 설정되지 않았습니다.")
+    return settings.rrn_index_key.encode()
+
+# 입력 형식 차이(하이픈, 공백)로 다른 인덱스가 나오지 않도록 숫자만 남김
+def normalize_rrn(rrn: str) -> str:
+    return "".join(ch for ch in rrn if ch.isdigit())
+
+# 주민번호 블라인드 인덱스 (HMAC-SHA256 hex, 같은 주민번호는 항상 같은 값)
+def rrn_blind_index(rrn: str) -> str:
+    return hmac.new(get_index_key(), normalize_rrn(rrn).encode(), hashlib.sha256).hexdigest()
+
+# --- 대량 처리: 여러 건을 프로세스 풀에서 나눠 암호화 ---
+
+# 대량 암복호화 전용 프로세스 풀 (최초 사용 시 생성)
+_crypto_executor: Optional[ProcessPoolExecutor] = None
+
+def get_crypto_executor() -> ProcessPoolExecutor:
+    global _crypto_executor
+    if _crypto_executor is None:
+        # 스레드 풀을 쓰는 프로세스에서 fork 하지 않도록 spawn 사용
+        _crypto_executor = ProcessPoolExecutor(
+            max_workers=settings.rrn_crypto_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _crypto_executor
+
+# 워커 프로세스에서 실행되는 묶음 암호화
+def encrypt_rrn_chunk(rrns: List[str]) -> List[str]:
+    return [encrypt_rrn(rrn) for rrn in rrns]
+
+# 워커 프로세스에서 실행되는 묶음 복호화 (실패한 항목은 None)
+def decrypt_rrn_chunk(tokens: List[str]) -> List[Optional[str]]:
+    results = []
+    for token in tokens:
+        try:
+            results.append(get_fernet().decrypt(token.encode()).decode())
+        except Exception:
+            results.append(None)
+    return results
+
+# 워커 프로세스에서 실행되는 묶음 재암호화 (현재 키로 다시 암호화, 실패한 항목은 None)
+# 블라인드 인덱스는 암호화 키와 무관하므로 다시 계산하지 않음
+def rotate_rrn_chunk(tokens: List[str]) -> List[Optional[str]]:
+    fernet = get_fernet()
+    results = []
+    for token in tokens:
+        try:
+            results.append(fernet.rotate(token.encode()).decode())
+        except Exception:
+            results.append(None)
+    return results
+
+# 목록을 워커 수만큼 나누기
+def _split_chunks(items: list) -> list:
+    chunk_size = max(1, -(-len(items) // settings.rrn_crypto_workers))
+    return [items[i:i + chunk_size] for i in range(0, len(items), chunk_size)]
+
+# 암호화된 주민번호 목록을 병렬 재암호화 (동기 호출용, 입력 순서 유지)
+def rotate_rrns_batch(tokens: List[str]) -> List[Optional[str]]:
+    if not tokens:
+        return []
+    results = get_crypto_executor().map(rotate_rrn_chunk, _split_chunks(tokens))
+    return [value for chunk in results for value in chunk]
+
+# 암호화된 주민번호 목록을 병렬 복호화 (동기 호출용, 입력 순서 유지)
+def decrypt_rrns_batch(tokens: List[str]) -> List[Optional[str]]:
+    if not tokens:
+        return []
+    results = get_crypto_executor().map(decrypt_rrn_chunk, _split_chunks(tokens))
+    return [value for chunk in results for value in chunk]
+
+# 주민번호 목록을 워커 수만큼 나눠 병렬 암호화 (입력 순서 유지)
+async def encrypt_rrns_parallel(rrns: List[str]) -> List[str]:
+    if not rrns:
+        return []
+    chunks = _split_chunks(rrns)
+
+    loop = asyncio.get_running_loop()
+    executor = get_crypto_executor()
+    results = await asyncio.gather(*(loop.run_in_executor(executor, encrypt_rrn_chunk, chunk) for chunk in chunks))
+    return [token for chunk in results for token in chunk]
@@ -1,10 +1,68 @@
+import hashlib # 토큰 다이제스트 계산용
+from collections import OrderedDict # LRU 캐시 구현용
+from threading import Lock # 캐시 동시 접근 보호
 from time import time # 현재 시간을 가져오기 위한 time 모듈 import
 from fastapi import HTTPException, status # FastAPI에서 예외 처리 및 상태 코드를 사용하기 위한 모듈 import
 from jose import jwt # python-jose 라이브러리에서 JWT 인코딩/디코딩 기능 import
-from config.settings import Settings # 환경 설정 및 시크릿 키를 가져오는 Settings 클래스 import
+from config.settings import settings # 환경 설정 인스턴스 (.env 를 다시 읽지 않도록 공용 인스턴스 사용)
 
-# 설정 인스턴스 생성 (예: settings.SECRET_KEY 접근용)
-settings = Settings()
+# 검증이 끝난 토큰의 payload를 보관하는 LRU 캐시
+# - 키: 토큰의 SHA-256 다이제스트 (원문 토큰은 메모리에 남기지 않음)
+# - 값: (만료 시각, payload) → 만료 시각이 지나면 조회 시 제거
+# - 시크릿 키가 바뀌면 이전 키로 검증된 항목은 모두 무효화
+class VerifiedTokenCache:
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[bytes, tuple]" = OrderedDict()
+        self._secret_fingerprint = None
+        self._lock = Lock()
+
+    def _check_secret(self, secret_key: str):
+        fingerprint = hashlib.sha256(secret_key.encode()).digest()
+        if fingerprint != self._secret_fingerprint:
+            self._entries.clear()
+            self._secret_fingerprint = fingerprint
+
+    def get(self, digest: bytes, secret_key: str):
+        with self._lock:
+            self._check_secret(secret_key)
+            entry = self._entries.get(digest)
+            if entry is None or time() > entry[0]:
+                if entry is not None:
+                    del self._entries[digest]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(digest)
+            self.hits += 1
+            return dict(entry[1])
+
+    def put(self, digest: bytes, secret_key: str, payload: dict):
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._check_secret(secret_key)
+            self._entries[digest] = (payload["exp"], dict(payload))
+            self._entries.move_to_end(digest)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / total if total else 0.0,
+        }
+
+token_cache = VerifiedTokenCache(settings.jwt_cache_size)
 
 # JWT 토큰 생성 함수
 def create_jwt_token(email: str, user_id: int, role: str) -> str:
@@ -23,6 +81,12 @@ def create_jwt_token(email: str, user_id: int, role: str) -> str:
 
 # JWT 토큰 검증 함수
 def verify_jwt_token(token: str):
+    # 이미 검증된 토큰이면 디코딩/서명 확인 없이 캐시된 payload 반환
+    digest = hashlib.sha256(token.encode()).digest()
+    cached = token_cache.get(digest, settings.secret_key)
+    if cached is not None:
+        return cached
+
     try:
         # 전달받은 토큰을 디코딩하여 payload 추출
         payload = jwt.decode(token, settings.secret_key, algorithms=["HS256"])
@@ -42,6 +106,7 @@ def verify_jwt_token(token: str):
                 detail="Token expired"
             )
 
+        token_cache.put(digest, settings.secret_key, payload)
         return payload  # 유효한 경우 payload 반환
 
     except:
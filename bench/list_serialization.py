@@ -0,0 +1,118 @@
+# 목록 응답 직렬화 벤치마크
+# 임시 SQLite DB 에 전입 신고를 넣고 페이지 크기별로 두 경로의 행당 비용을 비교
+# - 기존 경로: select(MoveInInfo) → MoveInInfoPage → FastAPI response_model 검증/직렬화 → JSONResponse
+# - 현재 경로: LIST_COLUMNS 행 조회 → dict → ORJSONResponse
+# 두 경로의 응답 본문이 같은지도 확인 (다르면 종료 코드 1, CI 에서 응답 형식 회귀 확인용으로 실행)
+#
+#   python -m bench.list_serialization --sizes 10,50,200,1000 --repeat 20
+import argparse
+import asyncio
+import json
+import os
+import sys
+import tempfile
+from datetime import datetime, timedelta
+from time import perf_counter
+
+from cryptography.fernet import Fernet
+
+# 벤치마크 전용 DB/키 (이미 설정되어 있으면 그대로 사용)
+_db_dir = tempfile.mkdtemp(prefix="movein-bench-")
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{_db_dir}/bench.db")
+os.environ.setdefault("SECRET_KEY", "bench")
+os.environ.setdefault("RRN_SECRET_KEY", Fernet.generate_key().decode())
+os.environ.setdefault("RRN_INDEX_KEY", "bench")
+
+from fastapi.responses import JSONResponse, ORJSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+from sqlalchemy import func, insert
+from sqlmodel import select
+
+from database.connection import AsyncSessionLocal, async_engine, engine
+from database.migrate import upgrade_schema
+from models.MoveInInfo import MoveInInfo, MoveInInfoPage
+from service.movein_query import LIST_COLUMNS, build_list_query
+
+# 라우트의 response_model=MoveInInfoPage 와 같은 응답 필드
+PAGE_FIELD = create_model_field("Response_list_moveins", MoveInInfoPage, mode="serialization")
+
+
+def seed(rows: int):
+    with engine.begin() as conn:
+        if conn.execute(select(func.count()).select_from(MoveInInfo)).scalar() >= rows:
+            return
+        now = datetime.now()
+        conn.execute(insert(MoveInInfo), [
+            {"name": f"홍길동{i}", "rrn": Fernet.generate_key().decode(), "email": f"user{i}@test.com",
+             "beforeAddr": "서울특별시 종로구 세종대로 175", "afterAddr": "부산광역시 해운대구 센텀중앙로 55",
+             "regDt": now - timedelta(minutes=i), "moveInDt": now, "isApproval": i % 2 == 0, "userId": 1}
+            for i in range(rows)
+        ])
+
+
+# 기존 경로: ORM 객체 → 페이지 모델 → FastAPI 응답 검증/직렬화
+async def legacy(session, limit: int):
+    start = perf_counter()
+    rows = (await session.exec(build_list_query(limit))).all()
+    queried = perf_counter()
+    page = MoveInInfoPage(items=rows[:limit], next_cursor=rows[limit - 1].id if len(rows) > limit else None)
+    content = await serialize_response(field=PAGE_FIELD, response_content=page)
+    body = JSONResponse(content).body
+    return queried - start, perf_counter() - queried, body
+
+
+# 현재 경로: 컬럼 행 → dict → orjson
+async def fast(session, limit: int):
+    start = perf_counter()
+    rows = (await session.exec(build_list_query(limit, columns=LIST_COLUMNS))).mappings().all()
+    queried = perf_counter()
+    next_cursor = rows[limit - 1]["id"] if len(rows) > limit else None
+    body = ORJSONResponse({"items": [dict(row) for row in rows[:limit]], "next_cursor": next_cursor}).body
+    return queried - start, perf_counter() - queried, body
+
+
+async def measure(path, limit: int, repeat: int):
+    query_total = serialize_total = 0.0
+    body = None
+    for _ in range(repeat):
+        # 요청마다 새 세션 (identity map 재사용 없이 라우트와 같은 조건)
+        async with AsyncSessionLocal() as session:
+            query_time, serialize_time, body = await path(session, limit)
+        query_total += query_time
+        serialize_total += serialize_time
+    return query_total / repeat, serialize_total / repeat, body
+
+
+async def run(args) -> int:
+    failed = 0
+    print(f"{'path':<8}{'rows':>6}{'query ms':>11}{'serialize ms':>14}{'µs/row (q+s)':>15}")
+    for limit in args.sizes:
+        await measure(fast, limit, 1)  # 워밍업
+        results = {}
+        for name, path in (("legacy", legacy), ("fast", fast)):
+            query_time, serialize_time, body = await measure(path, limit, args.repeat)
+            results[name] = body
+            per_row = (query_time + serialize_time) / limit * 1e6
+            print(f"{name:<8}{limit:>6}{query_time * 1e3:>11.2f}{serialize_time * 1e3:>14.2f}{per_row:>15.1f}")
+        if json.loads(results["legacy"]) != json.loads(results["fast"]):
+            print(f"  ! rows={limit}: 두 경로의 응답 본문이 다릅니다.")
+            failed += 1
+    await async_engine.dispose()
+    return failed
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=lambda value: [int(size) for size in value.split(",")], default=[10, 50, 200, 1000])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    upgrade_schema()
+    seed(max(args.sizes) + 1)
+    if asyncio.run(run(args)):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
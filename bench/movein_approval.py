@@ -0,0 +1,87 @@
+# 전입 신고 승인 처리량 벤치마크
+# 임시 SQLite DB 에 미승인 신고를 넣고 기존 단건 경로(get → 수정 → commit → refresh)와
+# approve_moveins(chunk 단위 UPDATE ... WHERE id IN (...))를 비교
+#
+#   python -m bench.movein_approval --rows 5000 --chunk-size 1000
+import argparse
+import asyncio
+import os
+import tempfile
+from datetime import datetime
+from time import perf_counter
+
+from cryptography.fernet import Fernet
+
+# 벤치마크 전용 DB/키 (이미 설정되어 있으면 그대로 사용)
+_db_dir = tempfile.mkdtemp(prefix="movein-bench-")
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{_db_dir}/bench.db")
+os.environ.setdefault("SECRET_KEY", "bench")
+os.environ.setdefault("RRN_SECRET_KEY", Fernet.generate_key().decode())
+os.environ.setdefault("RRN_INDEX_KEY", "bench")
+
+from sqlalchemy import insert
+from sqlmodel import SQLModel, delete, select
+
+from database.connection import AsyncSessionLocal, async_engine, engine
+from models.MoveInInfo import MoveInInfo
+from service.movein_approval import approve_moveins
+
+
+async def seed(rows: int) -> list:
+    async with AsyncSessionLocal() as session:
+        await session.exec(delete(MoveInInfo))
+        now = datetime.now()
+        await session.exec(insert(MoveInInfo), params=[
+            {"name": f"홍길동{i}", "rrn": "x", "email": f"user{i}@test.com", "beforeAddr": "a", "afterAddr": "b",
+             "regDt": now, "moveInDt": None, "userId": 1}
+            for i in range(rows)
+        ])
+        await session.commit()
+        return list((await session.exec(select(MoveInInfo.id))).all())
+
+
+# 기존 approve_movein 과 같은 방식으로 한 건씩 승인
+async def per_id(ids: list) -> float:
+    start = perf_counter()
+    async with AsyncSessionLocal() as session:
+        for movein_id in ids:
+            movein = await session.get(MoveInInfo, movein_id)
+            movein.isApproval = True
+            movein.approvalDt = datetime.now()
+            session.add(movein)
+            await session.commit()
+            await session.refresh(movein)
+    return perf_counter() - start
+
+
+async def bulk(ids: list, chunk_size: int) -> float:
+    start = perf_counter()
+    async with AsyncSessionLocal() as session:
+        result = await approve_moveins(session, chunk_size, ids=ids)
+    assert result["approved"] == len(ids), result
+    return perf_counter() - start
+
+
+async def run(args):
+    ids = await seed(args.rows)
+    elapsed = await per_id(ids)
+    print(f"per-id route   ({args.rows} rows): {elapsed:8.3f}s  {args.rows / elapsed:10.1f} rows/s")
+
+    ids = await seed(args.rows)
+    elapsed = await bulk(ids, args.chunk_size)
+    print(f"bulk chunk={args.chunk_size:<5}({args.rows} rows): {elapsed:8.3f}s  {args.rows / elapsed:10.1f} rows/s")
+    await async_engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    SQLModel.metadata.create_all(engine)
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+# 목록/검색 쿼리 실행 계획 확인 (인덱스 회귀 검사)
+# 라우트와 같은 조회문(service/movein_query.py 등)의 EXPLAIN 결과에 기대한 인덱스가 쓰이는지 확인하고,
+# 하나라도 다르면 종료 코드 1 로 끝남 (같은 시나리오를 tests/test_movein_explain.py 에서 SQLite 로 확인)
+# 기본은 임시 SQLite DB 에 데이터를 넣고 ANALYZE 후 확인, DATABASE_URL 을 지정하면 해당 DB(MySQL 등)에서 확인
+# (테이블이 비어 있을 때만 데이터를 넣음)
+#
+#   python -m bench.movein_explain --rows 50000
+import argparse
+import os
+import sys
+import tempfile
+from datetime import datetime, timedelta
+
+from cryptography.fernet import Fernet
+
+# 벤치마크 전용 DB/키 (이미 설정되어 있으면 그대로 사용)
+_db_dir = tempfile.mkdtemp(prefix="movein-bench-")
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{_db_dir}/bench.db")
+os.environ.setdefault("SECRET_KEY", "bench")
+os.environ.setdefault("RRN_SECRET_KEY", Fernet.generate_key().decode())
+os.environ.setdefault("RRN_INDEX_KEY", "bench")
+
+from sqlalchemy import event, func, insert, text
+from sqlmodel import select
+
+from auth.hash_rrn import rrn_blind_index
+from database.connection import engine
+from database.migrate import upgrade_schema
+from models.files import Files
+from models.MoveInInfo import MoveInInfo
+from models.users import User
+from service.movein_query import build_list_query, build_region_count_query
+
+BASE_DT = datetime(2025, 1, 1)
+SIDOS = ("11", "26", "27", "28", "41")
+
+
+def region_values(side: str, i: int) -> dict:
+    sido = SIDOS[i % len(SIDOS)]
+    sigungu = f"{sido}{110 + (i // len(SIDOS)) % 20 * 10}"
+    return {f"{side}Sido": sido, f"{side}Sigungu": sigungu, f"{side}Emd": f"{sigungu}{101 + i % 7}"}
+
+
+def seed(rows: int, users: int):
+    with engine.begin() as conn:
+        if conn.execute(select(func.count()).select_from(MoveInInfo)).scalar():
+            return
+        conn.execute(insert(User), [
+            {"id": i, "username": f"user{i}", "email": f"user{i}@test.com", "password": "x", "role": "N"}
+            for i in range(1, users + 1)
+        ])
+        conn.execute(insert(Files), [
+            {"userId": i, "fileName": f"{i}.png", "filePath": "uploads", "orgFileName": "a.png", "fileSize": "1",
+             "fileUrl": f"/files/uploads/{i}.png"}
+            for i in range(1, users + 1)
+        ])
+        # 승인 90%, 미승인 10%, 등록일은 1년에 고르게 분포, 지역은 시도 5곳 × 시군구 20곳
+        conn.execute(insert(MoveInInfo), [
+            {"name": f"홍길동{i}", "rrn": "x", "rrnIndex": rrn_blind_index(f"900101{i:07d}"), "email": f"p{i}@t.com",
+             "beforeAddr": "a", "afterAddr": "b", "regDt": BASE_DT + timedelta(minutes=i * 525600 // rows),
+             "moveInDt": None, "isApproval": i % 10 != 0, "userId": i % users + 1,
+             **region_values("before", i + 7), **region_values("after", i)}
+            for i in range(rows)
+        ])
+        if engine.dialect.name == "sqlite":
+            conn.execute(text("ANALYZE"))
+        else:
+            conn.execute(text(f"ANALYZE TABLE `{MoveInInfo.__tablename__}`, `{Files.__tablename__}`"))
+
+
+# (이름, 조회문, 기대 인덱스[, 확인할 DB])
+def scenarios(rows: int):
+    mid = rows // 2
+    return [
+        ("내 신고 내역", build_list_query(50, owner_id=7), "ix_MoveInInfo_userId_id"),
+        ("내 신고 내역 다음 페이지", build_list_query(50, owner_id=7, after=mid), "ix_MoveInInfo_userId_id"),
+        ("내 신고 내역 + 등록일", build_list_query(50, owner_id=7, reg_from=BASE_DT + timedelta(days=100)), "ix_MoveInInfo_userId_id"),
+        ("승인 대기 목록", build_list_query(50, approved=False), "ix_MoveInInfo_isApproval_id"),
+        ("승인 대기 다음 페이지", build_list_query(50, approved=False, after=mid), "ix_MoveInInfo_isApproval_id"),
+        ("등록일 범위", build_list_query(
+            50, reg_from=BASE_DT + timedelta(days=100), reg_to=BASE_DT + timedelta(days=101)), "ix_MoveInInfo_regDt"),
+        # SQLite 는 NOCASE 정렬이 아닌 컬럼의 LIKE 에 인덱스를 쓰지 않으므로 MySQL 에서만 확인
+        ("이름 접두어", build_list_query(50, name="홍길동123"), "ix_MoveInInfo_name", "mysql"),
+        ("주민번호 일치", select(MoveInInfo).where(MoveInInfo.rrnIndex == rrn_blind_index("9001010000123")), "ix_MoveInInfo_rrnIndex"),
+        ("프로필 이미지", select(Files).where(Files.userId == 7), "ix_Files_userId"),
+        ("전입 시군구", build_list_query(50, region="11110"), "ix_MoveInInfo_afterSigungu_id"),
+        ("전입 읍면동", build_list_query(50, region="11110101"), "ix_MoveInInfo_afterEmd_id"),
+        ("전출 시도", build_list_query(50, region="26", side="before"), "ix_MoveInInfo_beforeSido_id"),
+        # 하위 지역 건수도 접두어 LIKE 로 거르므로 이름 접두어와 같은 이유로 MySQL 에서만 확인
+        ("시도 내 시군구별 건수", build_region_count_query("after", "11"), "ix_MoveInInfo_afterSigungu_id", "mysql"),
+        ("시군구 내 읍면동별 건수", build_region_count_query("after", "11110"), "ix_MoveInInfo_afterEmd_id", "mysql"),
+    ]
+
+
+# conn.info["explain"] 이 켜진 커넥션의 SQL 앞에 EXPLAIN 을 붙이는 이벤트 등록 (프로세스에서 한 번만)
+def install_explain_hook():
+    if getattr(install_explain_hook, "installed", False):
+        return
+    prefix = "EXPLAIN QUERY PLAN " if engine.dialect.name == "sqlite" else "EXPLAIN "
+
+    @event.listens_for(engine, "before_cursor_execute", retval=True)
+    def _explain(conn, cursor, statement, parameters, context, executemany):
+        if conn.info.get("explain"):
+            statement = prefix + statement
+        return statement, parameters
+
+    install_explain_hook.installed = True
+
+
+# 실행 직전에 SQL 앞에 EXPLAIN 을 붙여서 드라이버가 바인딩한 그대로의 계획을 조회 (install_explain_hook 필요)
+def explain(conn, query) -> str:
+    conn.info["explain"] = True
+    try:
+        result = conn.execute(query)
+        plan = result.cursor.fetchall()
+        columns = [column[0] for column in result.cursor.description]
+    finally:
+        conn.info["explain"] = False
+    if engine.dialect.name == "sqlite":
+        return " / ".join(row[-1] for row in plan)
+    # MySQL: 테이블별 사용 인덱스(key)와 접근 방식(type)
+    return " / ".join(f"{row[columns.index('table')]}:{row[columns.index('type')]}:{row[columns.index('key')]}" for row in plan)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=50000)
+    parser.add_argument("--users", type=int, default=1000)
+    args = parser.parse_args()
+
+    install_explain_hook()
+    upgrade_schema()
+    seed(args.rows, args.users)
+
+    failed = 0
+    with engine.connect() as conn:
+        for name, query, index, *dialects in scenarios(args.rows):
+            if dialects and engine.dialect.name not in dialects:
+                print(f"[SKIP] {name:<16} ({', '.join(dialects)} 에서만 확인)")
+                continue
+            plan = explain(conn, query)
+            ok = index in plan
+            failed += not ok
+            print(f"[{'OK' if ok else 'FAIL'}] {name:<16} 기대: {index:<30} 계획: {plan}")
+
+    if failed:
+        print(f"{failed}개 쿼리가 기대한 인덱스를 사용하지 않습니다.")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
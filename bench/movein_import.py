@@ -0,0 +1,91 @@
+# 전입 신고 대량 등록 처리량 벤치마크 (rows/s)
+# 임시 SQLite DB 에 대해 기존 단건 경로(암호화 → add → commit → refresh)와
+# import_moveins(병렬 암호화 + multi-row INSERT)를 배치 크기별로 비교
+#
+#   python -m bench.movein_import --rows 20000 --batch-sizes 100,500,2000
+import argparse
+import asyncio
+import os
+import tempfile
+from datetime import datetime
+from time import perf_counter
+
+from cryptography.fernet import Fernet
+
+# 벤치마크 전용 DB/키 (이미 설정되어 있으면 그대로 사용)
+_db_dir = tempfile.mkdtemp(prefix="movein-bench-")
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{_db_dir}/bench.db")
+os.environ.setdefault("SECRET_KEY", "bench")
+os.environ.setdefault("RRN_SECRET_KEY", Fernet.generate_key().decode())
+os.environ.setdefault("RRN_INDEX_KEY", "bench")
+
+from sqlmodel import SQLModel, delete
+
+from auth.hash_rrn import encrypt_rrn
+from database.connection import AsyncSessionLocal, async_engine, engine
+from models.MoveInInfo import MoveInInfo
+from service.movein_import import import_moveins
+
+
+def make_csv(rows: int):
+    buffer = tempfile.SpooledTemporaryFile(max_size=1024 * 1024)
+    buffer.write("name,rrn,email,beforeAddr,afterAddr,moveInDt\n".encode())
+    for i in range(rows):
+        buffer.write(f"홍길동{i},900101-{i % 10_000_000:07d},user{i}@test.com,"
+                     f"서울특별시 강남구 역삼동 {i},부산광역시 해운대구 우동 {i},\n".encode())
+    buffer.seek(0)
+    return buffer
+
+
+async def reset():
+    async with AsyncSessionLocal() as session:
+        await session.exec(delete(MoveInInfo))
+        await session.commit()
+
+
+# 기존 create_movein 과 같은 방식으로 한 건씩 저장
+async def per_row(rows: int) -> float:
+    start = perf_counter()
+    async with AsyncSessionLocal() as session:
+        for i in range(rows):
+            data = MoveInInfo(
+                name=f"홍길동{i}", rrn=encrypt_rrn(f"900101-{i:07d}"), email=f"user{i}@test.com",
+                beforeAddr="서울특별시 강남구 역삼동", afterAddr="부산광역시 해운대구 우동",
+                regDt=datetime.now(), moveInDt=None, userId=1,
+            )
+            session.add(data)
+            await session.commit()
+            await session.refresh(data)
+    return rows / (perf_counter() - start)
+
+
+async def bulk(rows: int, batch_size: int) -> float:
+    file_obj = make_csv(rows)
+    async with AsyncSessionLocal() as session:
+        result = await import_moveins(session, file_obj, "csv", 1, batch_size)
+    assert result["failed"] == 0, result["errors"][:3]
+    return result["rows_per_second"]
+
+
+async def run(args):
+    per_row_rows = min(args.rows, args.per_row_rows)
+    print(f"per-row path    ({per_row_rows:>6} rows): {await per_row(per_row_rows):10.1f} rows/s")
+    for batch_size in map(int, args.batch_sizes.split(",")):
+        await reset()
+        print(f"bulk batch={batch_size:<5} ({args.rows:>6} rows): {await bulk(args.rows, batch_size):10.1f} rows/s")
+    await async_engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--per-row-rows", type=int, default=2000, help="단건 경로는 느리므로 이 행 수까지만 측정")
+    parser.add_argument("--batch-sizes", default="100,500,2000")
+    args = parser.parse_args()
+
+    SQLModel.metadata.create_all(engine)
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
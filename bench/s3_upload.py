@@ -0,0 +1,70 @@
+# S3 업로드 처리량 벤치마크 (파일 크기별)
+# moto 로 만든 로컬 S3 에 대해 S3Storage.upload_async 를 동시에 여러 번 호출해 MB/s 를 측정
+#
+#   pip install "moto[s3]"
+#   python -m bench.s3_upload --sizes 64K,1M,8M,32M --concurrency 8 --repeat 4
+import argparse
+import asyncio
+import io
+import os
+from time import perf_counter
+
+# Settings 필수 값이 없으면 moto 용 기본값 사용
+os.environ.setdefault("AWS_ACCESS_KEY_ID", "testing")
+os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "testing")
+os.environ.setdefault("BUCKET_NAME", "bench-bucket")
+os.environ.setdefault("ENDPOINT_URL", "https://s3.ap-northeast-2.amazonaws.com")
+
+from moto import mock_aws
+
+from config.settings import settings
+from service import s3_service
+from service.storage import S3Storage
+
+UNITS = {"K": 1024, "M": 1024 * 1024}
+
+
+def parse_size(text: str) -> int:
+    text = text.strip().upper()
+    if text[-1] in UNITS:
+        return int(float(text[:-1]) * UNITS[text[-1]])
+    return int(text)
+
+
+async def run_size(size: int, concurrency: int, repeat: int) -> float:
+    payload = os.urandom(size)
+    storage = S3Storage()
+
+    async def one():
+        await storage.upload_async(io.BytesIO(payload), "bench.bin")
+
+    start = perf_counter()
+    for _ in range(repeat):
+        await asyncio.gather(*(one() for _ in range(concurrency)))
+    elapsed = perf_counter() - start
+    return size * concurrency * repeat / elapsed / (1024 * 1024)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", default="64K,1M,8M,32M")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--repeat", type=int, default=4)
+    args = parser.parse_args()
+
+    with mock_aws():
+        # mock 시작 이후에 클라이언트를 만들어야 moto 로 연결됨
+        s3_service.get_s3_client.cache_clear()
+        s3_service.get_s3_client().create_bucket(
+            Bucket=settings.bucket_name,
+            CreateBucketConfiguration={"LocationConstraint": "ap-northeast-2"},
+        )
+        print(f"threshold={settings.s3_multipart_threshold} chunk={settings.s3_multipart_chunksize} "
+              f"max_concurrency={settings.s3_max_concurrency} io_workers={settings.storage_io_workers}")
+        for size in map(parse_size, args.sizes.split(",")):
+            mbps = asyncio.run(run_size(size, args.concurrency, args.repeat))
+            print(f"{size:>12,d} bytes  {mbps:8.1f} MB/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+# 기동 시간 벤치마크 (import + lifespan + 첫 요청)
+# 임시 SQLite DB 에 마이그레이션을 한 번 실행한 뒤, 새 프로세스를 runs 번 띄워 각 단계 시간을 측정
+# --budget 을 주면 중앙값(import + 기동 + 첫 요청)이 이를 넘을 때 종료 코드 1 로 끝나므로 CI 회귀 확인용으로 사용
+#
+#   python -m bench.startup --runs 5 --budget 3.0
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from time import perf_counter
+
+STAGES = ("import", "startup", "first_request", "second_request")
+
+
+# 자식 프로세스: 단계별 시간 측정 후 JSON 한 줄 출력
+def child():
+    started = perf_counter()
+    import main
+    from fastapi.testclient import TestClient
+    from auth.jwt_handler import create_jwt_token
+    imported = perf_counter()
+
+    with TestClient(main.app) as client:
+        ready = perf_counter()
+        headers = {"Authorization": f"Bearer {create_jwt_token('admin@test.com', 1, 'Y')}"}
+        first = client.get("/movein/?limit=1", headers=headers)
+        first_done = perf_counter()
+        client.get("/movein/?limit=1", headers=headers)
+        second_done = perf_counter()
+
+    if first.status_code != 200:
+        raise SystemExit(f"첫 요청 실패: {first.status_code} {first.text}")
+    print(json.dumps({
+        "import": imported - started,
+        "startup": ready - imported,
+        "first_request": first_done - ready,
+        "second_request": second_done - first_done,
+    }))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget", type=float, default=None, help="import + 기동 + 첫 요청 중앙값 허용 시간(초)")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        child()
+        return
+
+    # 벤치마크 전용 DB/키 (이미 설정되어 있으면 그대로 사용)
+    from cryptography.fernet import Fernet
+
+    env = dict(os.environ)
+    env.setdefault("DATABASE_URL", f"sqlite:///{tempfile.mkdtemp(prefix='movein-bench-')}/bench.db")
+    env.setdefault("SECRET_KEY", "bench")
+    env.setdefault("RRN_SECRET_KEY", Fernet.generate_key().decode())
+    env.setdefault("RRN_INDEX_KEY", "bench")
+    env.setdefault("LOG_LEVEL", "WARNING")
+    env["AUTO_MIGRATE"] = "false"
+
+    subprocess.run([sys.executable, "-m", "database.migrate"], env=env, check=True)
+
+    results = []
+    for _ in range(args.runs):
+        started = perf_counter()
+        output = subprocess.run(
+            [sys.executable, "-m", "bench.startup", "--child"],
+            env=env, check=True, capture_output=True, text=True,
+        ).stdout
+        timings = json.loads(output.strip().splitlines()[-1])
+        timings["process"] = perf_counter() - started
+        results.append(timings)
+
+    print(f"{'단계':<16}{'중앙값':>10}{'최대':>10}")
+    for stage in STAGES + ("process",):
+        values = [result[stage] for result in results]
+        print(f"{stage:<16}{statistics.median(values) * 1000:>8.1f}ms{max(values) * 1000:>8.1f}ms")
+
+    ready = statistics.median(result["import"] + result["startup"] + result["first_request"] for result in results)
+    print(f"import + 기동 + 첫 요청 중앙값: {ready:.3f}s")
+    if args.budget is not None and ready > args.budget:
+        print(f"허용 시간 {args.budget:.3f}s 초과")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+import atexit
+import json
+import logging
+import queue
+import random
+import sys
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from threading import Lock
+from typing import Optional
+
+from config.settings import settings
+
+# LogRecord 기본 속성 (이 외의 속성은 extra 로 넘긴 값이므로 JSON 필드로 출력)
+_RECORD_ATTRS = set(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message", "taskName"}
+
+# uvicorn 이 직접 핸들러를 붙이는 로거 (루트의 큐 핸들러를 타도록 변경)
+_UVICORN_LOGGERS = ("uvicorn", "uvicorn.error", "uvicorn.access")
+
+
+# 한 줄 JSON 포매터 (출력 스레드에서 실행)
+class JsonFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        data = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRS and not key.startswith("_"):
+                data[key] = value
+        if record.exc_text:
+            data["exception"] = record.exc_text
+        return json.dumps(data, ensure_ascii=False, default=str)
+
+
+# DEBUG 로그 표본 추출 (대량으로 발생하는 DEBUG 로그는 rate 비율만 큐에 넣음)
+class DebugSamplingFilter(logging.Filter):
+    def __init__(self, rate: float):
+        super().__init__()
+        self.rate = rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > logging.DEBUG or self.rate >= 1:
+            return True
+        return random.random() < self.rate
+
+
+# 요청 처리 스레드에서는 큐에 넣기만 하는 핸들러
+# - 메시지 포맷과 예외 문자열 변환만 여기서 하고, JSON 변환과 출력은 리스너 스레드가 담당
+# - 큐가 가득 차면 기다리지 않고 버린 뒤 건수만 기록
+class NonBlockingQueueHandler(QueueHandler):
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+        self._dropped_lock = Lock()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # 인자/예외 객체는 다른 스레드에서 포맷하면 값이 바뀌거나 직렬화되지 않을 수 있으므로 문자열로 고정
+        record = logging.makeLogRecord(record.__dict__)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            with self._dropped_lock:
+                self.dropped += 1
+
+
+_listener: Optional[QueueListener] = None
+queue_handler: Optional[NonBlockingQueueHandler] = None
+
+
+# 로거별 레벨 설정 ("이름=레벨,이름=레벨")
+def _parse_levels(value: str) -> dict:
+    levels = {}
+    for item in value.split(","):
+        name, _, level = item.partition("=")
+        if name.strip() and level.strip():
+            levels[name.strip()] = level.strip().upper()
+    return levels
+
+
+# 로그 파이프라인 구성 (여러 번 호출해도 한 번만 적용)
+def setup_logging() -> None:
+    global _listener, queue_handler
+    if _listener is not None:
+        return
+
+    log_queue = queue.Queue(maxsize=settings.log_queue_size)
+    output = logging.StreamHandler(sys.stdout)
+    output.setFormatter(JsonFormatter())
+
+    queue_handler = NonBlockingQueueHandler(log_queue)
+    queue_handler.addFilter(DebugSamplingFilter(settings.log_debug_sample_rate))
+
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(queue_handler)
+    root.setLevel(settings.log_level.upper())
+
+    for name in _UVICORN_LOGGERS:
+        uvicorn_logger = logging.getLogger(name)
+        uvicorn_logger.handlers.clear()
+        uvicorn_logger.propagate = True
+
+    if settings.db_echo:
+        logging.getLogger("sqlalchemy.engine").setLevel(logging.INFO)
+    for name, level in _parse_levels(settings.log_levels).items():
+        logging.getLogger(name).setLevel(level)
+
+    _listener = QueueListener(log_queue, output, respect_handler_level=True)
+    _listener.start()
+    atexit.register(shutdown_logging)
+
+
+# 큐에 남은 로그를 모두 출력한 뒤 리스너 스레드 종료
+def shutdown_logging() -> None:
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
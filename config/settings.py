@@ -1,6 +1,7 @@
 # config/settings.py
 from pydantic_settings import BaseSettings
 from pydantic import Field
+from typing import Optional
 from dotenv import load_dotenv
 import os
 
@@ -8,8 +9,63 @@ load_dotenv()  # .env 파일 읽기
 
 class Settings(BaseSettings):
     database_url: str = os.getenv("DATABASE_URL")
+    # 비동기 라우트용 DB URL (미지정 시 database_url 의 드라이버를 비동기 드라이버로 바꿔 사용)
+    async_database_url: Optional[str] = os.getenv("ASYNC_DATABASE_URL")
+
+    # DB 커넥션 풀 설정 (워커당 적용, 동기/비동기 엔진 각각 별도 풀)
+    db_pool_size: int = int(os.getenv("DB_POOL_SIZE", 5))  # 상시 유지 커넥션 수
+    db_max_overflow: int = int(os.getenv("DB_MAX_OVERFLOW", 10))  # pool_size 초과 시 추가로 허용할 커넥션 수
+    db_pool_timeout: float = float(os.getenv("DB_POOL_TIMEOUT", 30))  # 커넥션 대기 최대 시간(초)
+    db_pool_recycle: int = int(os.getenv("DB_POOL_RECYCLE", 1800))  # 커넥션 재생성 주기(초), MySQL wait_timeout 보다 짧게
+    db_pool_pre_ping: bool = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"  # 체크아웃 시 커넥션 생존 확인
+    db_echo: bool = os.getenv("DB_ECHO", "false").lower() == "true"  # SQL 문 로그 출력 여부 (sqlalchemy.engine 로거를 INFO 로 설정)
     secret_key: str = os.getenv("SECRET_KEY")
-    rrn_secret_key: str = os.getenv("RRN_SECRET_KEY")
+    rrn_secret_key: str = os.getenv("RRN_SECRET_KEY")  # 현재 암호화 키 (새로 저장하는 값은 항상 이 키로 암호화)
+    # 키 교체 중 복호화에만 쓰는 이전 키 목록 (쉼표 구분, 재암호화 작업 완료 후 제거)
+    rrn_previous_keys: str = os.getenv("RRN_PREVIOUS_KEYS", "")
+    # 주민번호 검색용 블라인드 인덱스(HMAC-SHA256) 키 (필수, 없으면 애플리케이션 시작 실패)
+    # 암호화 키 교체와 무관하게 유지하고, 변경 시 backfill_rrn_index --all 로 재계산 필요
+    rrn_index_key: Optional[str] = os.getenv("RRN_INDEX_KEY")
+    rrn_crypto_workers: int = int(os.getenv("RRN_CRYPTO_WORKERS", os.cpu_count() or 4))  # 주민번호 대량 암복호화 프로세스 풀 크기
+
+    # 전입 신고 대량 등록 설정
+    movein_import_batch_size: int = int(os.getenv("MOVEIN_IMPORT_BATCH_SIZE", 500))  # INSERT 한 번에 넣을 행 수
+    movein_import_max_errors: int = int(os.getenv("MOVEIN_IMPORT_MAX_ERRORS", 100))  # 응답에 담을 행 오류 최대 개수
+    movein_approval_chunk_size: int = int(os.getenv("MOVEIN_APPROVAL_CHUNK_SIZE", 1000))  # 일괄 승인 시 UPDATE 한 번에 처리할 id 수
+    movein_backfill_batch_size: int = int(os.getenv("MOVEIN_BACKFILL_BATCH_SIZE", 1000))  # 백필 작업 시 한 번에 처리할 행 수
+    rrn_rotation_chunk_size: int = int(os.getenv("RRN_ROTATION_CHUNK_SIZE", 1000))  # 키 교체 재암호화 시 한 번에 처리(commit)할 행 수
+    movein_export_chunk_size: int = int(os.getenv("MOVEIN_EXPORT_CHUNK_SIZE", 1000))  # 내보내기 시 서버 측 커서에서 한 번에 가져올 행 수
+    region_cache_size: int = int(os.getenv("REGION_CACHE_SIZE", 8192))  # 주소 → 지역 코드 변환 결과를 기억할 주소 앞부분(시도~읍면동) 개수
+    region_reload_seconds: float = float(os.getenv("REGION_RELOAD_SECONDS", 60))  # 시작 시 법정동코드가 비어 있으면 다시 읽어 볼 간격(초)
+
+    # 로그 설정 (JSON 한 줄 형식, 큐를 거쳐 별도 스레드에서 출력)
+    log_level: str = os.getenv("LOG_LEVEL", "INFO")  # 루트 로거 레벨
+    log_levels: str = os.getenv("LOG_LEVELS", "")  # 로거별 레벨 (예: "service.s3_service=DEBUG,uvicorn.access=WARNING")
+    log_debug_sample_rate: float = float(os.getenv("LOG_DEBUG_SAMPLE_RATE", 0.1))  # DEBUG 로그 중 실제로 남길 비율 (0~1)
+    log_queue_size: int = int(os.getenv("LOG_QUEUE_SIZE", 10000))  # 출력 대기 최대 건수 (가득 차면 새 로그는 버림)
+
+    # 기동 시 스키마 생성/변경과 관리자 계정 생성 여부 (로컬 개발용, 운영에서는 python -m database.migrate 로 한 번만 실행)
+    auto_migrate: bool = os.getenv("AUTO_MIGRATE", "false").lower() == "true"
+    admin_email: str = os.getenv("ADMIN_EMAIL", "admin@test.com")  # 최초 관리자 계정 이메일
+    admin_password: str = os.getenv("ADMIN_PASSWORD", "1234")  # 최초 관리자 계정 비밀번호 (생성 후 변경)
+
+    # 요청 메트릭 수집 여부 (/metrics 로 Prometheus 형식 노출)
+    metrics_enabled: bool = os.getenv("METRICS_ENABLED", "true").lower() == "true"
+    # /metrics, /internal/* 접근 토큰 (Authorization: Bearer <토큰>, 미지정 시 두 엔드포인트 모두 비활성)
+    internal_token: Optional[str] = os.getenv("INTERNAL_TOKEN")
+
+    # 사용자/프로필 조회 캐시 (memory: 프로세스 내 TTL+LRU, redis: 여러 워커/인스턴스가 공유)
+    user_cache_backend: str = os.getenv("USER_CACHE_BACKEND", "memory")
+    user_cache_size: int = int(os.getenv("USER_CACHE_SIZE", 10000))  # memory 백엔드 최대 항목 수 (0 이면 캐시 사용 안 함)
+    user_cache_ttl: int = int(os.getenv("USER_CACHE_TTL", 60))  # 항목 유지 시간(초), 다른 워커의 수정이 반영되기까지의 최대 지연
+    redis_url: Optional[str] = os.getenv("REDIS_URL")  # redis 백엔드 접속 URL (redis 패키지 필요)
+
+    # 검증된 JWT 캐시 최대 항목 수 (0 이면 캐시 사용 안 함)
+    jwt_cache_size: int = int(os.getenv("JWT_CACHE_SIZE", 1024))
+
+    # 비밀번호 해싱(bcrypt) 설정
+    password_hash_workers: int = int(os.getenv("PASSWORD_HASH_WORKERS", os.cpu_count() or 4))  # 해싱 전용 스레드 풀 크기
+    password_rehash_on_login: bool = os.getenv("PASSWORD_REHASH_ON_LOGIN", "false").lower() == "true"  # 로그인 시 오래된 해시 재해싱 여부
 
     # Naver Cloud Platform 설정
     # ncp_access_key: str = os.getenv("NCP_ACCESS_KEY")
@@ -17,11 +73,32 @@ class Settings(BaseSettings):
     # bucket_name: str = os.getenv("BUCKET_NAME")
     # endpoint_url: str = os.getenv("ENDPOINT_URL")
 
-    # AWS S3 설정
-    aws_access_key: str = Field(..., alias="AWS_ACCESS_KEY_ID")
-    aws_secret_key: str = Field(..., alias="AWS_SECRET_ACCESS_KEY")
-    bucket_name: str = Field(..., alias="BUCKET_NAME")
-    endpoint_url: str = Field(..., alias="ENDPOINT_URL")
+    # AWS S3 설정 (storage_backend 가 "s3" 일 때만 필요)
+    aws_access_key: Optional[str] = Field(None, alias="AWS_ACCESS_KEY_ID")
+    aws_secret_key: Optional[str] = Field(None, alias="AWS_SECRET_ACCESS_KEY")
+    bucket_name: Optional[str] = Field(None, alias="BUCKET_NAME")
+    endpoint_url: Optional[str] = Field(None, alias="ENDPOINT_URL")
+
+    # S3 전송 설정 (boto3 TransferConfig)
+    s3_multipart_threshold: int = int(os.getenv("S3_MULTIPART_THRESHOLD", 8 * 1024 * 1024))  # 이 크기 이상이면 멀티파트 업로드
+    s3_multipart_chunksize: int = int(os.getenv("S3_MULTIPART_CHUNKSIZE", 8 * 1024 * 1024))  # 멀티파트 파트 크기
+    s3_max_concurrency: int = int(os.getenv("S3_MAX_CONCURRENCY", 4))  # 파일 하나당 동시 전송 스레드 수
+
+    # 파일 저장소 설정
+    storage_backend: str = os.getenv("STORAGE_BACKEND", "s3")  # "s3" 또는 "local"
+    storage_io_workers: int = int(os.getenv("STORAGE_IO_WORKERS", 8))  # 비동기 업로드/삭제를 처리할 스레드 풀 크기
+    local_storage_root: str = os.getenv("LOCAL_STORAGE_ROOT", ".")  # local: uploads/ 디렉터리가 위치한 경로
+    local_storage_base_url: str = os.getenv("LOCAL_STORAGE_BASE_URL", "/files")  # local: 파일 서빙 URL prefix
+
+    # 프로필 이미지 직접 업로드(presigned POST) 설정
+    profile_image_max_bytes: int = int(os.getenv("PROFILE_IMAGE_MAX_BYTES", 5 * 1024 * 1024))  # 최대 파일 크기
+    profile_image_types: str = os.getenv("PROFILE_IMAGE_TYPES", "image/png,image/jpeg,image/webp,image/gif")  # 허용 Content-Type (쉼표 구분)
+    presigned_url_expires: int = int(os.getenv("PRESIGNED_URL_EXPIRES", 600))  # presigned URL 유효 시간(초)
+
+    # 프로필 이미지 썸네일(변환본) 설정
+    profile_variant_sizes: str = os.getenv("PROFILE_VARIANT_SIZES", "64,256")  # 생성할 변환본 크기(px, 긴 변 기준, 쉼표 구분)
+    profile_variant_quality: int = int(os.getenv("PROFILE_VARIANT_QUALITY", 80))  # WebP 품질
+    image_workers: int = int(os.getenv("IMAGE_WORKERS", 2))  # 이미지 변환 프로세스 풀 크기
 
     class Config:
         env_file = ".env"
@@ -1,16 +1,47 @@
 from config.settings import settings  # 설정 인스턴스 import
 from sqlmodel import SQLModel, create_engine, Session  # SQLModel 및 세션 관련 모듈 import
+from sqlmodel.ext.asyncio.session import AsyncSession  # exec() 를 지원하는 SQLModel 비동기 세션
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 from sqlalchemy.orm import sessionmaker
 from models.users import User  # User 모델 import
 from models.MoveInInfo import MoveInInfo  # 전입 신고 모델 import
 from models.files import Files  # 파일 모델 import
+from models.jobs import JobCheckpoint  # 배치 작업 진행 위치 모델 import
+from models.stats import MoveInDailyStats  # 전입 신고 일별 통계 모델 import
+from models.region import RegionCode  # 법정동코드 모델 import
+from database.pool_metrics import sync_pool_stats, async_pool_stats, pool_options
+from database.query_metrics import query_stats
 
-# settings에서 불러온 DB URL로 엔진 생성
-engine = create_engine(settings.database_url, echo=True)
+# 동기 드라이버 → 비동기 드라이버 매핑 (운영: MySQL/aiomysql, 테스트: SQLite/aiosqlite)
+ASYNC_DRIVERS = {
+    "mysql": "mysql+aiomysql",
+    "sqlite": "sqlite+aiosqlite",
+}
 
-# 테이블 생성
-def conn():
-    SQLModel.metadata.create_all(engine)
+# 비동기 엔진용 URL 결정
+def get_async_database_url() -> str:
+    if settings.async_database_url:
+        return settings.async_database_url
+    url = make_url(settings.database_url)
+    return url.set(drivername=ASYNC_DRIVERS[url.get_backend_name()]).render_as_string(hide_password=False)
+
+# settings에서 불러온 DB URL로 엔진 생성 (풀 크기/재활용/pre-ping 은 settings 에서 설정)
+# SQL 문 로그는 echo 대신 sqlalchemy.engine 로거로 남김 (DB_ECHO, config/log_config.py)
+engine = create_engine(
+    settings.database_url,
+    **pool_options(make_url(settings.database_url), sync_pool_stats),
+)
+sync_pool_stats.attach(engine)
+query_stats.attach(engine)
+
+# async def 라우트에서 사용할 비동기 엔진
+async_engine = create_async_engine(
+    get_async_database_url(),
+    **pool_options(make_url(get_async_database_url()), async_pool_stats, is_async=True),
+)
+async_pool_stats.attach(async_engine.sync_engine)
+query_stats.attach(async_engine.sync_engine)
 
 # 세션 제공
 def get_session():
@@ -18,4 +49,12 @@ def get_session():
         yield session
 
 # 세션 로컬 생성
-SessionLocal = sessionmaker(bind=engine, class_=Session, autocommit=False, autoflush=False)
\ No newline at end of file
+SessionLocal = sessionmaker(bind=engine, class_=Session, autocommit=False, autoflush=False)
+
+# 비동기 세션 팩토리 (commit 후 속성 접근 시 지연 로딩이 일어나지 않도록 expire_on_commit=False)
+AsyncSessionLocal = async_sessionmaker(async_engine, class_=AsyncSession, expire_on_commit=False)
+
+# 비동기 세션 제공 (async def 라우트 전용)
+async def get_async_session():
+    async with AsyncSessionLocal() as session:
+        yield session
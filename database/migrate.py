@@ -0,0 +1,88 @@
+# 스키마 생성/변경 + 관리자 계정 생성 (배포 시 한 번만 실행하는 명령)
+# 애플리케이션 기동 시에는 실행하지 않으므로 새 인스턴스의 준비 시간에 포함되지 않음
+#
+#   python -m database.migrate
+import logging
+
+from sqlalchemy import false, inspect, text, update
+from sqlalchemy.sql.elements import ClauseElement
+from sqlmodel import Session, SQLModel, select
+
+from admin import create_admin_user
+from config.settings import settings
+from database.connection import engine
+from models.MoveInInfo import MoveInInfo
+from models.stats import MoveInDailyStats
+from service.movein_stats import rebuild_stats
+
+logger = logging.getLogger(__name__)
+
+
+# 컬럼 추가 DDL (기존 행이 있으므로 NOT NULL 은 서버 기본값이 있을 때만 지정)
+def _add_column_ddl(table, column) -> str:
+    preparer = engine.dialect.identifier_preparer
+    ddl = (
+        f"ALTER TABLE {preparer.quote(table.name)} ADD COLUMN {preparer.quote(column.name)} "
+        f"{column.type.compile(dialect=engine.dialect)}"
+    )
+    if column.server_default is not None:
+        default = column.server_default.arg
+        if isinstance(default, ClauseElement):
+            default = default.compile(dialect=engine.dialect)
+        else:
+            default = f"'{default}'"
+        ddl += f" DEFAULT {default}"
+        if not column.nullable:
+            ddl += " NOT NULL"
+    return ddl
+
+
+# 테이블 생성 + 기존 테이블에 모델에만 있는 컬럼/인덱스 추가 (create_all 은 기존 테이블을 변경하지 않음)
+# 이미 반영된 항목은 건너뛰므로 여러 번 실행해도 결과가 같음
+def upgrade_schema() -> None:
+    SQLModel.metadata.create_all(engine)
+
+    inspector = inspect(engine)
+    for table in SQLModel.metadata.sorted_tables:
+        existing = {column["name"] for column in inspector.get_columns(table.name)}
+        missing = [column for column in table.columns if column.name not in existing]
+        with engine.begin() as connection:
+            for column in missing:
+                connection.execute(text(_add_column_ddl(table, column)))
+                logger.info("컬럼 추가", extra={"table": table.name, "column": column.name})
+            for index in table.indexes:
+                index.create(connection, checkfirst=True)
+
+
+# 데이터 정리 (이미 정리된 경우 갱신되는 행이 없으므로 여러 번 실행해도 결과가 같음)
+def normalize_data() -> None:
+    with engine.begin() as connection:
+        # 미승인을 NULL 대신 False 로 통일해야 승인 대기 목록이 (isApproval, id) 인덱스를 사용
+        result = connection.execute(
+            update(MoveInInfo).where(MoveInInfo.isApproval.is_(None)).values(isApproval=false(), version=MoveInInfo.version + 1)
+        )
+        if result.rowcount:
+            logger.info("미승인 상태 정리", extra={"rows": result.rowcount})
+
+    # 통계 테이블을 새로 만든 경우 기존 신고로 한 번 채움 (이후에는 신고 변경 시 변경분만 반영)
+    with Session(engine) as session:
+        has_stats = session.exec(select(MoveInDailyStats.day).limit(1)).first() is not None
+        has_moveins = session.exec(select(MoveInInfo.id).limit(1)).first() is not None
+        if has_moveins and not has_stats:
+            days = rebuild_stats(session, settings.movein_backfill_batch_size)
+            logger.info("전입 신고 통계 생성", extra={"days": days})
+
+
+def migrate() -> None:
+    upgrade_schema()
+    normalize_data()
+    if create_admin_user():
+        logger.info("관리자 계정 생성")
+
+
+if __name__ == "__main__":
+    from config.log_config import setup_logging
+
+    setup_logging()
+    migrate()
+    logger.info("마이그레이션 완료")
@@ -0,0 +1,117 @@
+from collections import deque
+from threading import Lock
+from time import monotonic, perf_counter
+
+from sqlalchemy import event
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from config.settings import settings
+
+# 커넥션 풀 통계 수집기
+# - 생성/체크아웃 횟수는 풀 이벤트로, 대기 시간은 풀 클래스의 _do_get 을 감싸서 측정
+# - 현재 체크아웃/오버플로 수는 조회 시점에 풀에서 직접 읽음
+class PoolStats:
+    # 커넥션 생성률 계산에 사용할 구간(초)
+    RATE_WINDOW = 60
+
+    def __init__(self, name: str):
+        self.name = name
+        self.started_at = monotonic()
+        self.connections_created = 0
+        self.checkouts = 0
+        self.wait_count = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+        self._recent_connects = deque()
+        self._lock = Lock()
+        self._engine = None
+
+    def attach(self, engine):
+        self._engine = engine
+        event.listen(engine, "connect", self._on_connect)
+        event.listen(engine, "checkout", self._on_checkout)
+
+    def _on_connect(self, dbapi_connection, connection_record):
+        now = monotonic()
+        with self._lock:
+            self.connections_created += 1
+            self._recent_connects.append(now)
+
+    def _on_checkout(self, dbapi_connection, connection_record, connection_proxy):
+        with self._lock:
+            self.checkouts += 1
+
+    def record_wait(self, seconds: float):
+        with self._lock:
+            self.wait_count += 1
+            self.wait_seconds_total += seconds
+            if seconds > self.wait_seconds_max:
+                self.wait_seconds_max = seconds
+
+    def snapshot(self) -> dict:
+        pool = self._engine.pool if self._engine is not None else None
+        now = monotonic()
+        with self._lock:
+            while self._recent_connects and now - self._recent_connects[0] > self.RATE_WINDOW:
+                self._recent_connects.popleft()
+            data = {
+                "pool_class": type(pool).__name__ if pool is not None else None,
+                "uptime_seconds": round(now - self.started_at, 3),
+                "connections_created": self.connections_created,
+                "connections_created_per_minute": len(self._recent_connects) * 60 / self.RATE_WINDOW,
+                "checkouts": self.checkouts,
+                "wait_count": self.wait_count,
+                "wait_seconds_total": round(self.wait_seconds_total, 6),
+                "wait_seconds_avg": round(self.wait_seconds_total / self.wait_count, 6) if self.wait_count else 0.0,
+                "wait_seconds_max": round(self.wait_seconds_max, 6),
+            }
+
+        # QueuePool 계열만 크기/오버플로 정보를 제공
+        if isinstance(pool, QueuePool):
+            data.update({
+                "pool_size": pool.size(),
+                "checked_out": pool.checkedout(),
+                "checked_in": pool.checkedin(),
+                "overflow": max(pool.overflow(), 0),
+            })
+        return data
+
+
+# 대기 시간을 측정하는 풀 클래스 생성
+# (dispose 시 풀이 self.__class__ 로 재생성되므로 통계 객체는 클래스 속성으로 보관)
+def timed_pool_class(base, stats: PoolStats):
+    def _do_get(self):
+        start = perf_counter()
+        try:
+            return base._do_get(self)
+        finally:
+            stats.record_wait(perf_counter() - start)
+
+    return type(f"Timed{base.__name__}", (base,), {"_do_get": _do_get})
+
+
+sync_pool_stats = PoolStats("sync")
+async_pool_stats = PoolStats("async")
+
+
+# 엔진 생성 시 넘길 풀 옵션 (SQLite 는 기본 풀을 그대로 사용)
+def pool_options(url, stats: PoolStats, is_async: bool = False) -> dict:
+    if url.get_backend_name() == "sqlite":
+        return {}
+    base = AsyncAdaptedQueuePool if is_async else QueuePool
+    return {
+        "poolclass": timed_pool_class(base, stats),
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+        "pool_recycle": settings.db_pool_recycle,
+        "pool_pre_ping": settings.db_pool_pre_ping,
+    }
+
+
+# 전체 풀 통계 (내부 모니터링 엔드포인트용)
+def pool_snapshot() -> dict:
+    return {
+        sync_pool_stats.name: sync_pool_stats.snapshot(),
+        async_pool_stats.name: async_pool_stats.snapshot(),
+    }
@@ -0,0 +1,57 @@
+from contextvars import ContextVar
+from threading import Lock
+from time import perf_counter
+from typing import Optional
+
+from sqlalchemy import event
+
+
+# 요청 하나에서 실행된 쿼리 수/DB 시간 (메트릭 미들웨어가 요청마다 생성)
+class RequestQueries:
+    __slots__ = ("count", "seconds")
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+
+
+# 현재 요청의 쿼리 집계 대상 (요청 밖에서 실행된 쿼리는 None)
+# 동기 라우트의 스레드 풀, 비동기 드라이버의 greenlet 으로도 컨텍스트가 전달됨
+current_request_queries: ContextVar[Optional[RequestQueries]] = ContextVar("current_request_queries", default=None)
+
+
+# 쿼리 통계 수집기 (엔진 전체 누적 + 현재 요청 집계)
+class QueryStats:
+    def __init__(self):
+        self.queries = 0
+        self.seconds_total = 0.0
+        self._lock = Lock()
+
+    def attach(self, engine):
+        event.listen(engine, "before_cursor_execute", self._before_execute)
+        event.listen(engine, "after_cursor_execute", self._after_execute)
+
+    def _before_execute(self, conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_started", []).append(perf_counter())
+
+    def _after_execute(self, conn, cursor, statement, parameters, context, executemany):
+        started = conn.info.get("query_started")
+        if not started:
+            return
+        seconds = perf_counter() - started.pop()
+
+        with self._lock:
+            self.queries += 1
+            self.seconds_total += seconds
+
+        request_queries = current_request_queries.get()
+        if request_queries is not None:
+            request_queries.count += 1
+            request_queries.seconds += seconds
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {"queries": self.queries, "seconds_total": self.seconds_total}
+
+
+query_stats = QueryStats()
@@ -0,0 +1,69 @@
+# 전입 신고 지역 코드 백필
+# 전출지/전입지 주소에서 지역 코드를 다시 계산해 값이 달라진 행만 갱신
+# (지역 코드 컬럼 추가 이전 신고, 또는 법정동코드를 새로 적재해서 더 정확히 찾을 수 있게 된 경우)
+# id 순으로 batch_size 건씩 처리하고 매 batch 마다 commit 하므로 중간에 멈춰도 다시 실행하면 됨
+#
+#   python -m jobs.backfill_regions --batch-size 1000
+import argparse
+from time import perf_counter
+
+from sqlalchemy import bindparam, update
+from sqlmodel import Session, select
+
+from config.settings import settings
+from database.connection import engine
+from database.migrate import upgrade_schema
+from models.MoveInInfo import MoveInInfo
+from service.region import region_columns
+
+REGION_FIELDS = ("beforeSido", "beforeSigungu", "beforeEmd", "afterSido", "afterSigungu", "afterEmd")
+
+
+def backfill(batch_size: int) -> dict:
+    scanned = updated = 0
+    last_id = 0
+    started = perf_counter()
+    statement = (
+        update(MoveInInfo)
+        .where(MoveInInfo.id == bindparam("row_id"))
+        # 목록 응답 내용이 바뀌므로 ETag 용 version 도 올림
+        .values(**{field: bindparam(f"new_{field}") for field in REGION_FIELDS}, version=MoveInInfo.version + 1)
+    )
+
+    with Session(engine) as session:
+        while True:
+            rows = session.exec(
+                select(MoveInInfo.id, MoveInInfo.beforeAddr, MoveInInfo.afterAddr,
+                       *(getattr(MoveInInfo, field) for field in REGION_FIELDS))
+                .where(MoveInInfo.id > last_id)
+                .order_by(MoveInInfo.id)
+                .limit(batch_size)
+            ).all()
+            if not rows:
+                break
+            last_id = rows[-1][0]
+            scanned += len(rows)
+
+            params = []
+            for row_id, before_addr, after_addr, *current in rows:
+                columns = region_columns(before_addr, after_addr)
+                if [columns[field] for field in REGION_FIELDS] != current:
+                    params.append({"row_id": row_id, **{f"new_{field}": columns[field] for field in REGION_FIELDS}})
+
+            if params:
+                session.connection().execute(statement, params)
+            session.commit()
+            updated += len(params)
+            print(f"[🔁 백필 진행] id<={last_id} 확인 {scanned}건 / 갱신 {updated}건")
+
+    return {"scanned": scanned, "updated": updated, "elapsed_seconds": round(perf_counter() - started, 3)}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="전입 신고 지역 코드 백필")
+    parser.add_argument("--batch-size", type=int, default=settings.movein_backfill_batch_size)
+    args = parser.parse_args()
+
+    # 기존 DB 에 지역 코드 컬럼/인덱스가 없으면 추가
+    upgrade_schema()
+    print(f"[✅ 백필 완료] {backfill(args.batch_size)}")
@@ -0,0 +1,67 @@
+# 주민번호 블라인드 인덱스(rrnIndex) 백필 작업
+# 컬럼 추가 이전에 저장된 신고(rrnIndex 가 NULL)를 batch_size 건씩 복호화해 인덱스를 채움
+# 처리한 행은 NULL 이 아니게 되므로 중간에 멈춰도 다시 실행하면 남은 행부터 이어서 처리
+#
+#   python -m jobs.backfill_rrn_index --batch-size 1000
+#   python -m jobs.backfill_rrn_index --all   # RRN_INDEX_KEY 변경 후 전체 재계산
+import argparse
+from time import perf_counter
+
+from sqlalchemy import bindparam, update
+from sqlmodel import Session, select
+
+from auth.hash_rrn import decrypt_rrns_batch, rrn_blind_index
+from config.settings import settings
+from database.connection import engine
+from database.migrate import upgrade_schema
+from models.MoveInInfo import MoveInInfo
+
+
+def backfill(batch_size: int, recompute: bool = False) -> dict:
+    updated = failed = 0
+    last_id = 0
+    started = perf_counter()
+    statement = (
+        update(MoveInInfo)
+        .where(MoveInInfo.id == bindparam("row_id"))
+        # 목록 응답 내용이 바뀌므로 ETag 용 version 도 올림
+        .values(rrnIndex=bindparam("index_value"), version=MoveInInfo.version + 1)
+    )
+
+    with Session(engine) as session:
+        while True:
+            query = select(MoveInInfo.id, MoveInInfo.rrn).where(MoveInInfo.id > last_id)
+            if not recompute:
+                query = query.where(MoveInInfo.rrnIndex.is_(None))
+            rows = session.exec(query.order_by(MoveInInfo.id).limit(batch_size)).all()
+            if not rows:
+                break
+            last_id = rows[-1][0]
+
+            # 복호화는 프로세스 풀에서 병렬 처리, 복호화 실패 행은 NULL 로 남기고 건너뜀
+            plains = decrypt_rrns_batch([rrn for _, rrn in rows])
+            params = [
+                {"row_id": row_id, "index_value": rrn_blind_index(plain)}
+                for (row_id, _), plain in zip(rows, plains)
+                if plain is not None
+            ]
+            failed += len(rows) - len(params)
+
+            if params:
+                session.connection().execute(statement, params)
+            session.commit()
+            updated += len(params)
+            print(f"[🔁 백필 진행] id<={last_id} 갱신 {updated}건 / 실패 {failed}건")
+
+    return {"updated": updated, "failed": failed, "elapsed_seconds": round(perf_counter() - started, 3)}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="주민번호 블라인드 인덱스 백필")
+    parser.add_argument("--batch-size", type=int, default=settings.movein_backfill_batch_size)
+    parser.add_argument("--all", action="store_true", help="이미 채워진 행도 다시 계산 (인덱스 키 변경 시)")
+    args = parser.parse_args()
+
+    # 기존 DB 에 rrnIndex 컬럼/인덱스가 없으면 추가
+    upgrade_schema()
+    print(f"[✅ 백필 완료] {backfill(args.batch_size, recompute=args.all)}")
@@ -0,0 +1,51 @@
+# 법정동코드 적재
+# 행정표준코드관리시스템(code.go.kr)의 "법정동코드 전체자료"(탭 구분: 법정동코드, 법정동명, 폐지여부)를 읽어
+# 폐지되지 않은 시도/시군구/읍면동 코드로 RegionCode 테이블을 교체 (리 단위는 제외)
+# 처음 적재하면 실행 중인 애플리케이션이 REGION_RELOAD_SECONDS 안에 읽어 들이고, 기존 코드를 교체한 경우에는 재시작해야 반영
+# 적재 후 python -m jobs.backfill_regions 로 기존 신고의 지역 코드를 다시 계산
+#
+#   python -m jobs.load_region_codes 법정동코드_전체자료.txt --encoding cp949
+import argparse
+
+from sqlalchemy import delete, insert
+from sqlmodel import Session
+
+from database.connection import engine
+from database.migrate import upgrade_schema
+from models.region import RegionCode
+
+
+def read_codes(path: str, encoding: str, delimiter: str) -> list:
+    rows = []
+    with open(path, encoding=encoding) as file:
+        for line in file:
+            fields = [field.strip() for field in line.rstrip("\r\n").split(delimiter)]
+            if len(fields) < 2 or not (fields[0].isdigit() and len(fields[0]) == 10):
+                continue  # 머리글/빈 줄
+            code, name = fields[0], " ".join(fields[1].split())
+            if len(fields) > 2 and fields[2] != "존재":
+                continue  # 폐지된 코드
+            if code[8:] != "00":
+                continue  # 리 단위
+            rows.append({"code": code, "name": name})
+    return rows
+
+
+def load(rows: list, batch_size: int = 1000) -> int:
+    with Session(engine) as session:
+        session.exec(delete(RegionCode))
+        for start in range(0, len(rows), batch_size):
+            session.exec(insert(RegionCode), params=rows[start:start + batch_size])
+        session.commit()
+    return len(rows)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="법정동코드 적재")
+    parser.add_argument("path", help="법정동코드 전체자료 파일 경로")
+    parser.add_argument("--encoding", default="cp949")
+    parser.add_argument("--delimiter", default="\t")
+    args = parser.parse_args()
+
+    upgrade_schema()
+    print(f"[✅ 법정동코드 적재 완료] {load(read_codes(args.path, args.encoding, args.delimiter))}건")
@@ -0,0 +1,31 @@
+# 전입 신고 일별 통계(MoveInDailyStats) 전체 재계산
+# 평소에는 신고 등록/승인/수정/삭제 시 변경분만 반영하므로, 통계 테이블을 처음 만들었을 때나
+# DB 를 직접 수정해서 값이 어긋났을 때 실행 (신고 전체를 batch_size 건씩 읽어 다시 집계)
+#
+#   python -m jobs.rebuild_movein_stats --batch-size 5000
+import argparse
+from time import perf_counter
+
+from sqlmodel import Session
+
+from config.settings import settings
+from database.connection import engine
+from database.migrate import upgrade_schema
+from service.movein_stats import rebuild_stats
+
+
+def rebuild(batch_size: int) -> dict:
+    started = perf_counter()
+    with Session(engine) as session:
+        days = rebuild_stats(session, batch_size)
+    return {"days": days, "elapsed_seconds": round(perf_counter() - started, 3)}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="전입 신고 일별 통계 재계산")
+    parser.add_argument("--batch-size", type=int, default=settings.movein_backfill_batch_size)
+    args = parser.parse_args()
+
+    # 기존 DB 에 통계 테이블이 없으면 생성
+    upgrade_schema()
+    print(f"[✅ 통계 재계산 완료] {rebuild(args.batch_size)}")
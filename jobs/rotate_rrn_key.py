@@ -0,0 +1,118 @@
+# 주민번호 암호화 키 교체 재암호화 작업
+# 1) RRN_SECRET_KEY 를 새 키로, RRN_PREVIOUS_KEYS 에 기존 키를 넣고 배포 (조회는 두 키 모두로 가능)
+# 2) 이 작업으로 전체 행을 새 키로 재암호화 (블라인드 인덱스는 RRN_INDEX_KEY 로 계산하므로 그대로)
+# 3) 완료 후 RRN_PREVIOUS_KEYS 에서 기존 키 제거
+#
+# id 기준 키셋 방식으로 chunk_size 건씩 읽고, 암복호화는 프로세스 풀에서 병렬 처리하며,
+# chunk 마다 행 갱신과 진행 위치(JobCheckpoint)를 같은 트랜잭션으로 commit 하므로 중단 후 다시 실행하면 이어서 처리
+#
+#   python -m jobs.rotate_rrn_key --chunk-size 1000
+#   python -m jobs.rotate_rrn_key --restart   # 진행 위치를 지우고 처음부터 (다음 키 교체 시)
+import argparse
+from datetime import datetime
+from time import perf_counter
+
+from sqlalchemy import bindparam, func, update
+from sqlmodel import Session, select
+
+from auth.hash_rrn import rotate_rrns_batch
+from config.settings import settings
+from database.connection import engine
+from database.migrate import upgrade_schema
+from models.jobs import JobCheckpoint
+from models.MoveInInfo import MoveInInfo
+
+JOB_NAME = "rrn_key_rotation"
+
+
+def load_checkpoint(session: Session, restart: bool) -> JobCheckpoint:
+    checkpoint = session.get(JobCheckpoint, JOB_NAME)
+    if checkpoint and restart:
+        session.delete(checkpoint)
+        session.commit()
+        checkpoint = None
+    if not checkpoint:
+        checkpoint = JobCheckpoint(name=JOB_NAME, startedDt=datetime.now())
+        session.add(checkpoint)
+        session.commit()
+    return checkpoint
+
+
+def rotate(chunk_size: int, restart: bool = False) -> dict:
+    # 행 갱신 시 읽은 암호문과 같을 때만 덮어써서, 작업 중 API 로 수정된 행을 옛 값으로 되돌리지 않음
+    statement = (
+        update(MoveInInfo)
+        .where(MoveInInfo.id == bindparam("row_id"), MoveInInfo.rrn == bindparam("old_rrn"))
+        # 목록 응답의 암호문이 바뀌므로 ETag 용 version 도 올림
+        .values(rrn=bindparam("new_rrn"), version=MoveInInfo.version + 1)
+    )
+
+    with Session(engine) as session:
+        checkpoint = load_checkpoint(session, restart)
+        if checkpoint.finishedDt:
+            print(f"[✅ 이미 완료된 작업] {checkpoint.finishedDt} (다시 실행하려면 --restart)")
+            return {"processed": checkpoint.processed, "failed": checkpoint.failed, "elapsed_seconds": 0.0, "rows_per_second": 0.0}
+
+        remaining = session.exec(select(func.count()).select_from(MoveInInfo).where(MoveInInfo.id > checkpoint.lastId)).one()
+        print(f"[▶ 재암호화 시작] id>{checkpoint.lastId} 부터 {remaining}건 (누적 {checkpoint.processed}건 처리됨)")
+
+        done = 0
+        started = perf_counter()
+        while True:
+            rows = session.exec(
+                select(MoveInInfo.id, MoveInInfo.rrn)
+                .where(MoveInInfo.id > checkpoint.lastId)
+                .order_by(MoveInInfo.id)
+                .limit(chunk_size)
+            ).all()
+            if not rows:
+                break
+
+            results = rotate_rrns_batch([rrn for _, rrn in rows])
+            params = [
+                {"row_id": row_id, "old_rrn": rrn, "new_rrn": new_rrn}
+                for (row_id, rrn), new_rrn in zip(rows, results)
+                if new_rrn is not None
+            ]
+            if params:
+                session.connection().execute(statement, params)
+
+            # 행 갱신과 진행 위치를 한 트랜잭션으로 commit
+            checkpoint.lastId = rows[-1][0]
+            checkpoint.processed += len(params)
+            checkpoint.failed += len(rows) - len(params)
+            checkpoint.updatedDt = datetime.now()
+            session.add(checkpoint)
+            session.commit()
+
+            done += len(rows)
+            elapsed = perf_counter() - started
+            rate = done / elapsed if elapsed else 0.0
+            eta = (remaining - done) / rate if rate else 0.0
+            print(
+                f"[🔁 재암호화 진행] {done}/{remaining} ({done / max(remaining, 1):.1%}) "
+                f"id<={checkpoint.lastId} {rate:.1f} rows/s, 남은 시간 약 {max(eta, 0):.1f}s"
+            )
+
+        checkpoint.finishedDt = datetime.now()
+        session.add(checkpoint)
+        session.commit()
+
+        elapsed = perf_counter() - started
+        return {
+            "processed": checkpoint.processed,
+            "failed": checkpoint.failed,
+            "elapsed_seconds": round(elapsed, 3),
+            "rows_per_second": round(done / elapsed, 1) if elapsed else 0.0,
+        }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="주민번호 암호화 키 교체 재암호화")
+    parser.add_argument("--chunk-size", type=int, default=settings.rrn_rotation_chunk_size)
+    parser.add_argument("--restart", action="store_true", help="저장된 진행 위치를 무시하고 처음부터 실행")
+    args = parser.parse_args()
+
+    # JobCheckpoint 테이블과 rrnIndex 컬럼이 없으면 추가
+    upgrade_schema()
+    print(f"[✅ 재암호화 완료] {rotate(args.chunk_size, restart=args.restart)}")
@@ -1,22 +1,45 @@
+import asyncio
+import logging
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 import uvicorn
 from contextlib import asynccontextmanager
-from database.connection import conn
-from admin import create_admin_user
+from database.connection import AsyncSessionLocal
+from database.migrate import migrate
 from routes.users import user_router
 from routes.MoveInInfo import moveininfo_router
+from routes.internal import internal_router, metrics_router
+from routes.files import file_router
+from config.settings import settings
+from auth.hash_rrn import get_index_key
+from config.log_config import setup_logging
+from service.metrics import MetricsMiddleware
+from service.region import load_region_index, reload_region_index_until_loaded
+
+# 로그는 큐를 거쳐 별도 스레드에서 JSON 으로 출력 (요청 처리 중 stdout 쓰기를 기다리지 않음)
+setup_logging()
+logger = logging.getLogger(__name__)
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # 애플리케이션 시작될 때 실행되는 코드
-    print("애플리케이션 시작")
-    conn()
-    create_admin_user()
+    get_index_key()  # 주민번호 검색 인덱스 키가 없으면 요청을 받기 전에 시작 실패
+    # 스키마/관리자 계정은 배포 시 python -m database.migrate 로 한 번만 처리 (로컬 개발은 AUTO_MIGRATE=true)
+    if settings.auto_migrate:
+        migrate()
+    # 주소 → 지역 코드 변환용 법정동코드 색인 (요청 처리 중에는 DB 에서 다시 읽지 않음)
+    async with AsyncSessionLocal() as session:
+        region_index = await load_region_index(session)
+    region_reload = None
+    if not region_index.loaded:
+        region_reload = asyncio.create_task(reload_region_index_until_loaded(settings.region_reload_seconds))
+    logger.info("애플리케이션 시작")
 
     yield
     # 애플리케이션 종료될 때 실행되는 코드
-    print("애플리케이션 종료")
+    if region_reload:
+        region_reload.cancel()
+    logger.info("애플리케이션 종료")
 
 app = FastAPI(lifespan=lifespan)
 
@@ -31,11 +54,19 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
     allow_headers=["*"], # 모든 헤더 허용
+    expose_headers=["ETag", "Last-Modified"], # 조건부 요청(If-None-Match)에 쓸 수 있도록 노출
 )
 
+# 요청 메트릭 수집 (가장 바깥에서 측정하도록 마지막에 등록)
+if settings.metrics_enabled:
+    app.add_middleware(MetricsMiddleware)
+
 # prefix는 app.py에 설정할 수도 있다.
 app.include_router(user_router, prefix="/users")
 app.include_router(moveininfo_router, prefix="/movein")
+app.include_router(internal_router, prefix="/internal")
+app.include_router(metrics_router)
+app.include_router(file_router, prefix=settings.local_storage_base_url)
 
 # import 될 때 실행되어서 2번 실행되는 문제를 방지하기 위해 명시적으로 import 할 파일을 직접 실행할 때만 실행되도록 명시적으로 해주는 문법
 # 어떻게 실행 되냐에 따라서 __name__이 변경 된다는 것 ( 파이썬을 모듈화해서 직접적으로 호출할 때는 __name__이 __main__으로 바뀌고, import 될 때는 __name__이 모듈 이름으로 바뀜  )
@@ -1,6 +1,7 @@
 import datetime
-from typing import Optional, TYPE_CHECKING
+from typing import List, Optional, TYPE_CHECKING
 from pydantic import EmailStr
+from sqlalchemy import Index
 from sqlmodel import Field, SQLModel, Relationship
 
 if TYPE_CHECKING:
@@ -9,18 +10,43 @@ if TYPE_CHECKING:
 class MoveInInfo(SQLModel, table=True):
     __tablename__ = "MoveInInfo"
     id: Optional[int] = Field(default=None, primary_key=True)
-    name: str
+    name: str = Field(index=True)  # 이름 접두어 검색용 B-tree 인덱스
     rrn: str
+    rrnIndex: Optional[str] = Field(default=None, index=True, max_length=64)  # 주민번호 블라인드 인덱스 (HMAC), 일치 검색·중복 확인용
     email: str
     beforeAddr: str
     afterAddr: str
     regDt: Optional[datetime.datetime]
     approvalDt: Optional[datetime.datetime] = None
     moveInDt: Optional[datetime.datetime]
-    isApproval: Optional[bool] = None
+    isApproval: Optional[bool] = False  # 승인 여부 (미승인은 NULL 이 아닌 False 로 저장해야 인덱스 조회 가능)
+    # 변경 추적 (수정/승인 시 version 증가, ETag/Last-Modified 계산에 사용)
+    version: int = Field(default=1, nullable=False, sa_column_kwargs={"server_default": "1"})
+    updDt: Optional[datetime.datetime] = None
+    # 주소에서 추출한 법정동 기준 지역 코드 (시도 2자리 / 시군구 5자리 / 읍면동 8자리, 찾지 못한 단계는 NULL)
+    beforeSido: Optional[str] = Field(default=None, max_length=2)
+    beforeSigungu: Optional[str] = Field(default=None, max_length=5)
+    beforeEmd: Optional[str] = Field(default=None, max_length=8)
+    afterSido: Optional[str] = Field(default=None, max_length=2)
+    afterSigungu: Optional[str] = Field(default=None, max_length=5)
+    afterEmd: Optional[str] = Field(default=None, max_length=8)
     # user_id: Optional[int] = Field(default=None, foreign_key="User.id")
     userId: int = Field(foreign_key="User.id", alias="userId")
 
+    # 목록 조회용 복합 인덱스 (모두 id 내림차순 키셋 페이지네이션과 함께 사용)
+    __table_args__ = (
+        Index("ix_MoveInInfo_userId_id", "userId", "id"),  # 사용자별 "내 신고 내역" (userId 외래키 인덱스 역할도 함)
+        Index("ix_MoveInInfo_isApproval_id", "isApproval", "id"),  # 승인 상태별 목록 (관리자 승인 대기)
+        Index("ix_MoveInInfo_regDt", "regDt"),  # 등록일 범위 조회/내보내기
+        # 지역별 목록/건수 (전출지/전입지 × 시도/시군구/읍면동)
+        Index("ix_MoveInInfo_beforeSido_id", "beforeSido", "id"),
+        Index("ix_MoveInInfo_beforeSigungu_id", "beforeSigungu", "id"),
+        Index("ix_MoveInInfo_beforeEmd_id", "beforeEmd", "id"),
+        Index("ix_MoveInInfo_afterSido_id", "afterSido", "id"),
+        Index("ix_MoveInInfo_afterSigungu_id", "afterSigungu", "id"),
+        Index("ix_MoveInInfo_afterEmd_id", "afterEmd", "id"),
+    )
+
 
 # 전입 신고 수정 모델
 class MoveInInfoUpdate(SQLModel):
@@ -46,4 +72,50 @@ class MoveInInfoResponse(SQLModel):
     approvalDt: Optional[datetime.datetime]
     moveInDt: Optional[datetime.date]
     isApproval: Optional[bool] 
-    userId: int = Field(foreign_key="User.id", alias="userId")
\ No newline at end of file
+    userId: int = Field(foreign_key="User.id", alias="userId")
+
+# 전입 신고 대량 등록 시 한 행의 입력 모델 (CSV/NDJSON)
+class MoveInInfoImport(SQLModel):
+    name: str
+    rrn: str
+    email: EmailStr
+    beforeAddr: str
+    afterAddr: str
+    moveInDt: Optional[datetime.datetime] = None
+
+# 주민번호 일치 검색 요청 모델 (주민번호가 URL/접근 로그에 남지 않도록 본문으로 받음)
+class MoveInRrnLookup(SQLModel):
+    rrn: str
+
+# 전입 신고 일괄 승인 요청 모델 (ids 또는 pendingBefore 중 하나 지정)
+class MoveInBulkApproval(SQLModel):
+    ids: Optional[List[int]] = None  # 승인할 전입 신고 id 목록
+    pendingBefore: Optional[datetime.datetime] = None  # 이 시각 이전에 등록된 미승인 신고 전체
+
+# 전입 신고 목록/수정 응답 항목 (MoveInInfo 에서 블라인드 인덱스 rrnIndex 만 제외)
+# rrnIndex 는 같은 사람의 신고끼리 연결할 수 있는 값이므로 클라이언트에 내보내지 않음
+class MoveInInfoItem(SQLModel):
+    id: int
+    name: str
+    rrn: str
+    email: str
+    beforeAddr: str
+    afterAddr: str
+    regDt: Optional[datetime.datetime]
+    approvalDt: Optional[datetime.datetime] = None
+    moveInDt: Optional[datetime.datetime]
+    isApproval: Optional[bool] = False
+    version: int
+    updDt: Optional[datetime.datetime] = None
+    beforeSido: Optional[str] = None
+    beforeSigungu: Optional[str] = None
+    beforeEmd: Optional[str] = None
+    afterSido: Optional[str] = None
+    afterSigungu: Optional[str] = None
+    afterEmd: Optional[str] = None
+    userId: int
+
+# 전입 신고 목록 페이지 (커서 기반)
+class MoveInInfoPage(SQLModel):
+    items: List[MoveInInfoItem]
+    next_cursor: Optional[int] = None  # 다음 페이지 요청 시 after 로 전달할 값 (없으면 마지막 페이지)
@@ -1,5 +1,5 @@
-from sqlmodel import SQLModel, Field
-from typing import Optional, TYPE_CHECKING
+from sqlmodel import SQLModel, Field, Relationship
+from typing import List, Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from models.users import User
@@ -8,12 +8,29 @@ class Files(SQLModel, table=True):
     __tablename__ = "Files"  # 대문자 그대로 사용되도록 명시
 
     fileSeq: Optional[int] = Field(default=None, primary_key=True, description="저장 순번")
-    userId: Optional[int] = Field(default=None, foreign_key="User.id")
+    userId: Optional[int] = Field(default=None, foreign_key="User.id", index=True)  # 사용자별 프로필 이미지 조회
     fileName: str = Field(nullable=False, max_length=130, description="저장된 이미지 파일 이름")
     filePath: str = Field(nullable=False, max_length=150, description="저장된 이미지 파일의 파일 저장 경로")
     orgFileName: str = Field(nullable=False, max_length=100, description="원래 파일 이름")
     fileSize: str = Field(nullable=False, max_length=50, description="파일 크기")
     fileUrl: str = Field(nullable=False, max_length=500, description="저장된 이미지 파일 URL")
+    digest: Optional[str] = Field(default=None, max_length=64, index=True, description="파일 내용 SHA-256 (중복 제거/참조 계수용)")
+
+    user: Optional["User"] = Relationship(back_populates="files")
+    variants: List["FileVariants"] = Relationship(back_populates="file")
+
+# 프로필 이미지 변환본 (썸네일)
+class FileVariants(SQLModel, table=True):
+    __tablename__ = "FileVariants"
+
+    variantSeq: Optional[int] = Field(default=None, primary_key=True, description="변환본 순번")
+    fileSeq: int = Field(foreign_key="Files.fileSeq", index=True, description="원본 파일 순번")
+    size: int = Field(nullable=False, description="긴 변 기준 크기(px)")
+    format: str = Field(nullable=False, max_length=10, description="이미지 형식")
+    fileSize: str = Field(nullable=False, max_length=50, description="파일 크기")
+    fileUrl: str = Field(nullable=False, max_length=500, description="변환본 파일 URL")
+
+    file: Optional[Files] = Relationship(back_populates="variants")
 
 class FilesInsert(SQLModel):
     userId: Optional[int] = Field(default=None, foreign_key="User.id")
@@ -22,3 +39,14 @@ class FilesInsert(SQLModel):
     orgFileName: str = Field(nullable=False, max_length=100, description="원래 파일 이름")
     fileSize: str = Field(nullable=False, max_length=50, description="파일 크기")
     fileUrl: str = Field(nullable=False, max_length=500, description="저장된 이미지 파일 URL")
+
+# 프로필 이미지 직접 업로드 URL 요청 모델
+class FileUploadRequest(SQLModel):
+    fileName: str = Field(max_length=100, description="원래 파일 이름")
+    contentType: str = Field(description="업로드할 파일의 Content-Type")
+    fileSize: int = Field(gt=0, description="업로드할 파일 크기(byte)")
+
+# 직접 업로드 완료 알림 모델
+class FileUploadComplete(SQLModel):
+    key: str = Field(description="upload-url 응답으로 받은 객체 키")
+    orgFileName: Optional[str] = Field(default=None, max_length=100, description="원래 파일 이름")
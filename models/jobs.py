@@ -0,0 +1,16 @@
+import datetime
+from typing import Optional
+from sqlmodel import Field, SQLModel
+
+
+# 배치 작업 진행 위치 (중단 후 재실행 시 lastId 다음 행부터 이어서 처리)
+class JobCheckpoint(SQLModel, table=True):
+    __tablename__ = "JobCheckpoint"
+
+    name: str = Field(primary_key=True, max_length=50, description="작업 이름")
+    lastId: int = Field(default=0, description="마지막으로 처리(commit)한 행 id")
+    processed: int = Field(default=0, description="누적 처리 건수")
+    failed: int = Field(default=0, description="누적 실패 건수")
+    startedDt: Optional[datetime.datetime] = Field(default=None, description="작업 최초 시작 시각")
+    updatedDt: Optional[datetime.datetime] = Field(default=None, description="마지막 commit 시각")
+    finishedDt: Optional[datetime.datetime] = Field(default=None, description="완료 시각 (NULL 이면 진행 중)")
@@ -0,0 +1,26 @@
+from typing import List, Optional
+from sqlmodel import Field, SQLModel
+
+
+# 법정동코드 (행정표준코드관리시스템 "법정동코드 전체자료", python -m jobs.load_region_codes 로 적재)
+# 코드 10자리 = 시도 2 + 시군구 3 + 읍면동 3 + 리 2 (리 단위는 적재하지 않음)
+class RegionCode(SQLModel, table=True):
+    __tablename__ = "RegionCode"
+
+    code: str = Field(primary_key=True, max_length=10, description="법정동코드")
+    name: str = Field(nullable=False, max_length=100, description="법정동명 (예: 서울특별시 종로구 청운동)")
+
+
+# 지역별 건수 응답 항목 (code 가 null 이면 주소에서 해당 단계를 찾지 못한 신고)
+class RegionCount(SQLModel):
+    code: Optional[str] = None
+    name: Optional[str] = None
+    count: int
+
+
+# 지역별 건수 응답
+class RegionCounts(SQLModel):
+    side: str  # before: 전출지, after: 전입지
+    region: Optional[str] = None  # 상위 지역 코드 (없으면 시도별)
+    total: int
+    items: List[RegionCount]
@@ -0,0 +1,34 @@
+import datetime
+from typing import List, Optional
+from sqlalchemy import BigInteger
+from sqlmodel import Field, SQLModel
+
+
+# 등록일별 전입 신고 집계 (관리자 대시보드용)
+# 신고 등록/승인/수정/삭제 시 변경분만 더하고, 전체 재계산은 python -m jobs.rebuild_movein_stats
+class MoveInDailyStats(SQLModel, table=True):
+    __tablename__ = "MoveInDailyStats"
+
+    day: datetime.date = Field(primary_key=True, description="등록일 (regDt 기준)")
+    total: int = Field(default=0, description="등록 건수")
+    approved: int = Field(default=0, description="승인 건수 (미승인 = total - approved)")
+    approvalSeconds: int = Field(default=0, sa_type=BigInteger, description="승인 소요 시간(approvalDt - regDt) 합계(초)")
+    approvalSamples: int = Field(default=0, description="승인 소요 시간 합계에 포함된 건수")
+
+
+# 통계 응답: 하루 단위 항목
+class MoveInDailyStatsItem(SQLModel):
+    day: datetime.date
+    total: int
+    approved: int
+    pending: int
+    avgApprovalSeconds: Optional[float] = None  # 승인까지 평균 소요 시간(초), 승인 건이 없으면 null
+
+
+# 통계 응답: 조회 기간 합계 + 일별 항목
+class MoveInStats(SQLModel):
+    total: int
+    approved: int
+    pending: int
+    avgApprovalSeconds: Optional[float] = None
+    days: List[MoveInDailyStatsItem]
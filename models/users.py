@@ -4,6 +4,9 @@ from sqlmodel import Field, Relationship, SQLModel, Column
 from sqlalchemy import String, CheckConstraint, DateTime
 from datetime import datetime
 
+if TYPE_CHECKING:
+    from models.files import Files
+
 # 실제 DB의 User 테이블을 정의하는 모델
 class User(SQLModel, table=True):
     __tablename__ = "User"  # 대문자 그대로 사용되도록 명시
@@ -18,6 +21,7 @@ class User(SQLModel, table=True):
         default_factory=datetime.utcnow,
         sa_column=Column(DateTime, default=datetime.utcnow)
     )
+    files: List["Files"] = Relationship(back_populates="user") # 프로필 이미지 (Files.userId)
     __table_args__ = ( # 추가적인 제약조건: role은 'Y' 또는 'N'만 허용
         CheckConstraint("role IN ('Y', 'N')", name="ck_user_role_yn"),
     )
@@ -33,4 +37,18 @@ class UserSignUp(SQLModel):
     password: str       # 회원가입 비밀번호
     username: str       # 회원 이름
     role: str = Field(default="user")  # 사용자 권한 (기본값: user)
-    regDt: Optional[str] = Field(default=None, alias="reg_dt")  # 등록일 (예: 회원가입 일시)
\ No newline at end of file
+    regDt: Optional[str] = Field(default=None, alias="reg_dt")  # 등록일 (예: 회원가입 일시)
+
+# 관리자 사용자 목록의 한 항목 (비밀번호 해시 등은 제외한 응답용 모델)
+class UserSummary(SQLModel):
+    id: int
+    username: str
+    email: str
+    role: str
+    created_at: Optional[datetime] = None
+    profile_image_url: Optional[str] = None  # 요청한 size 에 가장 가까운 썸네일 (없으면 원본)
+
+# 사용자 목록 한 페이지
+class UserPage(SQLModel):
+    items: List[UserSummary]
+    next_cursor: Optional[int] = None  # 다음 페이지 요청 시 after 로 전달할 값 (없으면 마지막 페이지)
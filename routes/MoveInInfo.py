@@ -1,14 +1,30 @@
 # 수정 적용: 주민번호 암호화 후 저장
-from datetime import datetime
-from fastapi import APIRouter, HTTPException, Depends, status, Path, Query
+import logging
+from datetime import date, datetime
+from fastapi import APIRouter, HTTPException, Depends, status, Path, Query, UploadFile, File, Request, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from sqlmodel import Session, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 from typing import List, Optional
 
 from auth.authenticate import authenticate
-from database.connection import get_session
-from models.MoveInInfo import MoveInInfo, MoveInInfoUpdate, MoveInInfoResponse
+from database.connection import get_session, get_async_session
+from models.MoveInInfo import MoveInInfo, MoveInInfoUpdate, MoveInInfoResponse, MoveInInfoItem, MoveInInfoPage, MoveInBulkApproval, MoveInRrnLookup
+from models.stats import MoveInStats
+from models.region import RegionCount, RegionCounts
 from models.users import User
-from auth.hash_rrn import encrypt_rrn, decrypt_rrn  # 새 유틸 함수 임포트
+from auth.hash_rrn import encrypt_rrn, decrypt_rrn, rrn_blind_index  # 새 유틸 함수 임포트
+from config.settings import settings
+from service.movein_import import IMPORT_FORMATS, import_moveins
+from service.movein_approval import approve_moveins
+from service.movein_export import EXPORT_MEDIA_TYPES, build_export_query, stream_moveins
+from service.movein_query import LIST_COLUMNS, build_list_query, build_region_count_query
+from service.region import get_region_index, region_columns, region_level
+from service.movein_stats import StatsDelta, apply_stats, load_stats, stats_state, to_local_naive
+from service.user_cache import get_user_profile
+from service.conditional import movein_etag, list_etag, is_not_modified, not_modified_response, validator_headers
+
+logger = logging.getLogger(__name__)
 
 moveininfo_router = APIRouter(tags=["MoveIn"])
 
@@ -17,99 +33,315 @@ moveininfo_router = APIRouter(tags=["MoveIn"])
 async def create_movein(
     data: MoveInInfo,
     user_id: int = Depends(authenticate),
-    session: Session = Depends(get_session)
+    session: AsyncSession = Depends(get_async_session)
 ) -> dict:
 
-    # 주민번호 암호화
+    # 주민번호 암호화 (검색용 블라인드 인덱스는 평문으로 먼저 계산, 요청 본문의 값은 사용하지 않음)
+    data.rrnIndex = None
     if data.rrn:
         try:
+            data.rrnIndex = rrn_blind_index(data.rrn)
             data.rrn = encrypt_rrn(data.rrn)
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"주민번호 암호화 실패: {str(e)}")
 
+    # 주소 → 법정동 지역 코드 (지역별 조회용)
+    for key, value in region_columns(data.beforeAddr, data.afterAddr).items():
+        setattr(data, key, value)
+
     data.regDt = datetime.now()
     data.userId = user_id
+    data.isApproval = False  # 등록 시에는 항상 미승인
+    data.approvalDt = None
+    data.version = 1
+    data.updDt = None
     session.add(data)
-    session.commit()
-    session.refresh(data)
+    delta = StatsDelta()
+    delta.add(stats_state(data))
+    await apply_stats(session, delta)
+    await session.commit()
+    await session.refresh(data)
 
     return {"message": "전입 신고 등록이 완료되었습니다."}
 
+# 전입 신고 대량 등록 (CSV/NDJSON)
+# 파일을 한 줄씩 읽어 batch_size 건씩 저장하고, 잘못된 행은 건너뛰고 행 번호와 오류를 반환
+@moveininfo_router.post("/import", status_code=status.HTTP_200_OK)
+async def import_movein(
+    file: UploadFile = File(...),
+    format: Optional[str] = Query(None, description="csv 또는 ndjson (생략 시 파일 확장자로 판단)"),
+    batch_size: int = Query(settings.movein_import_batch_size, ge=1, le=5000),
+    user_id: int = Depends(authenticate),
+    session: AsyncSession = Depends(get_async_session)
+) -> dict:
+    fmt = format or (file.filename or "").rsplit(".", 1)[-1].lower()
+    if fmt == "jsonl":
+        fmt = "ndjson"
+    if fmt not in IMPORT_FORMATS:
+        raise HTTPException(status_code=400, detail="csv 또는 ndjson 파일만 등록할 수 있습니다.")
+
+    result = await import_moveins(session, file.file, fmt, user_id, batch_size)
+    return {"message": "전입 신고 대량 등록이 완료되었습니다.", **result}
+
+# 주민번호로 전입 신고 검색 (중복 신고 확인용)
+# 블라인드 인덱스 일치 조건 하나로 조회하므로 전체 행을 복호화하지 않음
+# 일반 사용자는 본인 신고만, 관리자는 전체에서 검색
+@moveininfo_router.post("/lookup", response_model=List[MoveInInfoResponse])
+async def lookup_movein_by_rrn(
+    data: MoveInRrnLookup,
+    session: AsyncSession = Depends(get_async_session),
+    user_id: int = Depends(authenticate)
+):
+    if not data.rrn.strip():
+        raise HTTPException(status_code=400, detail="주민번호를 입력해주세요.")
+    caller = await get_user_profile(session, user_id)
+    if not caller:
+        raise HTTPException(status_code=401, detail="사용자를 찾을 수 없습니다.")
+
+    query = select(MoveInInfo).where(MoveInInfo.rrnIndex == rrn_blind_index(data.rrn))
+    if caller["role"] != "Y":
+        query = query.where(MoveInInfo.userId == caller["id"])
+    rows = await session.exec(query.order_by(MoveInInfo.id.desc()))
+    return rows.all()
+
+# 전입신고 일괄 승인 (관리자 전용)
+# ids 목록 또는 pendingBefore(이 시각 이전 등록된 미승인 건 전체)를 받아 chunk 단위 UPDATE 로 처리
+# (/{moveIn_id} 보다 먼저 등록해야 "approval" 이 id 로 해석되지 않음)
+@moveininfo_router.put("/approval", status_code=status.HTTP_200_OK)
+async def approve_moveins_bulk(
+    data: MoveInBulkApproval,
+    session: AsyncSession = Depends(get_async_session),
+    user_id: int = Depends(authenticate)
+) -> dict:
+    caller = await get_user_profile(session, user_id)
+    if not caller or caller["role"] != "Y":
+        raise HTTPException(status_code=403, detail="접근 권한이 없습니다.")
+    if not data.ids and data.pendingBefore is None:
+        raise HTTPException(status_code=400, detail="ids 또는 pendingBefore 중 하나는 필요합니다.")
+
+    result = await approve_moveins(
+        session,
+        settings.movein_approval_chunk_size,
+        ids=data.ids,
+        pending_before=data.pendingBefore,
+    )
+    return {"message": "일괄 승인이 완료되었습니다.", **result}
+
+# 전입 신고 통계 (관리자 대시보드용)
+# 등록일별 요약 테이블만 읽으므로 조회 비용은 신고 건수가 아닌 기간(일수)에 비례
+# (/{moveIn_id} 보다 먼저 등록해야 "stats" 가 id 로 해석되지 않음)
+@moveininfo_router.get("/stats", response_model=MoveInStats)
+async def movein_stats(
+    day_from: Optional[date] = Query(None, alias="from", description="등록일 시작 (포함)"),
+    day_to: Optional[date] = Query(None, alias="to", description="등록일 끝 (포함)"),
+    session: AsyncSession = Depends(get_async_session),
+    user_id: int = Depends(authenticate)
+):
+    caller = await get_user_profile(session, user_id)
+    if not caller or caller["role"] != "Y":
+        raise HTTPException(status_code=403, detail="접근 권한이 없습니다.")
+    return await load_stats(session, day_from, day_to)
+
+# 지역별 전입 신고 건수 (관리자 전용)
+# region 아래 한 단계 지역별로 집계 (없으면 시도별, 시도 → 시군구별, 시군구 → 읍면동별)
+# 시도/시군구 아래 집계에는 주소에서 하위 단계를 찾지 못한 신고가 포함되지 않음
+# 주소 문자열 대신 (지역, id) 인덱스가 있는 코드 컬럼으로 조건/집계
+@moveininfo_router.get("/regions", response_model=RegionCounts)
+async def movein_region_counts(
+    region: Optional[str] = Query(None, description="상위 지역 코드 (시도 2자리 / 시군구 5자리 / 읍면동 8자리)"),
+    side: str = Query("after", pattern="^(before|after)$", description="before: 전출지, after: 전입지"),
+    session: AsyncSession = Depends(get_async_session),
+    user_id: int = Depends(authenticate)
+):
+    caller = await get_user_profile(session, user_id)
+    if not caller or caller["role"] != "Y":
+        raise HTTPException(status_code=403, detail="접근 권한이 없습니다.")
+    if region and not region_level(region):
+        raise HTTPException(status_code=400, detail="지역 코드는 2/5/8자리 숫자여야 합니다.")
+
+    rows = (await session.exec(build_region_count_query(side, region or None))).all()
+    index = get_region_index()
+    items = [RegionCount(code=code, name=index.name_of(code) if code else None, count=count) for code, count in rows]
+    return RegionCounts(side=side, region=region or None, total=sum(item.count for item in items), items=items)
+
 # 신고 내역 삭제
 @moveininfo_router.delete("/{moveIn_id}")
-async def delete_movein(moveIn_id: int, session: Session = Depends(get_session)) -> dict:
-    moveIn = session.get(MoveInInfo, moveIn_id)
+async def delete_movein(moveIn_id: int, session: AsyncSession = Depends(get_async_session)) -> dict:
+    # 통계 변경분 계산 전에 행 잠금
+    moveIn = await session.get(MoveInInfo, moveIn_id, with_for_update=True)
     if moveIn:
-        session.delete(moveIn)
-        session.commit()
+        delta = StatsDelta()
+        delta.add(stats_state(moveIn), -1)
+        await session.delete(moveIn)
+        await apply_stats(session, delta)
+        await session.commit()
         return {"message": "해당 전입 신고 내역이 삭제되었습니다."}
 
     raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="데이터가 존재하지 않습니다.")
 
 # 신고 내역 수정
-@moveininfo_router.put("/{moveIn_id}", response_model=MoveInInfo)
-async def update_event(data: MoveInInfoUpdate, moveIn_id: int = Path(...), session: Session = Depends(get_session)) -> MoveInInfo:
-    moveIn = session.get(MoveInInfo, moveIn_id)
+@moveininfo_router.put("/{moveIn_id}", response_model=MoveInInfoItem)
+async def update_event(data: MoveInInfoUpdate, moveIn_id: int = Path(...), session: AsyncSession = Depends(get_async_session)) -> MoveInInfo:
+    # 통계 변경분 계산 전에 행 잠금
+    moveIn = await session.get(MoveInInfo, moveIn_id, with_for_update=True)
     if moveIn:
         moveIn_data = data.model_dump(exclude_unset=True)
+        delta = StatsDelta()
+        delta.add(stats_state(moveIn), -1)
 
         for key, value in moveIn_data.items():
             if key == "rrn" and value:
                 try:
+                    moveIn.rrnIndex = rrn_blind_index(value)
                     value = encrypt_rrn(value)
                 except Exception as e:
                     raise HTTPException(status_code=500, detail=f"주민번호 암호화 실패: {str(e)}")
-            setattr(moveIn, key, value)
+            if key == "isApproval" and value is None:
+                value = False
+            setattr(moveIn, key, to_local_naive(value))  # 시간대가 붙은 일시는 현지 시각으로 저장
+
+        if "beforeAddr" in moveIn_data or "afterAddr" in moveIn_data:
+            for key, value in region_columns(moveIn.beforeAddr, moveIn.afterAddr).items():
+                setattr(moveIn, key, value)
 
+        moveIn.version = MoveInInfo.version + 1  # DB 값 기준으로 증가 (동시 수정에도 누락 없이)
+        moveIn.updDt = datetime.now()
         session.add(moveIn)
-        session.commit()
-        session.refresh(moveIn)
+        delta.add(stats_state(moveIn))
+        await apply_stats(session, delta)
+        await session.commit()
+        await session.refresh(moveIn)
         return moveIn
 
     raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="일치하는 전입 신고 내역을 찾을 수 없습니다.")
 
 # 전입신청 목록 (검색 포함)
-@moveininfo_router.get("/", response_model=List[MoveInInfo])
-def list_moveins(name: Optional[str] = Query(None), session: Session = Depends(get_session), user_id: int = Depends(authenticate)):
-    query = select(MoveInInfo)
-    if name:
-        query = query.where(MoveInInfo.name.contains(name))
-    return session.exec(query).all()
+# - 일반 사용자는 본인 신고만, 관리자는 전체(owner 지정 시 해당 사용자) 조회
+# - 소유자/승인 상태/등록일/지역 조건은 복합 인덱스 범위 조회 (service/movein_query.py)
+# - 이름 검색은 접두어 일치(LIKE 'x%')로 name 인덱스를 사용
+# - id 기준 키셋 페이지네이션: 최신순으로 limit 건씩, 다음 페이지는 after=next_cursor
+# - 응답 ETag 는 페이지의 (id, version) 으로 계산, If-None-Match 가 같으면 직렬화 없이 304
+# - 필요한 컬럼만 행으로 조회해서 pydantic 검증 없이 orjson 으로 바로 직렬화
+@moveininfo_router.get("/", response_model=MoveInInfoPage)
+async def list_moveins(
+    request: Request,
+    name: Optional[str] = Query(None),
+    owner: Optional[int] = Query(None, description="신고한 사용자 id (관리자 전용)"),
+    approved: Optional[bool] = Query(None, description="true: 승인 / false: 미승인"),
+    reg_from: Optional[datetime] = Query(None, alias="from", description="등록일 시작 (이상)"),
+    reg_to: Optional[datetime] = Query(None, alias="to", description="등록일 끝 (미만)"),
+    region: Optional[str] = Query(None, description="법정동 지역 코드 (시도 2자리 / 시군구 5자리 / 읍면동 8자리)"),
+    side: str = Query("after", pattern="^(before|after)$", description="region 기준 주소 (before: 전출지, after: 전입지)"),
+    limit: int = Query(50, ge=1, le=200),
+    after: Optional[int] = Query(None, description="이전 페이지 응답의 next_cursor"),
+    session: AsyncSession = Depends(get_async_session),
+    user_id: int = Depends(authenticate)
+):
+    caller = await get_user_profile(session, user_id)
+    if not caller:
+        raise HTTPException(status_code=401, detail="사용자를 찾을 수 없습니다.")
+    if caller["role"] != "Y":
+        if owner is not None and owner != caller["id"]:
+            raise HTTPException(status_code=403, detail="접근 권한이 없습니다.")
+        owner = caller["id"]
+    if region and not region_level(region):
+        raise HTTPException(status_code=400, detail="지역 코드는 2/5/8자리 숫자여야 합니다.")
+
+    # 한 건 더 조회해서 다음 페이지 존재 여부 판단
+    query = build_list_query(
+        limit, owner_id=owner, approved=approved, reg_from=reg_from, reg_to=reg_to, name=name, after=after,
+        columns=LIST_COLUMNS, region=region, side=side,
+    )
+    rows = (await session.exec(query)).mappings().all()
+    next_cursor = rows[limit - 1]["id"] if len(rows) > limit else None
+    rows = rows[:limit]
+
+    # 목록은 ETag 로만 검증 (행 삭제/페이지 이동은 수정 시각으로 알 수 없으므로 Last-Modified 를 쓰지 않음)
+    etag = list_etag(((row["id"], row["version"]) for row in rows), next_cursor)
+    if is_not_modified(request, etag, None):
+        return not_modified_response(etag, None)
+
+    # 조회한 행을 그대로 orjson 으로 직렬화 (response_model 검증은 문서화에만 사용)
+    return ORJSONResponse(
+        {"items": [dict(row) for row in rows], "next_cursor": next_cursor},
+        headers=validator_headers(etag, None),
+    )
+
+# 전입신고 내보내기 (CSV/NDJSON 스트리밍, 관리자 전용)
+# 서버 측 커서로 일정 행씩 읽어 바로 전송하므로 테이블 크기와 무관하게 메모리 사용량 일정
+@moveininfo_router.get("/export")
+async def export_moveins(
+    format: str = Query("csv", description="csv 또는 ndjson"),
+    reg_from: Optional[datetime] = Query(None, alias="from", description="등록일 시작 (이상)"),
+    reg_to: Optional[datetime] = Query(None, alias="to", description="등록일 끝 (미만)"),
+    approved: Optional[bool] = Query(None, description="true: 승인 / false: 미승인"),
+    decrypt: bool = Query(False, description="주민번호 복호화 여부"),
+    session: AsyncSession = Depends(get_async_session),
+    user_id: int = Depends(authenticate)
+):
+    caller = await get_user_profile(session, user_id)
+    if not caller or caller["role"] != "Y":
+        raise HTTPException(status_code=403, detail="접근 권한이 없습니다.")
+    if format not in EXPORT_MEDIA_TYPES:
+        raise HTTPException(status_code=400, detail="csv 또는 ndjson 형식만 지원합니다.")
+
+    query = build_export_query(reg_from, reg_to, approved)
+    filename = f"movein_{datetime.now():%Y%m%d%H%M%S}.{format}"
+    return StreamingResponse(
+        stream_moveins(query, format, decrypt),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
 
 # 전입신고 상세 조회
+# ETag(version) 가 If-None-Match 와 같으면 주민번호 복호화와 직렬화 없이 304
 @moveininfo_router.get("/{movein_id}", response_model=MoveInInfoResponse)
 def detail_movein(
     movein_id: int,
+    request: Request,
+    response: Response,
     session: Session = Depends(get_session),
     user_id: int = Depends(authenticate)
 ):
-    print(f"[📥 상세조회 요청] movein_id={movein_id}, user_id={user_id}")
-    
+    logger.debug("전입 신고 상세 조회", extra={"movein_id": movein_id, "user_id": user_id})
+
     movein = session.get(MoveInInfo, movein_id)
     if not movein:
         raise HTTPException(status_code=404, detail="해당 신청 정보를 찾을 수 없습니다.")
 
+    etag = movein_etag(movein.id, movein.version)
+    last_modified = movein.updDt or movein.regDt
+    if is_not_modified(request, etag, last_modified):
+        return not_modified_response(etag, last_modified)
+    response.headers.update(validator_headers(etag, last_modified))
+
+    # 주민번호(암호문/평문)는 로그에 남기지 않음
     try:
-        print(f"[✅ 복호화 시도]: {movein.rrn}")
         movein.rrn = decrypt_rrn(movein.rrn)
-        print(f"[✅ 복호화 성공]: {movein.rrn}")
     except Exception as e:
-        print(f"[❌ 복호화 실패]: {e}")
+        logger.warning("주민번호 복호화 실패", extra={"movein_id": movein_id, "error": type(e).__name__})
         movein.rrn = "복호화 실패"
 
     return movein
 
 # 전입신고 승인
-@moveininfo_router.put("/approval/{movein_id}", status_code=status.HTTP_200_OK)
-async def approve_movein(movein_id: int, session: Session = Depends(get_session), user_id: int = Depends(authenticate)):
-    movein = session.get(MoveInInfo, movein_id)
+@moveininfo_router.put("/approval/{movein_id}", status_code=status.HTTP_200_OK, response_model=MoveInInfoItem)
+async def approve_movein(movein_id: int, session: AsyncSession = Depends(get_async_session), user_id: int = Depends(authenticate)):
+    # 통계 변경분 계산 전에 행 잠금
+    movein = await session.get(MoveInInfo, movein_id, with_for_update=True)
     if not movein:
         raise HTTPException(status_code=404, detail="해당 전입 신고 내역을 찾을 수 없습니다.")
 
+    delta = StatsDelta()
+    delta.add(stats_state(movein), -1)
     movein.isApproval = True
     movein.approvalDt = datetime.now()
+    movein.version = MoveInInfo.version + 1
+    movein.updDt = movein.approvalDt
     session.add(movein)
-    session.commit()
-    session.refresh(movein)
+    delta.add(stats_state(movein))
+    await apply_stats(session, delta)
+    await session.commit()
+    await session.refresh(movein)
 
     return movein
\ No newline at end of file
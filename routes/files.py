@@ -0,0 +1,27 @@
+import mimetypes
+
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import FileResponse
+
+from service.storage import LocalStorage, get_storage
+
+file_router = APIRouter(tags=["Files"])
+
+# 로컬 저장소 파일 서빙
+# FileResponse 는 파일을 메모리에 올리지 않고 청크 단위로 전송하며 Range 요청(206)을 지원,
+# 서버가 http.response.pathsend 확장을 지원하면 OS sendfile 로 전송됨
+@file_router.get("/{key:path}")
+async def serve_file(key: str):
+    storage = get_storage()
+    if not isinstance(storage, LocalStorage):
+        raise HTTPException(status_code=404, detail="파일을 찾을 수 없습니다.")
+
+    try:
+        path = storage.path_for(key)
+    except ValueError:
+        raise HTTPException(status_code=404, detail="파일을 찾을 수 없습니다.")
+    if not path.is_file():
+        raise HTTPException(status_code=404, detail="파일을 찾을 수 없습니다.")
+
+    media_type = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+    return FileResponse(path, media_type=media_type)
@@ -0,0 +1,22 @@
+from fastapi import APIRouter, Depends
+from fastapi.responses import PlainTextResponse
+
+from auth.authenticate import verify_internal_token
+from database.pool_metrics import pool_snapshot
+from service.metrics import PROMETHEUS_CONTENT_TYPE, render_prometheus
+
+# 운영 모니터링용 내부 엔드포인트 (API 문서에는 노출하지 않음, INTERNAL_TOKEN 필요)
+internal_router = APIRouter(tags=["Internal"], include_in_schema=False, dependencies=[Depends(verify_internal_token)])
+
+# DB 커넥션 풀 현황 (체크아웃/오버플로/대기 시간/커넥션 생성률)
+@internal_router.get("/pool")
+async def pool_stats() -> dict:
+    return pool_snapshot()
+
+# Prometheus 수집 엔드포인트 (관례상 /metrics 경로에 prefix 없이 등록)
+metrics_router = APIRouter(tags=["Internal"], include_in_schema=False, dependencies=[Depends(verify_internal_token)])
+
+# 라우트별 요청 수/응답 시간/쿼리 수와 DB 커넥션 풀 지표 (Prometheus 텍스트 형식)
+@metrics_router.get("/metrics")
+async def metrics() -> PlainTextResponse:
+    return PlainTextResponse(render_prometheus(), media_type=PROMETHEUS_CONTENT_TYPE)
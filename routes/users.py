@@ -1,5 +1,6 @@
 import os
 import json
+import logging
 import shutil
 from pathlib import Path
 from datetime import datetime
@@ -8,17 +9,28 @@ import mimetypes
 from uuid import uuid4
 
 from auth.authenticate import authenticate
-from fastapi import APIRouter, Depends, HTTPException, status, Form, UploadFile, File, Header
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status, Form, UploadFile, File, Header, Query
+from fastapi.responses import ORJSONResponse
 from fastapi.security import OAuth2PasswordRequestForm
+from sqlalchemy import and_, func
+from sqlalchemy.orm import aliased
 from sqlmodel import select, Session
-from typing import List, Optional
+from sqlmodel.ext.asyncio.session import AsyncSession
+from typing import Optional
 
-from models.users import User
-from models.files import Files
-from database.connection import get_session
+from models.users import User, UserPage
+from models.files import Files, FileVariants, FileUploadRequest, FileUploadComplete
+from database.connection import get_async_session
 from auth.hash_password import HashPassword
 from auth.jwt_handler import create_jwt_token, verify_jwt_token
-from service.s3_service import upload_file_to_s3, delete_file_from_s3
+from config.settings import settings
+from service.s3_service import upload_key_prefix
+from service.storage import get_storage
+from service.file_service import store_uploaded_file, release_file
+from service.image_variants import generate_variants, pick_variant
+from service.user_cache import get_user_profile, invalidate_user
+
+logger = logging.getLogger(__name__)
 
 # tag은 API 문서화에 사용되는 태그 ( docs 상에 같은 태그로 묶임 )
 user_router = APIRouter(tags=["User"])
@@ -26,12 +38,49 @@ user_router = APIRouter(tags=["User"])
 # 비밀번호 해시 유틸
 hash_password = HashPassword()  
 
+# 프로필 이미지로 허용하는 Content-Type 목록
+allowed_image_types = {t.strip() for t in settings.profile_image_types.split(",") if t.strip()}
+
+# 클라이언트가 presigned URL 로 직접 올린 객체를 HEAD 로 확인한 뒤 user_id 의 Files 행 생성
+# - 키는 업로드 URL 을 발급받은 사용자(uploader_id, 생략 시 user_id)의 접두어 아래여야 함 (다른 사용자의 객체 등록 방지)
+# - 이미 등록된 객체는 다시 등록할 수 없음 (교체 시 기존 행 해제로 객체가 삭제되는 것 방지)
+async def register_uploaded_image(
+    session: AsyncSession, user_id: int, key: str, org_file_name: Optional[str], uploader_id: Optional[int] = None
+) -> Files:
+    prefix = upload_key_prefix(uploader_id if uploader_id is not None else user_id)
+    if not key or not key.startswith(prefix) or ".." in key:
+        raise HTTPException(status_code=400, detail="잘못된 파일 키입니다.")
+
+    file_url = get_storage().object_url(key)
+    if (await session.exec(select(Files.fileSeq).where(Files.fileUrl == file_url))).first() is not None:
+        raise HTTPException(status_code=409, detail="이미 등록된 파일입니다.")
+
+    try:
+        meta = await get_storage().head_async(key)
+    except RuntimeError:
+        raise HTTPException(status_code=400, detail="업로드된 파일을 찾을 수 없습니다.")
+
+    if meta["size"] > settings.profile_image_max_bytes or meta["contentType"] not in allowed_image_types:
+        raise HTTPException(status_code=400, detail="허용되지 않는 파일입니다.")
+
+    new_file = Files(
+        userId=user_id,
+        fileName=os.path.basename(key),
+        filePath="/".join(file_url.split("/")[:-1]),
+        orgFileName=org_file_name or os.path.basename(key),
+        fileSize=str(meta["size"]),
+        fileUrl=file_url
+    )
+    session.add(new_file)
+    return new_file
+
 # 회원가입 API
 @user_router.post("/signup", status_code=status.HTTP_201_CREATED)
 async def sign_new_user(
+    background_tasks: BackgroundTasks,
     data: str = Form(...),
     image: Optional[UploadFile] = File(None),
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_async_session),
     Authorization: Optional[str] = Header(None)  # 관리자 인증 헤더 받기
 ) -> dict:
     # JSON 파싱
@@ -56,7 +105,7 @@ async def sign_new_user(
         raise HTTPException(status_code=403, detail="토큰이 필요합니다.")
 
     # 이메일 중복 검사
-    existing_user = session.exec(select(User).where(User.email == email)).first()
+    existing_user = (await session.exec(select(User).where(User.email == email))).first()
     if existing_user:
         raise HTTPException(status_code=409, detail="동일한 사용자가 존재합니다.")
 
@@ -64,45 +113,44 @@ async def sign_new_user(
     new_user = User(
         username=parsed.get("username"),
         email=email,
-        password=hash_password.hash_password(parsed.get("password")),
+        password=await hash_password.hash_password_async(parsed.get("password")),
         role=parsed.get("role", "N"),
         created_at=datetime.utcnow()
     )
     session.add(new_user)
-    session.flush()  # ID 확보 (commit은 나중에 한 번만)
+    await session.flush()  # ID 확보 (commit은 나중에 한 번만)
 
     # 이미지 업로드 및 파일 테이블 저장
     file_url = None
-    if image:
+    new_file = None
+    if parsed.get("image_key"):
+        # presigned URL 로 미리 업로드된 이미지 (바이트는 API 서버를 거치지 않음)
+        # 관리자가 본인 명의로 발급받아 올린 객체를 새 사용자에게 등록
+        new_file = await register_uploaded_image(
+            session, new_user.id, parsed["image_key"], parsed.get("image_name"), uploader_id=int(payload["sub"])
+        )
+        file_url = new_file.fileUrl
+    elif image:
         try:
-            file_size = str(image.size)
-            file_url = upload_file_to_s3(image.file, image.filename)
-
-            file_name = os.path.basename(file_url)
-            file_path = "/".join(file_url.split("/")[:-1])
-            org_file_name = image.filename
-
-            new_file = Files(
-                userId=new_user.id,
-                fileName=file_name,
-                filePath=file_path,
-                orgFileName=org_file_name,
-                fileSize=file_size,
-                fileUrl=file_url
-            )
-            session.add(new_file)
+            # 같은 내용의 이미지가 이미 있으면 업로드 없이 재사용
+            new_file = await store_uploaded_file(session, new_user.id, image)
+            file_url = new_file.fileUrl
         except Exception as e:
-            session.rollback()
-            print(f"S3 파일 업로드 또는 Files 객체 생성 중 오류: {e}")
+            await session.rollback()
+            logger.exception("프로필 이미지 저장 실패")
             raise HTTPException(status_code=500, detail=f"파일 업로드 실패: {str(e)}")
 
     try:
-        session.commit()
+        await session.commit()
     except Exception as e:
-        session.rollback()
-        print(f"!!! 데이터베이스 커밋 실패 오류: {e}")
-        print(f"!!! 오류 타입: {type(e)}")
+        await session.rollback()
+        logger.exception("사용자 등록 커밋 실패")
         raise HTTPException(status_code=500, detail=f"사용자 등록 중 데이터베이스 오류: {str(e)}")
+    await invalidate_user(new_user.id)
+
+    # 썸네일은 응답 이후 백그라운드에서 생성
+    if new_file:
+        background_tasks.add_task(generate_variants, new_file.fileSeq)
 
     return {
         "message": "사용자 등록이 완료되었습니다.",
@@ -117,19 +165,31 @@ async def sign_new_user(
 
 # 사용자 로그인
 @user_router.post("/signin")
-async def sign_in(data: OAuth2PasswordRequestForm = Depends(), session = Depends(get_session)) -> dict:
+async def sign_in(data: OAuth2PasswordRequestForm = Depends(), session: AsyncSession = Depends(get_async_session)) -> dict:
     statement = select(User).where(User.email == data.username)
-    user = session.exec(statement).first()
+    user = (await session.exec(statement)).first()
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, 
             detail="사용자를 찾을 수 없습니다.")    
 
     # if user.password != data.password:
-    if hash_password.verify_password(data.password, user.password) == False:
+    if settings.password_rehash_on_login:
+        # 저장된 해시가 오래된 설정(라운드 수 등)이면 새 해시로 교체
+        verified, new_hash = await hash_password.verify_and_update_async(data.password, user.password)
+    else:
+        verified, new_hash = await hash_password.verify_password_async(data.password, user.password), None
+
+    if not verified:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, 
             detail="패스워드가 일치하지 않습니다.")
+
+    if new_hash:
+        user.password = new_hash
+        session.add(user)
+        await session.commit()
+        await session.refresh(user)
     
     return {
         "message": "로그인에 성공했습니다.",
@@ -142,7 +202,11 @@ async def sign_in(data: OAuth2PasswordRequestForm = Depends(), session = Depends
     }
 
 @user_router.get("/profile")
-async def get_profile(Authorization: str = Header(...), session: Session = Depends(get_session)):
+async def get_profile(
+    Authorization: str = Header(...),
+    size: Optional[int] = Query(None, gt=0, description="원하는 이미지 크기(px), 지정 시 가장 가까운 썸네일 URL 반환"),
+    session: AsyncSession = Depends(get_async_session)
+):
     try:
         # Bearer 토큰에서 토큰만 추출
         token = Authorization.replace("Bearer ", "")
@@ -152,19 +216,23 @@ async def get_profile(Authorization: str = Header(...), session: Session = Depen
         if not user_id:
             raise HTTPException(status_code=401, detail="토큰이 유효하지 않습니다.")
 
-        # 사용자 조회
-        user = session.get(User, user_id)
-        if not user:
+        # 사용자 + 프로필 이미지 조회 (캐시에 없을 때만 DB 조회)
+        profile = await get_user_profile(session, user_id)
+        if not profile:
             raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다.")
 
-        # 프로필 이미지 조회 (없을 수도 있음)
-        file = session.exec(select(Files).where(Files.userId == user.id)).first()
+        # 썸네일이 아직 생성 전이면 원본 URL 사용
+        variants = profile["profile_image_variants"]
+        image_url = profile["profile_image_url"]
+        if size and variants:
+            image_url = pick_variant(variants, size)
 
         return {
-            "sub": user.id,
-            "email": user.email,
-            "username": user.username,
-            "profile_image_url": file.fileUrl if file else None
+            "sub": profile["id"],
+            "email": profile["email"],
+            "username": profile["username"],
+            "profile_image_url": image_url,
+            "profile_image_variants": variants
         }
 
     except Exception as e:
@@ -172,17 +240,18 @@ async def get_profile(Authorization: str = Header(...), session: Session = Depen
 
 @user_router.put("/profile", status_code=200)
 async def update_profile(
+    background_tasks: BackgroundTasks,
     data: str = Form(...),
     image: Optional[UploadFile] = File(None),
     Authorization: str = Header(...),
-    session: Session = Depends(get_session)
+    session: AsyncSession = Depends(get_async_session)
 ):
     try:
         token = Authorization.replace("Bearer ", "")
         payload = verify_jwt_token(token)
         user_id = payload.get("sub")
 
-        user = session.get(User, user_id)
+        user = await session.get(User, user_id)
         if not user:
             raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다.")
         
@@ -193,61 +262,153 @@ async def update_profile(
             user.username = new_username
 
         # 이미지 수정
-        if image:
-            # 기존 이미지 삭제
-            old_file = session.exec(select(Files).where(Files.userId == user.id)).first()
+        image_key = parsed.get("image_key")
+        if image or image_key:
+            old_file = (await session.exec(select(Files).where(Files.userId == user.id))).first()
+
+            if image_key:
+                # presigned URL 로 미리 업로드된 이미지 등록
+                new_file = await register_uploaded_image(session, user.id, image_key, parsed.get("image_name"))
+            else:
+                # 새 이미지 업로드 (같은 내용이면 기존 객체 재사용)
+                new_file = await store_uploaded_file(session, user.id, image)
+
+            # 새 이미지가 준비된 뒤 기존 이미지 삭제 (다른 참조가 없을 때만 객체 삭제)
             if old_file:
-                delete_file_from_s3(old_file.fileUrl)
-                session.delete(old_file)
-
-            # 새 이미지 업로드
-            file_url = upload_file_to_s3(image.file, image.filename)
-            file_name = os.path.basename(file_url)
-            file_path = "/".join(file_url.split("/")[:-1])
-            file_size = str(image.size)
-
-            new_file = Files(
-                userId=user.id,
-                fileName=file_name,
-                filePath=file_path,
-                orgFileName=image.filename,
-                fileSize=file_size,
-                fileUrl=file_url
-            )
-            session.add(new_file)
-
-        session.commit()
+                await release_file(session, old_file)
+
+            await session.commit()
+            background_tasks.add_task(generate_variants, new_file.fileSeq)
+        else:
+            await session.commit()
 
+        await invalidate_user(user.id)
         return {"message": "프로필이 성공적으로 수정되었습니다."}
 
+    except HTTPException:
+        await session.rollback()
+        raise
     except Exception as e:
-        session.rollback()
+        await session.rollback()
         raise HTTPException(status_code=500, detail=f"프로필 수정 실패: {str(e)}")
 
-# 사용자 목록 조회
-@user_router.get("/", response_model=List[User])
-async def list_users(session: Session = Depends(get_session), user_id: int = Depends(authenticate)):
-    user = session.get(User, user_id)
-    if (user.role != 'Y'):  
+# 프로필 이미지 직접 업로드 URL 발급 (브라우저 → 버킷 presigned POST)
+@user_router.post("/profile/upload-url")
+async def create_profile_upload_url(data: FileUploadRequest, user_id: int = Depends(authenticate)) -> dict:
+    if data.contentType not in allowed_image_types:
+        raise HTTPException(status_code=400, detail="허용되지 않는 파일 형식입니다.")
+    if data.fileSize > settings.profile_image_max_bytes:
+        raise HTTPException(status_code=400, detail="파일 크기가 너무 큽니다.")
+
+    try:
+        return get_storage().create_presigned_upload(
+            data.fileName,
+            data.contentType,
+            settings.profile_image_max_bytes,
+            settings.presigned_url_expires,
+            user_id,
+        )
+    except NotImplementedError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except RuntimeError as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+# 직접 업로드 완료 처리: 객체 확인 후 프로필 이미지 교체
+@user_router.post("/profile/upload-complete")
+async def complete_profile_upload(
+    background_tasks: BackgroundTasks,
+    data: FileUploadComplete,
+    user_id: int = Depends(authenticate),
+    session: AsyncSession = Depends(get_async_session)
+) -> dict:
+    old_file = (await session.exec(select(Files).where(Files.userId == user_id))).first()
+    new_file = await register_uploaded_image(session, user_id, data.key, data.orgFileName)
+
+    if old_file:
+        try:
+            await release_file(session, old_file)
+        except RuntimeError as e:
+            raise HTTPException(status_code=500, detail=f"S3 파일 삭제 실패: {str(e)}")
+
+    await session.commit()
+    await invalidate_user(user_id)
+    background_tasks.add_task(generate_variants, new_file.fileSeq)
+    return {"message": "프로필 이미지가 등록되었습니다.", "profile_image_url": new_file.fileUrl}
+
+# 사용자 목록 조회 (관리자 전용)
+# - id 기준 키셋 페이지네이션: 최신 가입순으로 limit 건씩, 다음 페이지는 after=next_cursor
+# - 목록에 필요한 컬럼만 프로필 이미지와 조인해서 한 번에 조회 (비밀번호 해시는 조회하지 않음)
+# - size 지정 시 썸네일은 페이지 단위로 한 번 더 일괄 조회
+# - 조회한 행을 pydantic 검증 없이 orjson 으로 바로 직렬화 (response_model 은 문서화에만 사용)
+@user_router.get("/", response_model=UserPage)
+async def list_users(
+    limit: int = Query(50, ge=1, le=200),
+    after: Optional[int] = Query(None, description="이전 페이지 응답의 next_cursor"),
+    size: Optional[int] = Query(None, gt=0, description="원하는 이미지 크기(px), 지정 시 가장 가까운 썸네일 URL 반환"),
+    session: AsyncSession = Depends(get_async_session),
+    user_id: int = Depends(authenticate)
+):
+    # 호출자 권한 확인은 캐시된 프로필로 (매 요청 User 조회 생략)
+    user = await get_user_profile(session, user_id)
+    if not user or user["role"] != 'Y':
         raise HTTPException(status_code=403, detail="접근 권한이 없습니다.")
-    users = session.exec(select(User)).all()
-    return users
+
+    # 프로필 이미지는 사용자별 가장 최근 Files 행 하나만 조인 (행이 여러 개 남아 있어도 사용자가 중복되지 않음)
+    # 상관 서브쿼리는 페이지에 포함된 사용자만 ix_Files_userId 로 조회
+    latest = aliased(Files)
+    latest_file_seq = select(func.max(latest.fileSeq)).where(latest.userId == User.id).scalar_subquery()
+    query = (
+        select(User.id, User.username, User.email, User.role, User.created_at, Files.fileSeq, Files.fileUrl)
+        .outerjoin(Files, and_(Files.userId == User.id, Files.fileSeq == latest_file_seq))
+        .order_by(User.id.desc())
+        .limit(limit + 1)  # 한 건 더 조회해서 다음 페이지 존재 여부 판단
+    )
+    if after is not None:
+        query = query.where(User.id < after)
+    rows = (await session.exec(query)).mappings().all()
+    next_cursor = rows[limit - 1]["id"] if len(rows) > limit else None
+    rows = rows[:limit]
+
+    variants = {}
+    file_seqs = [row["fileSeq"] for row in rows if row["fileSeq"] is not None]
+    if size and file_seqs:
+        variant_rows = await session.exec(
+            select(FileVariants.fileSeq, FileVariants.size, FileVariants.fileUrl).where(FileVariants.fileSeq.in_(file_seqs))
+        )
+        for file_seq, variant_size, variant_url in variant_rows:
+            variants.setdefault(file_seq, {})[str(variant_size)] = variant_url
+
+    items = []
+    for row in rows:
+        # 썸네일이 아직 생성 전이면 원본 URL 사용
+        image_url = row["fileUrl"]
+        if row["fileSeq"] in variants:
+            image_url = pick_variant(variants[row["fileSeq"]], size)
+        items.append({
+            "id": row["id"],
+            "username": row["username"],
+            "email": row["email"],
+            "role": row["role"],
+            "created_at": row["created_at"],
+            "profile_image_url": image_url,
+        })
+    return ORJSONResponse({"items": items, "next_cursor": next_cursor})
 
 # 사용자 삭제
 @user_router.delete("/{userId}", status_code=status.HTTP_200_OK)
-async def delete_user(userId: int, session: Session = Depends(get_session)):
-    user = session.get(User, userId)
+async def delete_user(userId: int, session: AsyncSession = Depends(get_async_session)):
+    user = await session.get(User, userId)
     if not user:
         raise HTTPException(status_code=404, detail="해당 사용자를 찾을 수 없습니다.")
 
-    file = session.exec(select(Files).where(Files.userId == userId)).first()
+    file = (await session.exec(select(Files).where(Files.userId == userId))).first()
     if file:
         try:
-            delete_file_from_s3(file.fileUrl)  # ✅ 속성명 수정
-            session.delete(file)
+            await release_file(session, file)  # 마지막 참조일 때만 객체 삭제
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"S3 파일 삭제 실패: {str(e)}")
 
-    session.delete(user)
-    session.commit()
+    await session.delete(user)
+    await session.commit()
+    await invalidate_user(userId)
     return {"message": "사용자가 삭제되었습니다."}
@@ -0,0 +1,60 @@
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Iterable, Optional, Tuple
+
+from fastapi import Request, Response
+
+# 조건부 요청 응답에 공통으로 붙이는 캐시 정책 (브라우저가 캐시하되 매번 ETag 로 재검증)
+CACHE_CONTROL = "private, no-cache"
+
+
+# 전입 신고 한 건의 ETag (버전이 바뀔 때만 달라짐)
+def movein_etag(movein_id: int, version: int) -> str:
+    return f'W/"movein-{movein_id}-{version}"'
+
+
+# 목록 ETag: 페이지에 포함된 (id, version) 과 다음 커서로 계산 (행이 추가/삭제/수정되면 달라짐)
+def list_etag(rows: Iterable[Tuple[int, int]], next_cursor: Optional[int]) -> str:
+    digest = hashlib.sha1()
+    for movein_id, version in rows:
+        digest.update(f"{movein_id}:{version};".encode())
+    digest.update(f"next:{next_cursor}".encode())
+    return f'W/"moveins-{digest.hexdigest()}"'
+
+
+def _to_utc(value: datetime) -> datetime:
+    # DB 의 naive datetime 은 서버 로컬 시간으로 저장되므로 로컬 기준으로 변환
+    return value.astimezone(timezone.utc).replace(microsecond=0)
+
+
+# If-None-Match / If-Modified-Since 확인 (If-None-Match 가 있으면 그것만 사용, RFC 9110)
+def is_not_modified(request: Request, etag: str, last_modified: Optional[datetime]) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        if if_none_match.strip() == "*":
+            return True
+        # 약한 비교: W/ 접두어를 무시하고 태그 값만 비교
+        candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return etag.removeprefix("W/") in candidates
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        return since.tzinfo is not None and _to_utc(last_modified) <= since
+    return False
+
+
+# 검증 헤더 (200/304 공통)
+def validator_headers(etag: str, last_modified: Optional[datetime]) -> dict:
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    if last_modified is not None:
+        headers["Last-Modified"] = format_datetime(_to_utc(last_modified), usegmt=True)
+    return headers
+
+
+def not_modified_response(etag: str, last_modified: Optional[datetime]) -> Response:
+    return Response(status_code=304, headers=validator_headers(etag, last_modified))
@@ -0,0 +1,83 @@
+import hashlib
+import os
+from pathlib import Path
+
+from fastapi import UploadFile
+from sqlalchemy import func
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from starlette.concurrency import run_in_threadpool
+
+from models.files import Files, FileVariants
+from service.storage import get_storage
+
+# 해시 계산 시 읽는 청크 크기
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+# 파일 내용을 청크 단위로 읽으며 SHA-256 계산 (계산 후 파일 위치는 처음으로 되돌림)
+def hash_file(file_obj) -> str:
+    digest = hashlib.sha256()
+    file_obj.seek(0)
+    for chunk in iter(lambda: file_obj.read(HASH_CHUNK_SIZE), b""):
+        digest.update(chunk)
+    file_obj.seek(0)
+    return digest.hexdigest()
+
+
+# 내용 주소 기반 키 (같은 내용이면 같은 키)
+def digest_key(digest: str, filename: str) -> str:
+    return f"uploads/objects/{digest[:2]}/{digest}{Path(filename).suffix.lower()}"
+
+
+# 업로드된 이미지를 저장하고 Files 행 생성
+# 같은 내용의 파일이 이미 저장되어 있으면 업로드 없이 기존 객체를 참조
+async def store_uploaded_file(session: AsyncSession, user_id: int, upload: UploadFile) -> Files:
+    storage = get_storage()
+    digest = await run_in_threadpool(hash_file, upload.file)
+
+    file_url = None
+    existing = (await session.exec(select(Files).where(Files.digest == digest))).first()
+    if existing:
+        # 참조가 남아 있어도 객체가 실제로 있는지 HEAD 로 확인 (동시 삭제 대비)
+        try:
+            await storage.head_async(digest_key(digest, existing.fileName))
+            file_url = existing.fileUrl
+        except RuntimeError:
+            file_url = None
+
+    if file_url is None:
+        file_url = await storage.upload_async(upload.file, upload.filename, digest_key(digest, upload.filename))
+
+    new_file = Files(
+        userId=user_id,
+        fileName=os.path.basename(file_url),
+        filePath="/".join(file_url.split("/")[:-1]),
+        orgFileName=upload.filename,
+        fileSize=str(upload.size),
+        fileUrl=file_url,
+        digest=digest
+    )
+    session.add(new_file)
+    return new_file
+
+
+# Files 행 삭제 (같은 객체를 참조하는 행이 더 이상 없을 때만 저장소 객체와 변환본 삭제)
+async def release_file(session: AsyncSession, file: Files) -> None:
+    variants = (await session.exec(select(FileVariants).where(FileVariants.fileSeq == file.fileSeq))).all()
+    for variant in variants:
+        await session.delete(variant)
+    await session.delete(file)
+    await session.flush()
+
+    if file.digest:
+        remaining = (await session.exec(
+            select(func.count()).select_from(Files).where(Files.digest == file.digest)
+        )).one()
+        if remaining:
+            return
+
+    storage = get_storage()
+    await storage.delete_async(file.fileUrl)
+    for variant in variants:
+        await storage.delete_async(variant.fileUrl)
@@ -0,0 +1,21 @@
+# 이미지 변환(리사이즈/재인코딩) 순수 함수
+# 프로세스 풀 워커에서 실행되므로 DB/저장소 등 다른 모듈을 import 하지 않음
+import io
+
+from PIL import Image, ImageOps
+
+
+# 원본 이미지를 긴 변 기준 각 크기로 줄여 WebP 로 인코딩 ({크기: 바이트})
+def render_variants(data: bytes, sizes: list, quality: int) -> dict:
+    with Image.open(io.BytesIO(data)) as source:
+        image = ImageOps.exif_transpose(source)
+        image = image.convert("RGBA" if image.mode in ("RGBA", "LA", "P") else "RGB")
+
+        results = {}
+        for size in sorted(sizes):
+            variant = image.copy()
+            variant.thumbnail((size, size), Image.Resampling.LANCZOS)
+            buffer = io.BytesIO()
+            variant.save(buffer, format="WEBP", quality=quality, method=4)
+            results[size] = buffer.getvalue()
+        return results
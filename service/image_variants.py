@@ -0,0 +1,124 @@
+import asyncio
+import io
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, Optional
+
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from config.settings import settings
+from database.connection import AsyncSessionLocal
+from models.files import Files, FileVariants
+from service.storage import get_storage
+from service.user_cache import invalidate_user
+
+logger = logging.getLogger(__name__)
+
+# 생성할 변환본 크기 목록 (px)
+VARIANT_SIZES = sorted({int(size) for size in settings.profile_variant_sizes.split(",") if size.strip()})
+
+# 이미지 변환 전용 프로세스 풀 (CPU 작업이 API 워커의 GIL 을 잡지 않도록 분리, 최초 사용 시 생성)
+_image_executor: Optional[ProcessPoolExecutor] = None
+
+
+def get_image_executor() -> ProcessPoolExecutor:
+    global _image_executor
+    if _image_executor is None:
+        # 스레드 풀을 쓰는 프로세스에서 fork 하지 않도록 spawn 사용
+        _image_executor = ProcessPoolExecutor(
+            max_workers=settings.image_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _image_executor
+
+
+# 변환본 키 (원본이 내용 주소 기반이면 같은 원본의 변환본도 공유)
+def variant_key(file: Files, size: int) -> str:
+    stem = file.digest or Path(file.fileName).stem
+    return f"uploads/variants/{stem[:2]}/{stem}_{size}.webp"
+
+
+# 원본 파일의 변환본 생성 후 FileVariants 에 기록 (업로드 응답 이후 백그라운드에서 실행)
+async def generate_variants(file_seq: int) -> None:
+    async with AsyncSessionLocal() as session:
+        try:
+            user_id = await _generate_variants(session, file_seq)
+            # 프로필 캐시에 썸네일 목록이 반영되도록 무효화
+            if user_id is not None:
+                await invalidate_user(user_id)
+        except Exception:
+            await session.rollback()
+            logger.exception("변환본 생성 실패", extra={"file_seq": file_seq})
+
+
+# 변환본을 새로 기록했으면 원본 소유자 id 반환
+async def _generate_variants(session: AsyncSession, file_seq: int) -> Optional[int]:
+    file = await session.get(Files, file_seq)
+    if not file or not VARIANT_SIZES:
+        return None
+
+    existing = (await session.exec(select(FileVariants).where(FileVariants.fileSeq == file_seq))).all()
+    if existing:
+        return None
+
+    # 같은 내용의 원본에 이미 변환본이 있으면 행만 복사
+    if file.digest:
+        shared = (await session.exec(
+            select(FileVariants)
+            .join(Files, Files.fileSeq == FileVariants.fileSeq)
+            .where(Files.digest == file.digest, Files.fileSeq != file_seq)
+        )).all()
+        sizes = {variant.size for variant in shared}
+        if shared and sizes.issuperset(VARIANT_SIZES):
+            copied = {}
+            for variant in shared:
+                copied.setdefault(variant.size, variant)
+            for variant in copied.values():
+                session.add(FileVariants(
+                    fileSeq=file_seq,
+                    size=variant.size,
+                    format=variant.format,
+                    fileSize=variant.fileSize,
+                    fileUrl=variant.fileUrl,
+                ))
+            await session.commit()
+            return file.userId
+
+    storage = get_storage()
+    original = await storage.read_async(storage.key_from_url(file.fileUrl))
+
+    # Pillow 는 변환본을 처음 만들 때 import (API 서버 기동 시간에 포함되지 않도록)
+    from service.image_render import render_variants
+
+    loop = asyncio.get_running_loop()
+    rendered = await loop.run_in_executor(
+        get_image_executor(), render_variants, original, VARIANT_SIZES, settings.profile_variant_quality
+    )
+
+    for size, data in rendered.items():
+        key = variant_key(file, size)
+        file_url = await storage.upload_async(io.BytesIO(data), key, key)
+        session.add(FileVariants(
+            fileSeq=file_seq,
+            size=size,
+            format="webp",
+            fileSize=str(len(data)),
+            fileUrl=file_url,
+        ))
+    await session.commit()
+    return file.userId
+
+
+# 요청 크기에 맞는 변환본 URL 선택 (요청 크기 이상 중 가장 작은 것, 없으면 가장 큰 것)
+# variants: {"크기": URL} (프로필 응답/캐시 형식)
+def pick_variant(variants: Dict[str, str], size: int) -> Optional[str]:
+    if not variants:
+        return None
+    ordered = sorted((int(variant_size), url) for variant_size, url in variants.items())
+    for variant_size, url in ordered:
+        if variant_size >= size:
+            return url
+    return ordered[-1][1]
@@ -0,0 +1,203 @@
+from bisect import bisect_left
+from threading import Lock
+from time import perf_counter
+from typing import Dict, List, Tuple
+
+from config import log_config
+from database.pool_metrics import pool_snapshot
+from database.query_metrics import RequestQueries, current_request_queries, query_stats
+from service.user_cache import get_user_cache
+
+# 응답 시간 히스토그램 구간(초)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Prometheus 텍스트 형식 Content-Type
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+# 라우트 하나의 누적 통계
+class RouteStats:
+    __slots__ = ("buckets", "count", "seconds", "db_queries", "db_seconds", "statuses")
+
+    def __init__(self):
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)  # 마지막 칸은 +Inf
+        self.count = 0
+        self.seconds = 0.0
+        self.db_queries = 0
+        self.db_seconds = 0.0
+        self.statuses: Dict[int, int] = {}
+
+
+# 요청 메트릭 수집기
+# - 라우트 라벨은 실제 경로가 아닌 경로 템플릿(/movein/{moveIn_id})을 사용해 라벨 수가 라우트 수로 제한됨
+# - 요청당 dict 조회와 정수 덧셈 몇 번만 하므로 운영 환경에서 상시 사용 가능
+class RequestMetrics:
+    def __init__(self):
+        self.in_progress: Dict[str, int] = {}
+        self.routes: Dict[Tuple[str, str], RouteStats] = {}
+        self._lock = Lock()
+
+    def start(self, method: str):
+        with self._lock:
+            self.in_progress[method] = self.in_progress.get(method, 0) + 1
+
+    def finish(self, method: str, route: str, status: int, seconds: float, queries: RequestQueries):
+        with self._lock:
+            self.in_progress[method] -= 1
+            stats = self.routes.get((method, route))
+            if stats is None:
+                stats = self.routes[(method, route)] = RouteStats()
+            stats.buckets[bisect_left(LATENCY_BUCKETS, seconds)] += 1
+            stats.count += 1
+            stats.seconds += seconds
+            stats.db_queries += queries.count
+            stats.db_seconds += queries.seconds
+            stats.statuses[status] = stats.statuses.get(status, 0) + 1
+
+    # Prometheus 텍스트 형식 줄 목록
+    def render(self) -> List[str]:
+        with self._lock:
+            in_progress = dict(self.in_progress)
+            routes = [
+                (key, list(stats.buckets), stats.count, stats.seconds, stats.db_queries, stats.db_seconds, dict(stats.statuses))
+                for key, stats in sorted(self.routes.items())
+            ]
+
+        lines = [
+            "# HELP http_requests_in_progress 처리 중인 요청 수",
+            "# TYPE http_requests_in_progress gauge",
+        ]
+        for method, value in sorted(in_progress.items()):
+            lines.append(f"http_requests_in_progress{_labels(method=method)} {value}")
+
+        lines += ["# HELP http_requests_total 처리한 요청 수 (상태 코드별)", "# TYPE http_requests_total counter"]
+        for (method, route), _, _, _, _, _, statuses in routes:
+            for status, value in sorted(statuses.items()):
+                lines.append(f"http_requests_total{_labels(method=method, route=route, status=status)} {value}")
+
+        lines += ["# HELP http_request_duration_seconds 요청 처리 시간", "# TYPE http_request_duration_seconds histogram"]
+        for (method, route), buckets, count, seconds, _, _, _ in routes:
+            cumulative = 0
+            for bound, value in zip(LATENCY_BUCKETS + ("+Inf",), buckets):
+                cumulative += value
+                lines.append(f"http_request_duration_seconds_bucket{_labels(method=method, route=route, le=bound)} {cumulative}")
+            lines.append(f"http_request_duration_seconds_sum{_labels(method=method, route=route)} {seconds}")
+            lines.append(f"http_request_duration_seconds_count{_labels(method=method, route=route)} {count}")
+
+        lines += ["# HELP http_request_db_queries_total 요청 처리 중 실행한 쿼리 수", "# TYPE http_request_db_queries_total counter"]
+        for (method, route), _, _, _, db_queries, _, _ in routes:
+            lines.append(f"http_request_db_queries_total{_labels(method=method, route=route)} {db_queries}")
+
+        lines += ["# HELP http_request_db_seconds_total 요청 처리 중 쿼리 실행에 쓴 시간", "# TYPE http_request_db_seconds_total counter"]
+        for (method, route), _, _, _, _, db_seconds, _ in routes:
+            lines.append(f"http_request_db_seconds_total{_labels(method=method, route=route)} {db_seconds}")
+        return lines
+
+
+request_metrics = RequestMetrics()
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels) -> str:
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items()) + "}"
+
+
+# 요청 메트릭 ASGI 미들웨어
+# (BaseHTTPMiddleware 는 요청마다 태스크/스트림을 추가로 만들어 느리므로 ASGI 로 직접 구현)
+class MetricsMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status = 500
+        queries = RequestQueries()
+        token = current_request_queries.set(queries)
+        request_metrics.start(method)
+        started = perf_counter()
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            # 스트리밍 응답은 본문 전송이 끝난 시점까지 포함
+            elapsed = perf_counter() - started
+            current_request_queries.reset(token)
+            route = scope.get("route")
+            route_label = getattr(route, "path", None) or "unmatched"
+            request_metrics.finish(method, route_label, status, elapsed, queries)
+
+
+# DB 쿼리/커넥션 풀 메트릭 줄 목록
+def _db_lines() -> List[str]:
+    queries = query_stats.snapshot()
+    lines = [
+        "# HELP db_queries_total 실행한 쿼리 수",
+        "# TYPE db_queries_total counter",
+        f"db_queries_total {queries['queries']}",
+        "# HELP db_query_seconds_total 쿼리 실행에 쓴 시간",
+        "# TYPE db_query_seconds_total counter",
+        f"db_query_seconds_total {queries['seconds_total']}",
+    ]
+
+    pools = pool_snapshot()
+    metrics = [
+        ("db_pool_connections_created_total", "counter", "connections_created", "생성한 커넥션 수"),
+        ("db_pool_checkouts_total", "counter", "checkouts", "커넥션 체크아웃 수"),
+        ("db_pool_wait_seconds_total", "counter", "wait_seconds_total", "커넥션 대기 시간 합계"),
+        ("db_pool_checked_out", "gauge", "checked_out", "사용 중인 커넥션 수"),
+        ("db_pool_overflow", "gauge", "overflow", "pool_size 를 넘어 추가로 연 커넥션 수"),
+    ]
+    for name, kind, key, help_text in metrics:
+        lines += [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}"]
+        for pool_name, data in sorted(pools.items()):
+            if key in data:
+                lines.append(f"{name}{_labels(pool=pool_name)} {data[key]}")
+    return lines
+
+
+# 사용자/프로필 캐시 적중률
+def _cache_lines() -> List[str]:
+    stats = get_user_cache().stats()
+    labels = _labels(cache="user", backend=stats["backend"])
+    return [
+        "# HELP cache_hits_total 캐시 적중 수",
+        "# TYPE cache_hits_total counter",
+        f"cache_hits_total{labels} {stats['hits']}",
+        "# HELP cache_misses_total 캐시 미적중 수",
+        "# TYPE cache_misses_total counter",
+        f"cache_misses_total{labels} {stats['misses']}",
+        "# HELP cache_evictions_total 최대 크기 초과로 제거한 항목 수",
+        "# TYPE cache_evictions_total counter",
+        f"cache_evictions_total{labels} {stats['evictions']}",
+        "# HELP cache_entries 현재 캐시 항목 수",
+        "# TYPE cache_entries gauge",
+        f"cache_entries{labels} {stats['size']}",
+    ]
+
+
+# 로그 큐가 가득 차서 버린 로그 수
+def _log_lines() -> List[str]:
+    handler = log_config.queue_handler
+    return [
+        "# HELP log_records_dropped_total 로그 큐가 가득 차서 버린 로그 수",
+        "# TYPE log_records_dropped_total counter",
+        f"log_records_dropped_total {handler.dropped if handler else 0}",
+    ]
+
+
+# /metrics 응답 본문
+def render_prometheus() -> str:
+    return "\n".join(request_metrics.render() + _db_lines() + _cache_lines() + _log_lines()) + "\n"
@@ -0,0 +1,79 @@
+from datetime import datetime
+from typing import List, Optional
+
+from sqlalchemy import or_, update
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from models.MoveInInfo import MoveInInfo
+from service.movein_stats import StatsDelta, apply_stats
+
+# 미승인 조건 (isApproval 이 NULL 또는 False)
+def pending_condition():
+    return or_(MoveInInfo.isApproval.is_(None), MoveInInfo.isApproval.is_(False))
+
+
+# id 묶음 하나를 UPDATE ... WHERE id IN (...) 한 번으로 승인, 실제로 바뀐 행 수 반환
+# 승인될 행의 등록일은 같은 트랜잭션에서 잠금 조회해서 일별 통계 변경분을 함께 반영
+async def _approve_chunk(session: AsyncSession, ids: List[int], approved_at: datetime) -> int:
+    pending = (await session.exec(
+        select(MoveInInfo.regDt, MoveInInfo.isApproval, MoveInInfo.approvalDt)
+        .where(MoveInInfo.id.in_(ids), pending_condition())
+        .with_for_update()
+    )).all()
+    delta = StatsDelta()
+    for state in pending:
+        delta.add(tuple(state), -1)
+        delta.add((state[0], True, approved_at))
+    await apply_stats(session, delta)
+
+    result = await session.exec(
+        update(MoveInInfo)
+        .where(MoveInInfo.id.in_(ids), pending_condition())
+        .values(isApproval=True, approvalDt=approved_at, version=MoveInInfo.version + 1, updDt=approved_at)
+    )
+    await session.commit()
+    return result.rowcount
+
+
+# 등록 시각 기준 미승인 신고 id 를 키셋 방식으로 chunk_size 개씩 조회
+async def _pending_id_chunks(session: AsyncSession, pending_before: datetime, chunk_size: int):
+    last_id = 0
+    while True:
+        ids = (await session.exec(
+            select(MoveInInfo.id)
+            .where(pending_condition(), MoveInInfo.regDt < pending_before, MoveInInfo.id > last_id)
+            .order_by(MoveInInfo.id)
+            .limit(chunk_size)
+        )).all()
+        if not ids:
+            return
+        yield list(ids)
+        last_id = ids[-1]
+
+
+# 일괄 승인: id 목록 또는 기준 시각 이전 미승인 건 전체를 chunk 단위 set-based UPDATE 로 처리
+# 이미 승인된 건은 건너뛰며, 요청 건수와 실제 승인 건수를 반환
+async def approve_moveins(
+    session: AsyncSession,
+    chunk_size: int,
+    ids: Optional[List[int]] = None,
+    pending_before: Optional[datetime] = None,
+) -> dict:
+    approved_at = datetime.now()
+    requested = approved = chunks = 0
+
+    if ids:
+        unique_ids = sorted(set(ids))
+        for start in range(0, len(unique_ids), chunk_size):
+            chunk = unique_ids[start:start + chunk_size]
+            requested += len(chunk)
+            approved += await _approve_chunk(session, chunk, approved_at)
+            chunks += 1
+    elif pending_before is not None:
+        async for chunk in _pending_id_chunks(session, pending_before, chunk_size):
+            requested += len(chunk)
+            approved += await _approve_chunk(session, chunk, approved_at)
+            chunks += 1
+
+    return {"requested": requested, "approved": approved, "chunks": chunks, "approvalDt": approved_at}
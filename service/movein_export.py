@@ -0,0 +1,78 @@
+import csv
+import io
+import json
+from datetime import datetime
+from typing import Iterator, Optional
+
+from sqlalchemy import select
+
+from auth.hash_rrn import decrypt_rrns_batch
+from config.settings import settings
+from database.connection import engine
+from models.MoveInInfo import MoveInInfo
+from service.movein_query import approval_condition
+
+# 내보내기 형식별 Content-Type
+EXPORT_MEDIA_TYPES = {
+    "csv": "text/csv; charset=utf-8",
+    "ndjson": "application/x-ndjson",
+}
+
+# 내보낼 컬럼 (순서 = CSV 헤더 순서)
+EXPORT_COLUMNS = [
+    "id", "name", "rrn", "email", "beforeAddr", "afterAddr",
+    "regDt", "approvalDt", "moveInDt", "isApproval", "userId",
+]
+
+
+# 조건에 맞는 전입 신고 조회문 (ORM 객체 대신 컬럼만 조회)
+def build_export_query(
+    reg_from: Optional[datetime] = None,
+    reg_to: Optional[datetime] = None,
+    approved: Optional[bool] = None,
+):
+    table = MoveInInfo.__table__
+    query = select(*(table.c[name] for name in EXPORT_COLUMNS))
+    if reg_from is not None:
+        query = query.where(table.c.regDt >= reg_from)
+    if reg_to is not None:
+        query = query.where(table.c.regDt < reg_to)
+    if approved is not None:
+        query = query.where(approval_condition(approved))
+    return query.order_by(table.c.id)
+
+
+def _encode_value(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+# 서버 측 커서로 chunk_size 행씩 읽어 CSV/NDJSON 바이트로 변환 (전체 결과를 메모리에 올리지 않음)
+# StreamingResponse 가 응답을 보내는 동안 실행되므로 요청 세션과 별도로 커넥션을 직접 사용
+def stream_moveins(query, fmt: str, decrypt: bool = False) -> Iterator[bytes]:
+    chunk_size = settings.movein_export_chunk_size
+
+    if fmt == "csv":
+        # 엑셀에서 한글이 깨지지 않도록 BOM 포함
+        yield ("\ufeff" + ",".join(EXPORT_COLUMNS) + "\r\n").encode()
+
+    with engine.connect() as conn:
+        result = conn.execution_options(stream_results=True, yield_per=chunk_size).execute(query)
+        for rows in result.partitions():
+            records = [dict(row._mapping) for row in rows]
+            if decrypt:
+                plain = decrypt_rrns_batch([record["rrn"] for record in records])
+                for record, rrn in zip(records, plain):
+                    record["rrn"] = rrn if rrn is not None else "복호화 실패"
+
+            buffer = io.StringIO()
+            if fmt == "csv":
+                writer = csv.writer(buffer)
+                for record in records:
+                    writer.writerow([_encode_value(record[name]) for name in EXPORT_COLUMNS])
+            else:
+                for record in records:
+                    buffer.write(json.dumps(record, default=_encode_value, ensure_ascii=False))
+                    buffer.write("\n")
+            yield buffer.getvalue().encode()
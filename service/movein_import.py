@@ -0,0 +1,159 @@
+import csv
+import io
+import json
+from datetime import datetime
+from time import perf_counter
+from typing import Iterator, List, Tuple
+
+from pydantic import ValidationError
+from sqlalchemy import insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from auth.hash_rrn import encrypt_rrns_parallel, rrn_blind_index
+from config.settings import settings
+from models.MoveInInfo import MoveInInfo, MoveInInfoImport
+from service.movein_stats import StatsDelta, apply_stats
+from service.region import region_columns
+
+# 지원하는 입력 형식
+IMPORT_FORMATS = ("csv", "ndjson")
+
+
+# UTF-8 로 읽을 수 없는 바이트는 U+FFFD 로 바뀌어 들어오므로 해당 행은 오류로 처리
+DECODE_ERROR = "UTF-8 로 읽을 수 없는 문자가 있습니다."
+
+
+# 파일을 한 줄씩 읽어 (행 번호, 레코드 dict) 로 반환 (파일 전체를 메모리에 올리지 않음)
+# 파싱에 실패한 행은 레코드 대신 예외 객체를 반환 (인코딩이 깨진 행도 파일 전체를 중단하지 않고 해당 행만 실패)
+def iter_records(file_obj, fmt: str) -> Iterator[Tuple[int, object]]:
+    text = io.TextIOWrapper(file_obj, encoding="utf-8-sig", errors="replace", newline="")
+    try:
+        if fmt == "csv":
+            reader = csv.DictReader(text)
+            while True:
+                try:
+                    record = next(reader)
+                except StopIteration:
+                    break
+                except csv.Error as e:
+                    # 필드 길이 초과/잘못된 따옴표 등은 이후 행 경계를 알 수 없으므로 오류로 남기고 읽기 중단
+                    yield reader.line_num, ValueError(f"CSV 형식 오류로 이후 행을 읽지 않았습니다: {e}")
+                    return
+                if any("\ufffd" in f"{k}{v}" for k, v in record.items()):
+                    yield reader.line_num, ValueError(DECODE_ERROR)
+                    continue
+                # CSV 빈 칸은 값 없음으로 처리
+                yield reader.line_num, {k: (v if v != "" else None) for k, v in record.items() if k}
+        else:
+            for line_no, line in enumerate(text, start=1):
+                if not line.strip():
+                    continue
+                if "\ufffd" in line:
+                    yield line_no, ValueError(DECODE_ERROR)
+                    continue
+                try:
+                    yield line_no, json.loads(line)
+                except ValueError as e:
+                    yield line_no, e
+    finally:
+        # UploadFile 의 파일 객체는 호출한 쪽에서 닫으므로 분리만 함
+        text.detach()
+
+
+# 검증 오류를 한 줄 메시지로 변환
+def format_error(error: Exception) -> str:
+    if isinstance(error, ValidationError):
+        return "; ".join(f"{'.'.join(map(str, e['loc']))}: {e['msg']}" for e in error.errors())
+    if isinstance(error, SQLAlchemyError):
+        # SQL 문과 파라미터(암호화된 주민번호 포함)는 응답에 담지 않음
+        return str(getattr(error, "orig", None) or type(error).__name__)
+    return str(error)
+
+
+class ImportReport:
+    def __init__(self):
+        self.inserted = 0
+        self.failed = 0
+        self.errors: List[dict] = []
+        self.started = perf_counter()
+
+    def add_error(self, line: int, error: Exception):
+        self.failed += 1
+        if len(self.errors) < settings.movein_import_max_errors:
+            self.errors.append({"line": line, "error": format_error(error)})
+
+    def to_dict(self) -> dict:
+        elapsed = perf_counter() - self.started
+        return {
+            "inserted": self.inserted,
+            "failed": self.failed,
+            "errors": self.errors,
+            "elapsed_seconds": round(elapsed, 3),
+            "rows_per_second": round(self.inserted / elapsed, 1) if elapsed else 0.0,
+        }
+
+
+# 저장할 행의 일별 통계 변경분 (등록 시에는 모두 미승인)
+def _stats_delta(values: List[dict]) -> StatsDelta:
+    delta = StatsDelta()
+    for value in values:
+        delta.add((value["regDt"], False, None))
+    return delta
+
+
+# 한 묶음 저장: 주민번호 병렬 암호화 후 multi-row INSERT 한 번, 실패 시 행 단위로 재시도해 오류 행만 골라냄
+async def _flush_batch(session: AsyncSession, batch: List[Tuple[int, MoveInInfoImport]], user_id: int, report: ImportReport):
+    encrypted = await encrypt_rrns_parallel([row.rrn for _, row in batch])
+    now = datetime.now()
+    values = [
+        {
+            **row.model_dump(exclude={"rrn"}), "rrn": token, "rrnIndex": rrn_blind_index(row.rrn), "regDt": now, "userId": user_id,
+            **region_columns(row.beforeAddr, row.afterAddr),  # 같은 동네 주소는 캐시된 결과 사용
+        }
+        for (_, row), token in zip(batch, encrypted)
+    ]
+
+    try:
+        await session.exec(insert(MoveInInfo), params=values)
+        await apply_stats(session, _stats_delta(values))
+        await session.commit()
+        report.inserted += len(values)
+        return
+    except SQLAlchemyError:
+        await session.rollback()
+
+    for (line, _), value in zip(batch, values):
+        try:
+            await session.exec(insert(MoveInInfo), params=[value])
+            await apply_stats(session, _stats_delta([value]))
+            await session.commit()
+            report.inserted += 1
+        except SQLAlchemyError as e:
+            await session.rollback()
+            report.add_error(line, e)
+
+
+# CSV/NDJSON 파일을 읽어 전입 신고를 batch_size 건씩 저장
+async def import_moveins(session: AsyncSession, file_obj, fmt: str, user_id: int, batch_size: int) -> dict:
+    report = ImportReport()
+    batch: List[Tuple[int, MoveInInfoImport]] = []
+
+    for line, record in iter_records(file_obj, fmt):
+        if isinstance(record, Exception):
+            report.add_error(line, record)
+            continue
+        try:
+            batch.append((line, MoveInInfoImport.model_validate(record)))
+        except ValidationError as e:
+            report.add_error(line, e)
+            continue
+
+        if len(batch) >= batch_size:
+            await _flush_batch(session, batch, user_id, report)
+            batch = []
+
+    if batch:
+        await _flush_batch(session, batch, user_id, report)
+
+    return report.to_dict()
@@ -0,0 +1,74 @@
+from datetime import datetime
+from typing import Optional, Sequence
+
+from sqlalchemy import false, func, true
+from sqlmodel import select
+
+from models.MoveInInfo import MoveInInfo, MoveInInfoItem
+from service.region import region_level
+
+
+# 목록 응답 컬럼 (MoveInInfoPage.items 와 같은 필드, rrnIndex 제외)
+# ORM 객체 대신 행으로 조회해서 identity map/모델 생성 비용 없이 바로 직렬화
+LIST_COLUMNS = tuple(MoveInInfo.__table__.c[name] for name in MoveInInfoItem.model_fields)
+
+
+# 지역 코드 컬럼 (side: before 전출지 / after 전입지, level: sido / sigungu / emd)
+def region_column(side: str, level: str):
+    return getattr(MoveInInfo, f"{side}{level.capitalize()}")
+
+
+# 승인 상태 조건 (isApproval 은 NULL 없이 저장하므로 = 비교로 (isApproval, id) 인덱스를 사용)
+def approval_condition(approved: bool):
+    return MoveInInfo.isApproval == (true() if approved else false())
+
+
+# 전입 신고 목록 조회문 (id 내림차순 키셋 페이지네이션, limit + 1 건 조회)
+# - owner_id 지정: (userId, id) 인덱스 범위 조회 ("내 신고 내역")
+# - approved 지정: (isApproval, id) 인덱스 범위 조회 (관리자 승인 대기 목록)
+# - 등록일 범위만 지정: regDt 인덱스 범위 조회
+# - region 지정: 코드 길이에 맞는 지역 컬럼의 (지역, id) 인덱스 범위 조회
+# - columns 지정 시 해당 컬럼만 조회 (예: LIST_COLUMNS)
+def build_list_query(
+    limit: int,
+    owner_id: Optional[int] = None,
+    approved: Optional[bool] = None,
+    reg_from: Optional[datetime] = None,
+    reg_to: Optional[datetime] = None,
+    name: Optional[str] = None,
+    after: Optional[int] = None,
+    columns: Optional[Sequence] = None,
+    region: Optional[str] = None,
+    side: str = "after",
+):
+    query = select(*columns) if columns else select(MoveInInfo)
+    if owner_id is not None:
+        query = query.where(MoveInInfo.userId == owner_id)
+    if approved is not None:
+        query = query.where(approval_condition(approved))
+    if reg_from is not None:
+        query = query.where(MoveInInfo.regDt >= reg_from)
+    if reg_to is not None:
+        query = query.where(MoveInInfo.regDt < reg_to)
+    if name:
+        query = query.where(MoveInInfo.name.startswith(name, autoescape=True))
+    if region:
+        query = query.where(region_column(side, region_level(region)) == region)
+    if after is not None:
+        query = query.where(MoveInInfo.id < after)
+    return query.order_by(MoveInInfo.id.desc()).limit(limit + 1)
+
+
+# 지역별 건수 조회문: region 아래 한 단계 지역별 건수 (region 이 없으면 시도별, 읍면동이면 해당 읍면동 하나)
+# 하위 코드는 상위 코드로 시작하므로 하위 컬럼의 접두어 일치(LIKE 'x%', 인덱스 범위 조회) 하나로 거르고 같은 인덱스 순서대로 집계
+def build_region_count_query(side: str, region: Optional[str] = None):
+    if region is None:
+        column = region_column(side, "sido")
+        query = select(column, func.count())
+    elif region_level(region) == "emd":
+        column = region_column(side, "emd")
+        query = select(column, func.count()).where(column == region)
+    else:
+        column = region_column(side, "sigungu" if region_level(region) == "sido" else "emd")
+        query = select(column, func.count()).where(column.startswith(region, autoescape=True))
+    return query.group_by(column).order_by(func.count().desc())
@@ -0,0 +1,139 @@
+from collections import defaultdict
+from datetime import date, datetime
+from typing import Dict, Optional
+
+from sqlalchemy import delete, insert
+from sqlalchemy.dialects import mysql, sqlite
+from sqlmodel import Session, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from models.MoveInInfo import MoveInInfo
+from models.stats import MoveInDailyStats, MoveInDailyStatsItem, MoveInStats
+
+# 집계 컬럼 (StatsDelta 의 일별 값 순서)
+STAT_FIELDS = ("total", "approved", "approvalSeconds", "approvalSamples")
+
+
+# 시간대가 있는 값은 서버 현지 시각으로 바꾼 뒤 시간대 제거 (datetime.now() 로 저장하는 값과 같은 기준)
+def to_local_naive(value):
+    if isinstance(value, datetime) and value.tzinfo is not None:
+        return value.astimezone().replace(tzinfo=None)
+    return value
+
+
+# 통계에 반영되는 신고 상태 (regDt, isApproval, approvalDt)
+def stats_state(movein: MoveInInfo) -> tuple:
+    return to_local_naive(movein.regDt), movein.isApproval, to_local_naive(movein.approvalDt)
+
+
+# 등록일별 통계 변경분
+# - add(상태, +1): 해당 상태의 신고를 더함 (등록), add(상태, -1): 뺌 (삭제)
+# - 수정/승인은 변경 전 상태를 -1, 변경 후 상태를 +1 로 더함
+# - 변경 전 상태는 행을 잠근 채 읽어야 함 (잠금 없이 읽으면 동시 요청이 같은 상태를 두 번 빼고 더함)
+class StatsDelta:
+    def __init__(self):
+        self.days: Dict[date, list] = defaultdict(lambda: [0, 0, 0, 0])
+
+    def add(self, state: tuple, sign: int = 1) -> None:
+        reg_dt, is_approval, approval_dt = state
+        if reg_dt is None:
+            return  # 등록일이 없으면 집계 대상 아님
+        values = self.days[reg_dt.date()]
+        values[0] += sign
+        if is_approval:
+            values[1] += sign
+            if approval_dt is not None:
+                values[2] += sign * round((approval_dt - reg_dt).total_seconds())
+                values[3] += sign
+
+    # 변경이 있는 날짜만 [{"day": ..., "total": ..., ...}] 로 반환
+    def rows(self) -> list:
+        return [
+            {"day": day, **dict(zip(STAT_FIELDS, values))}
+            for day, values in sorted(self.days.items())
+            if any(values)
+        ]
+
+
+# 날짜별 한 행 upsert (이미 있으면 변경분을 더함) - 동시 요청이 있어도 DB 에서 원자적으로 더해짐
+def _upsert_statement(dialect_name: str):
+    if dialect_name == "mysql":
+        statement = mysql.insert(MoveInDailyStats)
+        return statement.on_duplicate_key_update(
+            {field: getattr(MoveInDailyStats, field) + statement.inserted[field] for field in STAT_FIELDS}
+        )
+    if dialect_name == "sqlite":
+        statement = sqlite.insert(MoveInDailyStats)
+        return statement.on_conflict_do_update(
+            index_elements=[MoveInDailyStats.day],
+            set_={field: getattr(MoveInDailyStats, field) + statement.excluded[field] for field in STAT_FIELDS},
+        )
+    raise ValueError(f"지원하지 않는 DB 입니다: {dialect_name}")
+
+
+# 변경분 반영 (commit 은 호출한 쪽에서 신고 변경과 같은 트랜잭션으로)
+async def apply_stats(session: AsyncSession, delta: StatsDelta) -> None:
+    rows = delta.rows()
+    if rows:
+        connection = await session.connection()
+        await session.exec(_upsert_statement(connection.dialect.name), params=rows)
+
+
+# 기간 통계 조회 (일별 요약 행만 읽으므로 신고 건수와 무관하게 O(일수))
+async def load_stats(session: AsyncSession, day_from: Optional[date] = None, day_to: Optional[date] = None) -> MoveInStats:
+    query = select(MoveInDailyStats)
+    if day_from is not None:
+        query = query.where(MoveInDailyStats.day >= day_from)
+    if day_to is not None:
+        query = query.where(MoveInDailyStats.day <= day_to)
+    rows = (await session.exec(query.order_by(MoveInDailyStats.day))).all()
+
+    def average(seconds: int, samples: int) -> Optional[float]:
+        return round(seconds / samples, 1) if samples else None
+
+    days = [
+        MoveInDailyStatsItem(
+            day=row.day,
+            total=row.total,
+            approved=row.approved,
+            pending=row.total - row.approved,
+            avgApprovalSeconds=average(row.approvalSeconds, row.approvalSamples),
+        )
+        for row in rows
+        if row.total
+    ]
+    total = sum(row.total for row in rows)
+    approved = sum(row.approved for row in rows)
+    return MoveInStats(
+        total=total,
+        approved=approved,
+        pending=total - approved,
+        avgApprovalSeconds=average(sum(row.approvalSeconds for row in rows), sum(row.approvalSamples for row in rows)),
+        days=days,
+    )
+
+
+# 신고 전체를 id 순으로 batch_size 건씩 읽어 통계를 다시 계산하고 요약 테이블을 교체 (요약 행 수 반환)
+# 재계산 중에 들어온 변경분은 덮어써질 수 있으므로 신고 변경이 적은 시간에 실행
+def rebuild_stats(session: Session, batch_size: int) -> int:
+    delta = StatsDelta()
+    last_id = 0
+    while True:
+        rows = session.exec(
+            select(MoveInInfo.id, MoveInInfo.regDt, MoveInInfo.isApproval, MoveInInfo.approvalDt)
+            .where(MoveInInfo.id > last_id)
+            .order_by(MoveInInfo.id)
+            .limit(batch_size)
+        ).all()
+        if not rows:
+            break
+        last_id = rows[-1][0]
+        for row in rows:
+            delta.add(tuple(row[1:]))
+
+    rows = delta.rows()
+    session.exec(delete(MoveInDailyStats))
+    if rows:
+        session.exec(insert(MoveInDailyStats), params=rows)
+    session.commit()
+    return len(rows)
@@ -0,0 +1,217 @@
+import asyncio
+import logging
+import re
+from collections import defaultdict
+from functools import lru_cache
+from typing import Dict, NamedTuple, Optional, Tuple
+
+from sqlmodel import Session, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from config.settings import settings
+from models.region import RegionCode
+
+logger = logging.getLogger(__name__)
+
+# 시도 코드 (법정동코드 앞 2자리), 법정동코드 자료를 적재하지 않아도 시도까지는 변환
+SIDO_CODES = {
+    "서울특별시": "11", "부산광역시": "26", "대구광역시": "27", "인천광역시": "28", "광주광역시": "29",
+    "대전광역시": "30", "울산광역시": "31", "세종특별자치시": "36", "경기도": "41", "충청북도": "43",
+    "충청남도": "44", "전라남도": "46", "경상북도": "47", "경상남도": "48", "제주특별자치도": "50",
+    "강원특별자치도": "51", "전북특별자치도": "52",
+}
+
+# 주소에 흔히 쓰는 시도 표기 → 정식 명칭 (개편 전 명칭 포함)
+SIDO_ALIASES = {
+    **{name: name for name in SIDO_CODES},
+    "서울": "서울특별시", "서울시": "서울특별시",
+    "부산": "부산광역시", "부산시": "부산광역시",
+    "대구": "대구광역시", "대구시": "대구광역시",
+    "인천": "인천광역시", "인천시": "인천광역시",
+    "광주": "광주광역시", "광주시": "광주광역시",
+    "대전": "대전광역시", "대전시": "대전광역시",
+    "울산": "울산광역시", "울산시": "울산광역시",
+    "세종": "세종특별자치시", "세종시": "세종특별자치시",
+    "경기": "경기도",
+    "충북": "충청북도", "충남": "충청남도",
+    "전남": "전라남도", "경북": "경상북도", "경남": "경상남도",
+    "제주": "제주특별자치도", "제주도": "제주특별자치도",
+    "강원": "강원특별자치도", "강원도": "강원특별자치도",
+    "전북": "전북특별자치도", "전라북도": "전북특별자치도",
+}
+
+# 지역 단계별 코드 길이
+LEVEL_LENGTHS = {"sido": 2, "sigungu": 5, "emd": 8}
+
+
+class RegionCodes(NamedTuple):
+    sido: Optional[str] = None
+    sigungu: Optional[str] = None
+    emd: Optional[str] = None
+
+
+# 법정동코드 조회용 메모리 색인 (이름 → 코드)
+class RegionIndex:
+    def __init__(self, rows):
+        self.names: Dict[str, str] = {code: name for name, code in SIDO_CODES.items()}  # 코드 → 이름
+        self.sigungu: Dict[str, str] = {}  # "서울특별시 종로구" → "11110"
+        self.emd: Dict[str, str] = {}  # "서울특별시 종로구 청운동" → "11110101"
+        self.sigungu_short = defaultdict(set)  # "종로구" → {"11110"} (시도 없이 시작하는 주소용)
+        for code, name in rows:
+            if code[2:] == "00000000":
+                continue  # 시도는 SIDO_CODES 사용
+            if code[5:] == "00000":
+                self.sigungu[name] = code[:5]
+                self.names[code[:5]] = name
+                sido_name, _, short = name.partition(" ")
+                self.sigungu_short[short or sido_name].add(code[:5])
+            elif code[8:] == "00":
+                self.emd[name] = code[:8]
+                self.names[code[:8]] = name
+
+    # 법정동코드가 적재되어 있는지 (없으면 시도까지만 변환 가능)
+    @property
+    def loaded(self) -> bool:
+        return bool(self.sigungu or self.emd)
+
+    # 코드 → 이름 (색인에 없으면 None)
+    def name_of(self, code: str) -> Optional[str]:
+        return self.names.get(code)
+
+
+_index: Optional[RegionIndex] = None
+
+
+def _set_index(index: RegionIndex) -> RegionIndex:
+    global _index
+    _index = index
+    _resolve.cache_clear()  # 이전 색인으로 계산한 결과 버림
+    return index
+
+
+# 법정동코드 색인
+# - 애플리케이션은 시작할 때 load_region_index 로 읽어 둔 색인을 사용 (요청 처리 중 동기 DB 조회 없음)
+# - 작업 스크립트처럼 미리 읽지 않은 경우에만 처음 사용할 때 동기 조회
+def get_region_index() -> RegionIndex:
+    if _index is None:
+        from database.connection import engine
+
+        with Session(engine) as session:
+            _set_index(RegionIndex(session.exec(select(RegionCode.code, RegionCode.name)).all()))
+    return _index
+
+
+# 비동기 세션으로 색인을 (다시) 읽음
+async def load_region_index(session: AsyncSession) -> RegionIndex:
+    rows = (await session.exec(select(RegionCode.code, RegionCode.name))).all()
+    return _set_index(RegionIndex(rows))
+
+
+# 시작 시 법정동코드가 비어 있으면 적재될 때까지 interval 초마다 다시 읽음 (애플리케이션 lifespan 에서 task 로 실행)
+async def reload_region_index_until_loaded(interval: float) -> None:
+    from database.connection import AsyncSessionLocal
+
+    while not get_region_index().loaded:
+        await asyncio.sleep(interval)
+        try:
+            async with AsyncSessionLocal() as session:
+                index = await load_region_index(session)
+        except Exception as e:
+            logger.error("법정동코드 색인 조회 실패", extra={"error": str(e)})
+            continue
+        if index.loaded:
+            logger.info("법정동코드 색인 적재", extra={"sigungu": len(index.sigungu), "emd": len(index.emd)})
+
+
+# 읍면동 후보 표기 (행정동 "역삼1동" → 법정동 "역삼동")
+def _emd_candidates(token: str):
+    yield token
+    legal = re.sub(r"\d+(?:\.\d+)?동$", "동", token)
+    if legal != token:
+        yield legal
+
+
+# 주소 앞부분(시도~읍면동 후보)을 코드로 변환 (같은 앞부분은 한 번만 계산, 색인을 다시 읽으면 비움)
+@lru_cache(maxsize=settings.region_cache_size)
+def _resolve(tokens: Tuple[str, ...], dong_hint: Optional[str]) -> RegionCodes:
+    index = get_region_index()
+    sido_name = SIDO_ALIASES.get(tokens[0]) if tokens else None
+    rest = tokens[1:] if sido_name else tokens
+
+    # 시군구: "성남시 분당구" 처럼 두 단어인 경우를 먼저 확인
+    sigungu_name = sigungu = None
+    for size in (2, 1):
+        if len(rest) < size:
+            continue
+        short = " ".join(rest[:size])
+        if sido_name:
+            sigungu = index.sigungu.get(f"{sido_name} {short}")
+        elif len(index.sigungu_short.get(short, ())) == 1:
+            # 시도 없이 시작하면 전국에서 이름이 하나뿐인 시군구만 인정 ("중구" 등은 판단 불가)
+            sigungu = next(iter(index.sigungu_short[short]))
+        if sigungu:
+            sigungu_name = index.name_of(sigungu)
+            rest = rest[size:]
+            break
+    if not sigungu and sido_name and sido_name in index.sigungu:
+        # 세종특별자치시처럼 시군구가 없는 시도
+        sigungu, sigungu_name = index.sigungu[sido_name], sido_name
+
+    sido = SIDO_CODES.get(sido_name) if sido_name else (sigungu[:2] if sigungu else None)
+
+    # 읍면동: 지번 주소는 시군구 다음 단어, 도로명 주소는 괄호 안의 참고항목 (예: "세종대로 175 (세종로)")
+    emd = None
+    if sigungu_name:
+        for token in ([rest[0]] if rest else []) + ([dong_hint] if dong_hint else []):
+            for candidate in _emd_candidates(token):
+                emd = index.emd.get(f"{sigungu_name} {candidate}")
+                if emd:
+                    break
+            if emd:
+                break
+
+    return RegionCodes(sido, sigungu, emd)
+
+
+# 주소 문자열 → 지역 코드
+# 공백을 정리한 앞부분(숫자로 시작하는 번지/건물번호 전까지, 최대 4단어: 시도, 시군구 최대 2단어, 읍면동)과
+# 괄호 안 첫 항목만 키로 사용하므로 번지/건물명/호수가 달라도 같은 동네 주소는 캐시된 결과를 재사용
+# 법정동코드가 적재되기 전의 결과(시도만 채워짐)는 캐시하지 않음
+def parse_region(address: Optional[str]) -> RegionCodes:
+    if not address:
+        return RegionCodes()
+    hint = re.search(r"\(([^)]*)\)", address)
+    dong_hint = (hint.group(1).split(",")[0].strip() or None) if hint else None
+    tokens = []
+    for token in re.sub(r"\([^)]*\)", " ", address).split()[:4]:
+        if token[0].isdigit():
+            break
+        tokens.append(token)
+    if not get_region_index().loaded:
+        return _resolve.__wrapped__(tuple(tokens), dong_hint)
+    return _resolve(tuple(tokens), dong_hint)
+
+
+# 전출지/전입지 주소로 MoveInInfo 지역 컬럼 값 계산
+def region_columns(before_addr: Optional[str], after_addr: Optional[str]) -> dict:
+    before = parse_region(before_addr)
+    after = parse_region(after_addr)
+    return {
+        "beforeSido": before.sido, "beforeSigungu": before.sigungu, "beforeEmd": before.emd,
+        "afterSido": after.sido, "afterSigungu": after.sigungu, "afterEmd": after.emd,
+    }
+
+
+# 코드 길이로 단계 판단 (2: 시도, 5: 시군구, 8: 읍면동)
+def region_level(code: str) -> Optional[str]:
+    for level, length in LEVEL_LENGTHS.items():
+        if len(code) == length and code.isdigit():
+            return level
+    return None
+
+
+# 색인을 다시 읽어야 할 때 (코드 적재 직후 같은 프로세스에서 백필할 때 등)
+def reset_region_cache() -> None:
+    global _index
+    _index = None
+    _resolve.cache_clear()
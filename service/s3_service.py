@@ -1,48 +1,89 @@
-import boto3
+from functools import lru_cache
+from typing import Optional
 from uuid import uuid4
 from pathlib import Path
+import logging
 import mimetypes
 from config.settings import settings
 from datetime import datetime
-from botocore.exceptions import NoCredentialsError, ClientError, BotoCoreError
-
-# S3 클라이언트 생성
-s3 = boto3.client(
-    "s3",
-    aws_access_key_id=settings.aws_access_key,
-    aws_secret_access_key=settings.aws_secret_key,
-    region_name="ap-northeast-2",
-    endpoint_url=settings.endpoint_url
-)
-
-# 업로드 함수
-def upload_file_to_s3(file_obj, filename: str) -> str:
-    try:
-        print("[📤 S3 업로드 시작]")
-        ext = Path(filename).suffix
 
-        now = datetime.utcnow()
-        folder_path = f"uploads/{now.year}/{now.strftime('%m/%d')}"
-        key = f"{folder_path}/{uuid4().hex}{ext}"
-        print(f"[🔑 키 생성됨] key = {key}")
+logger = logging.getLogger(__name__)
+
+# S3 클라이언트 생성 (최초 사용 시 한 번만 생성, moto 등으로 교체할 때는 cache_clear() 호출)
+# boto3 는 import 자체가 무거우므로 S3 를 처음 사용할 때 import (로컬 저장소만 쓰면 import 하지 않음)
+@lru_cache(maxsize=1)
+def get_s3_client():
+    import boto3
+
+    return boto3.client(
+        "s3",
+        aws_access_key_id=settings.aws_access_key,
+        aws_secret_access_key=settings.aws_secret_key,
+        region_name="ap-northeast-2",
+        endpoint_url=settings.endpoint_url
+    )
+
+# S3 호출 실패로 처리할 예외 목록 (botocore 도 import 가 무거우므로 예외가 발생했을 때 import)
+def _s3_errors() -> tuple:
+    from botocore.exceptions import BotoCoreError, ClientError, NoCredentialsError
+
+    return NoCredentialsError, ClientError, BotoCoreError
+
+# 멀티파트 전송 설정 (임계값 이상이면 chunk 단위로 나눠 병렬 전송)
+@lru_cache(maxsize=1)
+def get_transfer_config():
+    from boto3.s3.transfer import TransferConfig
+
+    return TransferConfig(
+        multipart_threshold=settings.s3_multipart_threshold,
+        multipart_chunksize=settings.s3_multipart_chunksize,
+        max_concurrency=settings.s3_max_concurrency,
+    )
 
-        content_type = mimetypes.guess_type(filename)[0] or "application/octet-stream"
-        print(f"[🧾 타입] = {content_type}")
+# 직접 업로드 키의 사용자별 접두어 (업로드 완료 시 이 접두어의 키만 본인 파일로 인정)
+def upload_key_prefix(owner_id: int) -> str:
+    return f"uploads/users/{int(owner_id)}/"
 
-        s3.upload_fileobj(
+# 업로드 키 생성 (uploads/연/월/일/uuid.확장자, owner_id 지정 시 uploads/users/사용자id/연/월/일/uuid.확장자)
+def build_object_key(filename: str, owner_id: Optional[int] = None) -> str:
+    ext = Path(filename).suffix
+    now = datetime.utcnow()
+    prefix = upload_key_prefix(owner_id) if owner_id is not None else "uploads/"
+    folder_path = f"{prefix}{now.year}/{now.strftime('%m/%d')}"
+    return f"{folder_path}/{uuid4().hex}{ext}"
+
+# 키로 접근 URL 생성
+def object_url(key: str) -> str:
+    return f"{settings.endpoint_url}/{settings.bucket_name}/{key}"
+
+# URL 에서 키 추출
+def key_from_url(file_url: str) -> str:
+    full_prefix = f"{settings.endpoint_url}/{settings.bucket_name}/"
+
+    if not file_url.startswith(full_prefix):
+        raise ValueError("잘못된 파일 URL입니다.")
+
+    return file_url.replace(full_prefix, "")
+
+# 업로드 함수 (key 를 지정하지 않으면 새로 생성)
+def upload_file_to_s3(file_obj, filename: str, key: Optional[str] = None) -> str:
+    key = key or build_object_key(filename)
+    content_type = mimetypes.guess_type(filename)[0] or "application/octet-stream"
+    try:
+        get_s3_client().upload_fileobj(
             file_obj,
             settings.bucket_name,
             key,
             # ExtraArgs={"ContentType": content_type, "ACL": "public-read"}  # 공개 접근 허용
-            ExtraArgs={"ContentType": content_type}  # ACL 제거
+            ExtraArgs={"ContentType": content_type},  # ACL 제거
+            Config=get_transfer_config()
         )
-        print("[✅ 업로드 성공]")
+        logger.debug("S3 업로드 완료", extra={"key": key, "content_type": content_type})
 
-        return f"{settings.endpoint_url}/{settings.bucket_name}/{key}"
+        return object_url(key)
 
-    except (NoCredentialsError, ClientError, BotoCoreError) as e:
-        print(f"{settings.endpoint_url}/{settings.bucket_name}/{key}")
-        print(f"[❌ 업로드 실패]: {str(e)}")
+    except _s3_errors() as e:
+        logger.error("S3 업로드 실패", extra={"bucket": settings.bucket_name, "key": key, "error": str(e)})
         raise RuntimeError(f"S3 파일 업로드 실패: {str(e)}")
     
 def delete_file_from_s3(file_url: str) -> None:
@@ -56,22 +97,50 @@ def delete_file_from_s3(file_url: str) -> None:
         RuntimeError: 삭제 실패 시 예외 발생
     """
     try:
-        print("[🗑️ S3 삭제 시작]")
-
-        full_prefix = f"{settings.endpoint_url}/{settings.bucket_name}/"
-
-        if not file_url.startswith(full_prefix):
-            raise ValueError("잘못된 파일 URL입니다.")
+        key = key_from_url(file_url)
+        get_s3_client().delete_object(
+            Bucket=settings.bucket_name,
+            Key=key
+        )
+        logger.debug("S3 삭제 완료", extra={"key": key})
 
-        key = file_url.replace(full_prefix, "")
-        print(f"[🔑 삭제할 key] = {key}")
+    except (ValueError, *_s3_errors()) as e:
+        logger.error("S3 삭제 실패", extra={"file_url": file_url, "error": str(e)})
+        raise RuntimeError(f"NCP 파일 삭제 실패: {str(e)}")
 
-        s3.delete_object(
+# 브라우저가 버킷에 직접 업로드할 수 있는 presigned POST 발급
+# (크기와 Content-Type 조건을 정책에 포함시켜 S3 가 직접 검증)
+def create_presigned_upload(filename: str, content_type: str, max_bytes: int, expires_in: int, owner_id: int) -> dict:
+    key = build_object_key(filename, owner_id)
+    try:
+        post = get_s3_client().generate_presigned_post(
             Bucket=settings.bucket_name,
-            Key=key
+            Key=key,
+            Fields={"Content-Type": content_type},
+            Conditions=[
+                {"Content-Type": content_type},
+                ["content-length-range", 1, max_bytes],
+            ],
+            ExpiresIn=expires_in,
         )
-        print("[✅ 삭제 성공]")
+    except _s3_errors() as e:
+        raise RuntimeError(f"presigned URL 발급 실패: {str(e)}")
+
+    return {"url": post["url"], "fields": post["fields"], "key": key, "fileUrl": object_url(key)}
+
+# 업로드된 객체 메타데이터 조회 (HEAD)
+def head_object(key: str) -> dict:
+    try:
+        response = get_s3_client().head_object(Bucket=settings.bucket_name, Key=key)
+    except _s3_errors() as e:
+        raise RuntimeError(f"S3 객체 조회 실패: {str(e)}")
+
+    return {"size": response["ContentLength"], "contentType": response.get("ContentType")}
 
-    except (NoCredentialsError, ClientError, BotoCoreError, ValueError) as e:
-        print(f"[❌ 삭제 실패]: {str(e)}")
-        raise RuntimeError(f"NCP 파일 삭제 실패: {str(e)}")
\ No newline at end of file
+# 객체 내용 다운로드
+def download_object(key: str) -> bytes:
+    try:
+        response = get_s3_client().get_object(Bucket=settings.bucket_name, Key=key)
+        return response["Body"].read()
+    except _s3_errors() as e:
+        raise RuntimeError(f"S3 객체 다운로드 실패: {str(e)}")
@@ -0,0 +1,161 @@
+import asyncio
+import mimetypes
+import os
+import shutil
+import tempfile
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+
+from config.settings import settings
+from service import s3_service
+
+# 비동기 API 에서 사용하는 저장소 I/O 전용 스레드 풀 (이벤트 루프 블로킹 방지)
+_storage_executor = ThreadPoolExecutor(max_workers=settings.storage_io_workers, thread_name_prefix="storage-io")
+
+
+# 파일 저장소 인터페이스
+# - 키 형식은 모든 구현이 동일: uploads/연/월/일/uuid.확장자 (직접 업로드는 uploads/users/사용자id/연/월/일/uuid.확장자)
+# - 라우트에서는 get_storage() 로 받은 구현체의 *_async 메서드를 사용
+class StorageBackend(ABC):
+    # 업로드 후 접근 URL 반환
+    @abstractmethod
+    def upload(self, file_obj, filename: str, key: Optional[str] = None) -> str: ...
+
+    # 업로드 시 반환된 URL 로 파일 삭제
+    @abstractmethod
+    def delete(self, file_url: str) -> None: ...
+
+    # 객체 메타데이터 조회 ({"size", "contentType"}), 없으면 RuntimeError
+    @abstractmethod
+    def head(self, key: str) -> dict: ...
+
+    # 객체 내용 읽기
+    @abstractmethod
+    def read(self, key: str) -> bytes: ...
+
+    # 키로 접근 URL 생성
+    @abstractmethod
+    def object_url(self, key: str) -> str: ...
+
+    # 접근 URL 에서 키 추출 (형식이 맞지 않으면 ValueError)
+    @abstractmethod
+    def key_from_url(self, file_url: str) -> str: ...
+
+    # 클라이언트 직접 업로드용 URL 발급 (키는 owner_id 의 접두어 아래, 지원하지 않는 저장소는 NotImplementedError)
+    def create_presigned_upload(self, filename: str, content_type: str, max_bytes: int, expires_in: int, owner_id: int) -> dict:
+        raise NotImplementedError("현재 저장소는 직접 업로드를 지원하지 않습니다.")
+
+    async def upload_async(self, file_obj, filename: str, key: Optional[str] = None) -> str:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_storage_executor, self.upload, file_obj, filename, key)
+
+    async def delete_async(self, file_url: str) -> None:
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(_storage_executor, self.delete, file_url)
+
+    async def head_async(self, key: str) -> dict:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_storage_executor, self.head, key)
+
+    async def read_async(self, key: str) -> bytes:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_storage_executor, self.read, key)
+
+
+# S3 (또는 S3 호환) 저장소
+class S3Storage(StorageBackend):
+    def upload(self, file_obj, filename: str, key: Optional[str] = None) -> str:
+        return s3_service.upload_file_to_s3(file_obj, filename, key)
+
+    def delete(self, file_url: str) -> None:
+        s3_service.delete_file_from_s3(file_url)
+
+    def head(self, key: str) -> dict:
+        return s3_service.head_object(key)
+
+    def read(self, key: str) -> bytes:
+        return s3_service.download_object(key)
+
+    def object_url(self, key: str) -> str:
+        return s3_service.object_url(key)
+
+    def key_from_url(self, file_url: str) -> str:
+        return s3_service.key_from_url(file_url)
+
+    def create_presigned_upload(self, filename: str, content_type: str, max_bytes: int, expires_in: int, owner_id: int) -> dict:
+        return s3_service.create_presigned_upload(filename, content_type, max_bytes, expires_in, owner_id)
+
+
+# 로컬 디스크 저장소 (온프레미스 배포 / 외부 의존성 없는 테스트·벤치마크용)
+# root 아래 uploads/ 디렉터리에 저장하고 local_storage_base_url 로 서빙
+class LocalStorage(StorageBackend):
+    def __init__(self, root: str, base_url: str):
+        self.root = Path(root).resolve()
+        self.base_url = base_url.rstrip("/")
+        self.upload_dir = self.root / "uploads"
+
+    # 키를 실제 경로로 변환 (uploads/ 밖으로 벗어나는 키는 거부)
+    def path_for(self, key: str) -> Path:
+        path = (self.root / key).resolve()
+        if self.upload_dir not in path.parents:
+            raise ValueError("잘못된 파일 키입니다.")
+        return path
+
+    def key_from_url(self, file_url: str) -> str:
+        prefix = f"{self.base_url}/"
+        if not file_url.startswith(prefix):
+            raise ValueError("잘못된 파일 URL입니다.")
+        return file_url[len(prefix):]
+
+    def upload(self, file_obj, filename: str, key: Optional[str] = None) -> str:
+        key = key or s3_service.build_object_key(filename)
+        try:
+            path = self.path_for(key)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # 임시 파일에 쓴 뒤 rename 해서 반쯤 쓰인 파일이 서빙되지 않도록 함
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=".upload-")
+            try:
+                with os.fdopen(fd, "wb") as out:
+                    shutil.copyfileobj(file_obj, out, 1024 * 1024)
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except (OSError, ValueError) as e:
+            raise RuntimeError(f"로컬 파일 저장 실패: {str(e)}")
+        return self.object_url(key)
+
+    def delete(self, file_url: str) -> None:
+        try:
+            self.path_for(self.key_from_url(file_url)).unlink()
+        except (OSError, ValueError) as e:
+            raise RuntimeError(f"로컬 파일 삭제 실패: {str(e)}")
+
+    def head(self, key: str) -> dict:
+        try:
+            stat = self.path_for(key).stat()
+        except (OSError, ValueError) as e:
+            raise RuntimeError(f"로컬 파일 조회 실패: {str(e)}")
+        return {"size": stat.st_size, "contentType": mimetypes.guess_type(key)[0]}
+
+    def read(self, key: str) -> bytes:
+        try:
+            return self.path_for(key).read_bytes()
+        except (OSError, ValueError) as e:
+            raise RuntimeError(f"로컬 파일 읽기 실패: {str(e)}")
+
+    def object_url(self, key: str) -> str:
+        return f"{self.base_url}/{key}"
+
+
+# 설정에 따른 저장소 구현체 (최초 호출 시 한 번만 생성)
+@lru_cache(maxsize=1)
+def get_storage() -> StorageBackend:
+    if settings.storage_backend == "local":
+        return LocalStorage(settings.local_storage_root, settings.local_storage_base_url)
+    if settings.storage_backend == "s3":
+        return S3Storage()
+    raise ValueError(f"지원하지 않는 저장소입니다: {settings.storage_backend}")
@@ -0,0 +1,167 @@
+import json
+from collections import OrderedDict
+from functools import lru_cache
+from threading import Lock
+from time import monotonic
+from typing import Optional
+
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from config.settings import settings
+from models.files import Files, FileVariants
+from models.users import User
+
+
+# 프로세스 내 TTL + LRU 캐시
+# - 최대 항목 수를 넘으면 가장 오래 사용하지 않은 항목부터 제거
+# - 만료된 항목은 조회 시 제거
+class MemoryCache:
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.evictions = 0
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = Lock()
+
+    async def get(self, key: str) -> Optional[dict]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if monotonic() > entry[0]:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    async def set(self, key: str, value: dict) -> None:
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    async def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def size(self) -> int:
+        return len(self._entries)
+
+
+# Redis 공유 캐시 (여러 워커/인스턴스가 같은 항목을 보고, 수정 시 무효화도 모두에 반영)
+# 크기 제한은 Redis 의 maxmemory/eviction 정책으로 관리
+class RedisCache:
+    def __init__(self, url: str, ttl: int, prefix: str = "movein:"):
+        try:
+            from redis import asyncio as redis_asyncio
+        except ImportError:
+            raise RuntimeError("USER_CACHE_BACKEND=redis 를 사용하려면 redis 패키지를 설치해야 합니다.")
+        self.client = redis_asyncio.from_url(url)
+        self.ttl = ttl
+        self.prefix = prefix
+        self.evictions = 0
+
+    async def get(self, key: str) -> Optional[dict]:
+        value = await self.client.get(self.prefix + key)
+        return json.loads(value) if value is not None else None
+
+    async def set(self, key: str, value: dict) -> None:
+        await self.client.set(self.prefix + key, json.dumps(value, ensure_ascii=False), ex=self.ttl)
+
+    async def delete(self, key: str) -> None:
+        await self.client.delete(self.prefix + key)
+
+    def size(self) -> int:
+        return 0
+
+
+# 캐시 조회 통계를 함께 기록하는 래퍼
+class CacheStats:
+    def __init__(self, backend):
+        self.backend = backend
+        self.hits = 0
+        self.misses = 0
+
+    async def get(self, key: str) -> Optional[dict]:
+        value = await self.backend.get(key)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    async def set(self, key: str, value: dict) -> None:
+        await self.backend.set(key, value)
+
+    async def delete(self, key: str) -> None:
+        await self.backend.delete(key)
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "backend": type(self.backend).__name__,
+            "size": self.backend.size(),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.backend.evictions,
+            "hit_ratio": self.hits / total if total else 0.0,
+        }
+
+
+# 설정에 따른 캐시 (최초 호출 시 한 번만 생성)
+@lru_cache(maxsize=1)
+def get_user_cache() -> CacheStats:
+    if settings.user_cache_backend == "redis":
+        if not settings.redis_url:
+            raise ValueError("USER_CACHE_BACKEND=redis 에는 REDIS_URL 이 필요합니다.")
+        return CacheStats(RedisCache(settings.redis_url, settings.user_cache_ttl))
+    if settings.user_cache_backend == "memory":
+        return CacheStats(MemoryCache(settings.user_cache_size, settings.user_cache_ttl))
+    raise ValueError(f"지원하지 않는 캐시입니다: {settings.user_cache_backend}")
+
+
+def _profile_key(user_id) -> str:
+    return f"user:{int(user_id)}"
+
+
+# DB 에서 사용자 + 프로필 이미지(원본/썸네일) 조회 (캐시 값과 같은 JSON 호환 dict)
+async def _load_profile(session: AsyncSession, user_id: int) -> Optional[dict]:
+    user = await session.get(User, user_id)
+    if not user:
+        return None
+
+    file = (await session.exec(select(Files).where(Files.userId == user.id))).first()
+    variants = []
+    if file:
+        variants = (await session.exec(select(FileVariants).where(FileVariants.fileSeq == file.fileSeq))).all()
+
+    return {
+        "id": user.id,
+        "email": user.email,
+        "username": user.username,
+        "role": user.role,
+        "profile_image_url": file.fileUrl if file else None,
+        "profile_image_variants": {str(variant.size): variant.fileUrl for variant in variants},
+    }
+
+
+# 사용자 프로필 조회 (캐시에 없을 때만 DB 조회, 없는 사용자는 캐시하지 않음)
+async def get_user_profile(session: AsyncSession, user_id) -> Optional[dict]:
+    cache = get_user_cache()
+    key = _profile_key(user_id)
+    profile = await cache.get(key)
+    if profile is None:
+        profile = await _load_profile(session, int(user_id))
+        if profile is not None:
+            await cache.set(key, profile)
+    return profile
+
+
+# 사용자/프로필 이미지가 바뀐 뒤 호출 (commit 이후에 호출해야 이전 값이 다시 캐시되지 않음)
+async def invalidate_user(user_id) -> None:
+    await get_user_cache().delete(_profile_key(user_id))
@@ -0,0 +1,45 @@
+# 목록/검색 쿼리 실행 계획 테스트
+# bench.movein_explain 의 시나리오를 임시 SQLite DB 에 넣고 EXPLAIN QUERY PLAN 에 기대한 인덱스가 나오는지 확인
+#
+#   python -m pytest tests/test_movein_explain.py
+import os
+import tempfile
+
+# 설정/엔진이 만들어지기 전에 테스트 전용 DB 지정 (DATABASE_URL 이 설정된 환경에서도 실제 DB 를 쓰지 않도록 덮어씀)
+_db_dir = tempfile.mkdtemp(prefix="movein-test-")
+os.environ["DATABASE_URL"] = f"sqlite:///{_db_dir}/test.db"
+os.environ.pop("ASYNC_DATABASE_URL", None)
+
+import pytest
+
+from bench import movein_explain as bench
+
+ROWS = 5000
+USERS = 200
+
+
+# MySQL 전용 시나리오는 건너뛴 이유와 함께 skip 으로 표시
+def _params() -> list:
+    params = []
+    for name, query, index, *dialects in bench.scenarios(ROWS):
+        skip = pytest.mark.skipif(
+            bool(dialects) and bench.engine.dialect.name not in dialects,
+            reason=f"{', '.join(dialects)} 에서만 확인 (SQLite 는 NOCASE 정렬이 아닌 컬럼의 접두어 LIKE 에 인덱스를 쓰지 않음)",
+        )
+        params.append(pytest.param(query, index, id=name, marks=skip))
+    return params
+
+
+@pytest.fixture(scope="module")
+def conn():
+    bench.install_explain_hook()
+    bench.upgrade_schema()
+    bench.seed(ROWS, USERS)
+    with bench.engine.connect() as conn:
+        yield conn
+
+
+@pytest.mark.parametrize("query, index", _params())
+def test_query_uses_index(conn, query, index):
+    plan = bench.explain(conn, query)
+    assert index in plan, plan